@@ -0,0 +1,166 @@
+from typing import Any
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed, InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from backend.settings import AUTH_USER_CACHE_TIMEOUT
+
+
+class CachedUser():
+    """
+    Пользователь, восстановленный из кеша CachedJWTAuthentication.
+
+    В кеше хранятся только данные для аутентификации и проверки прав
+    (без хеша пароля и персональных данных), поэтому экземпляр
+    не является моделью: в запросах к базе данных используется id.
+    """
+
+    is_anonymous: bool = False
+    is_authenticated: bool = True
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.id: Any = data['id']
+        self.pk: Any = data['id']
+        self.is_active: bool = data['is_active']
+        self.is_staff: bool = data['is_staff']
+        self.is_superuser: bool = data['is_superuser']
+        # INFO: значение утверждения REVOKE_TOKEN_CLAIM токена.
+        self.password_hash: str = data['password_hash']
+
+    @classmethod
+    def get_cache_data(cls, user) -> dict[str, Any]:
+        """Возвращает данные пользователя user для хранения в кеше."""
+        return {
+            'id': getattr(user, api_settings.USER_ID_FIELD),
+            'is_active': user.is_active,
+            'is_staff': user.is_staff,
+            'is_superuser': user.is_superuser,
+            'password_hash': get_md5_hash_password(user.password),
+        }
+
+    def __str__(self) -> str:
+        return f'CachedUser {self.id}'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CachedUser) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+def get_user_cache_key(user_id: Any) -> str:
+    """Возвращает ключ кеша пользователя по его идентификатору из токена."""
+    return f'auth:user:{user_id}'
+
+
+def invalidate_user_cache(user) -> None:
+    """Удаляет пользователя из кеша CachedJWTAuthentication."""
+    cache.delete(
+        get_user_cache_key(getattr(user, api_settings.USER_ID_FIELD)),
+    )
+    return
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Аутентификация по JWT, которая получает пользователя из кеша
+    Django вместо запроса к базе данных на каждый запрос.
+
+    В кеше хранятся только данные CachedUser активных пользователей,
+    которые и возвращаются как пользователь запроса. Запись удаляется
+    при сохранении или удалении пользователя (api.signals), а время
+    хранения ограничено AUTH_USER_CACHE_TIMEOUT. Проверка подписи
+    и срока действия токена (SIMPLE_JWT) не изменяется.
+    """
+
+    def get_user_id(self, validated_token):
+        """Возвращает идентификатор пользователя из токена."""
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification'),
+            )
+
+    def check_revoked(self, validated_token, user: CachedUser) -> None:
+        """Проверяет, что токен не отозван сменой пароля пользователя."""
+        if api_settings.CHECK_REVOKE_TOKEN and (
+            validated_token.get(api_settings.REVOKE_TOKEN_CLAIM)
+            != user.password_hash
+        ):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."),
+                code='password_changed',
+            )
+        return
+
+    def get_user(self, validated_token) -> CachedUser:
+        key: str = get_user_cache_key(self.get_user_id(validated_token))
+        data: dict[str, Any] | None = cache.get(key)
+        if data is None:
+            data = CachedUser.get_cache_data(
+                user=super().get_user(validated_token),
+            )
+            cache.set(key, data, AUTH_USER_CACHE_TIMEOUT)
+            return CachedUser(data=data)
+        user = CachedUser(data=data)
+        self.check_revoked(validated_token=validated_token, user=user)
+        return user
+
+    async def aget_user(self, validated_token) -> CachedUser:
+        """Асинхронная версия get_user."""
+        user_id = self.get_user_id(validated_token)
+        key: str = get_user_cache_key(user_id)
+        data: dict[str, Any] | None = await cache.aget(key)
+        if data is None:
+            try:
+                user = await self.user_model.objects.aget(
+                    **{api_settings.USER_ID_FIELD: user_id},
+                )
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(
+                    _('User not found'),
+                    code='user_not_found',
+                )
+            if not user.is_active:
+                raise AuthenticationFailed(
+                    _('User is inactive'),
+                    code='user_inactive',
+                )
+            data = CachedUser.get_cache_data(user=user)
+            await cache.aset(key, data, AUTH_USER_CACHE_TIMEOUT)
+        user = CachedUser(data=data)
+        self.check_revoked(validated_token=validated_token, user=user)
+        return user
+
+    async def aauthenticate(self, request):
+        """
+        Асинхронная версия authenticate для асинхронных
+        представлений Django (api.v1.async_views).
+        """
+        header: bytes | None = self.get_header(request)
+        if header is None:
+            return None
+        raw_token: bytes | None = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """
+    Схема OpenAPI (jwtAuth) для CachedJWTAuthentication.
+
+    drf-spectacular сопоставляет расширения с классом аутентификации
+    по точному пути, поэтому схема SimpleJWT не применяется к подклассу.
+    """
+
+    target_class = 'api.authentication.CachedJWTAuthentication'
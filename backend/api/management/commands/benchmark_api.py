@@ -0,0 +1,151 @@
+from concurrent.futures import ThreadPoolExecutor
+from statistics import quantiles
+import time
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandParser
+
+# INFO: эндпоинты, которые обслуживаются асинхронными представлениями.
+#       Списки каталога после первого запроса отдаются из кеша, поэтому
+#       при заданном --token добавляется корзина, каждый запрос к которой
+#       читает базу данных (токен передается только ей: запросы каталога
+#       с заголовком Authorization асинхронные представления не обрабатывают).
+BENCHMARK_DEFAULT_PATHS: tuple[str, ...] = (
+    '/api/v1/categories/',
+    '/api/v1/goods/',
+    '/api/v1/subcategories/',
+)
+BENCHMARK_DEFAULT_AUTH_PATHS: tuple[str, ...] = (
+    '/api/v1/shopping-cart/',
+)
+
+
+class Command(BaseCommand):
+    """
+    Сравнивает пропускную способность запущенных серверов WSGI и ASGI
+    при одинаковом количестве одновременных запросов.
+
+    Пример запуска серверов с одним рабочим процессом:
+        gunicorn --bind 127.0.0.1:8001 --workers 1 backend.wsgi
+        API_ASYNC_VIEWS=True gunicorn --bind 127.0.0.1:8002 --workers 1 \\
+            --worker-class uvicorn.workers.UvicornWorker backend.asgi
+        python manage.py benchmark_api \\
+            --server wsgi=http://127.0.0.1:8001 \\
+            --server asgi=http://127.0.0.1:8002
+    """
+
+    help = 'Сравнивает пропускную способность серверов WSGI и ASGI.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--server',
+            action='append',
+            required=True,
+            help='Сервер в виде <название>=<адрес>, например wsgi=http://...',
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            help=(
+                'Путь запроса (по умолчанию - списки каталога '
+                'и корзина, если задан --token).'
+            ),
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=1000,
+            help='Количество запросов к каждому серверу.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=50,
+            help='Количество одновременных запросов.',
+        )
+        parser.add_argument(
+            '--token',
+            help='Токен доступа JWT (для эндпоинтов корзины).',
+        )
+        return
+
+    def handle(self, *args, **options) -> None:
+        token: str | None = options['token']
+        if options['path']:
+            paths: list[tuple[str, str | None]] = [
+                (path, token) for path in options['path']
+            ]
+        else:
+            paths = [(path, None) for path in BENCHMARK_DEFAULT_PATHS]
+            if token:
+                paths += [
+                    (path, token) for path in BENCHMARK_DEFAULT_AUTH_PATHS
+                ]
+            else:
+                self.stdout.write(
+                    'Токен доступа не задан (--token): запросы только '
+                    'к кешируемым спискам каталога.'
+                )
+        self.stdout.write(
+            f'{"server":<10}{"rps":>10}{"p50, ms":>10}'
+            f'{"p95, ms":>10}{"p99, ms":>10}{"errors":>8}'
+        )
+        for server in options['server']:
+            name, _, url = server.partition('=')
+            self.run_server(
+                name=name,
+                urls=[
+                    (f'{url.rstrip("/")}{path}', path_token)
+                    for path, path_token in paths
+                ],
+                requests=options['requests'],
+                concurrency=options['concurrency'],
+            )
+        return
+
+    def run_server(
+        self,
+        name: str,
+        urls: list[tuple[str, str | None]],
+        requests: int,
+        concurrency: int,
+    ) -> None:
+        """
+        Выполняет запросы к серверу и выводит результаты.
+
+        urls - адреса запросов с токеном доступа (или None).
+        """
+
+        def send_request(num: int) -> float | None:
+            url, token = urls[num % len(urls)]
+            headers: dict[str, str] = {'Accept': 'application/json'}
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+            request = Request(url=url, headers=headers)
+            start: float = time.perf_counter()
+            try:
+                with urlopen(request, timeout=30) as response:
+                    response.read()
+            except (HTTPError, URLError, OSError):
+                return None
+            return time.perf_counter() - start
+
+        start: float = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            timings: list[float | None] = list(
+                executor.map(send_request, range(requests)),
+            )
+        elapsed: float = time.perf_counter() - start
+        durations: list[float] = sorted(t * 1000 for t in timings if t)
+        errors: int = len(timings) - len(durations)
+        if len(durations) < 2:
+            self.stdout.write(f'{name:<10}{"-":>10}{"-":>30}{errors:>8}')
+            return
+        percentiles: list[float] = quantiles(durations, n=100)
+        self.stdout.write(
+            f'{name:<10}{len(durations) / elapsed:>10.1f}'
+            f'{percentiles[49]:>10.1f}{percentiles[94]:>10.1f}'
+            f'{percentiles[98]:>10.1f}{errors:>8}'
+        )
+        return
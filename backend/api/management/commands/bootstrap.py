@@ -0,0 +1,133 @@
+from hashlib import md5
+import os
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles.finders import get_finders
+from django.core.management import call_command
+from django.core.management.base import (
+    BaseCommand, CommandError, CommandParser,
+)
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.db.migrations.executor import MigrationExecutor
+
+from backend.settings import STATIC_ROOT
+
+# INFO: файл с хешем собранной статики в STATIC_ROOT.
+STATIC_HASH_FILE_NAME: str = '.static.md5'
+
+BOOTSTRAP_DATABASE_TIMEOUT: float = 60.0
+BOOTSTRAP_DATABASE_DELAY_MIN: float = 0.1
+BOOTSTRAP_DATABASE_DELAY_MAX: float = 5.0
+
+
+class Command(BaseCommand):
+    """
+    Подготавливает контейнер к запуску сервера одним процессом,
+    пропуская уже выполненные шаги:
+        - ожидание доступности базы данных (с увеличением интервала)
+        - применение миграций (только при наличии непримененных)
+        - сбор статики (только при изменении ее содержимого)
+        - создание суперпользователя (только при его отсутствии)
+    """
+
+    help = 'Подготавливает базу данных, статику и суперпользователя.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--database-timeout',
+            type=float,
+            default=BOOTSTRAP_DATABASE_TIMEOUT,
+            help='Время ожидания доступности базы данных (в секундах).',
+        )
+        return
+
+    def handle(self, *args, **options) -> None:
+        self.wait_for_database(timeout=options['database_timeout'])
+        self.migrate()
+        self.collect_static()
+        self.create_superuser()
+        return
+
+    def wait_for_database(self, timeout: float) -> None:
+        """Ожидает доступности базы данных."""
+        connection = connections[DEFAULT_DB_ALIAS]
+        deadline: float = time.monotonic() + timeout
+        delay: float = BOOTSTRAP_DATABASE_DELAY_MIN
+        while True:
+            try:
+                connection.ensure_connection()
+                return
+            except OperationalError as error:
+                if time.monotonic() + delay > deadline:
+                    raise CommandError(
+                        f'База данных недоступна: {error}'
+                    )
+                self.stdout.write(
+                    f'База данных недоступна, ждем {delay:.1f} с...'
+                )
+                time.sleep(delay)
+                delay = min(delay * 2, BOOTSTRAP_DATABASE_DELAY_MAX)
+
+    def migrate(self) -> None:
+        """Применяет миграции, если есть непримененные."""
+        connection = connections[DEFAULT_DB_ALIAS]
+        executor = MigrationExecutor(connection)
+        plan = executor.migration_plan(
+            executor.loader.graph.leaf_nodes(),
+        )
+        if not plan:
+            self.stdout.write('Миграции уже применены.')
+            return
+        call_command('migrate', interactive=False, verbosity=1)
+        return
+
+    def get_static_hash(self) -> str:
+        """Возвращает хеш путей и содержимого всех файлов статики."""
+        static_hash = md5(usedforsecurity=False)
+        files: list[tuple[str, str]] = []
+        for finder in get_finders():
+            for path, storage in finder.list([]):
+                files.append((path, storage.path(path)))
+        for path, full_path in sorted(files):
+            static_hash.update(path.encode())
+            with open(full_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(64 * 1024), b''):
+                    static_hash.update(chunk)
+        return static_hash.hexdigest()
+
+    def collect_static(self) -> None:
+        """Собирает статику, если ее содержимое изменилось."""
+        hash_path: str = os.path.join(STATIC_ROOT, STATIC_HASH_FILE_NAME)
+        static_hash: str = self.get_static_hash()
+        try:
+            with open(hash_path) as file:
+                if file.read() == static_hash:
+                    self.stdout.write('Статика не изменилась.')
+                    return
+        except OSError:
+            pass
+        call_command('collectstatic', interactive=False, verbosity=0)
+        os.makedirs(STATIC_ROOT, exist_ok=True)
+        with open(hash_path, 'w') as file:
+            file.write(static_hash)
+        self.stdout.write('Статика собрана.')
+        return
+
+    def create_superuser(self) -> None:
+        """Создает суперпользователя, если его нет."""
+        username: str = os.getenv('DJANGO_SUPERUSER_USERNAME', 'admin')
+        User = get_user_model()
+        if User.objects.filter(username=username).exists():
+            self.stdout.write(f"Пользователь '{username}' уже существует")
+            return
+        User.objects.create_superuser(
+            username=username,
+            email=os.getenv('DJANGO_SUPERUSER_EMAIL', 'admin@email.com'),
+            password=os.getenv('DJANGO_SUPERUSER_PASSWORD', 'admin'),
+        )
+        self.stdout.write(
+            f"Создан пользователь '{username}' "
+            '(пароль задается DJANGO_SUPERUSER_PASSWORD).'
+        )
+        return
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+import os
+
+from django.apps import apps
+from django.core.files.storage import Storage, default_storage
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import FileField
+from django.utils import timezone
+
+from backend.settings import (
+    MEDIA_GC_GRACE_PERIOD, MEDIA_GC_PATHS, MEDIA_RESIZE_PATH,
+)
+
+
+class Command(BaseCommand):
+    """
+    Удаляет из MEDIA_GC_PATHS файлы, на которые не ссылается ни одно
+    файловое поле моделей (например, замененные изображения), если они
+    не изменялись дольше --grace-period секунд, а из MEDIA_RESIZE_PATH -
+    уменьшенные копии удаленных файлов.
+    """
+
+    help = 'Удаляет неиспользуемые загруженные файлы.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--grace-period',
+            type=int,
+            default=MEDIA_GC_GRACE_PERIOD,
+            help='Минимальное время с изменения файла (в секундах).',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только вывести количество неиспользуемых файлов.',
+        )
+        return
+
+    def handle(self, *args, **options) -> None:
+        referenced: set[str] = self.get_referenced_files()
+        deadline: datetime = timezone.now() - timedelta(
+            seconds=options['grace_period'],
+        )
+        garbage: list[str] = []
+        for path in MEDIA_GC_PATHS:
+            garbage += [
+                name
+                for name in self.list_files(storage=default_storage, path=path)
+                if name not in referenced
+                and default_storage.get_modified_time(name) <= deadline
+            ]
+        deleted: set[str] = set(garbage)
+        for name in self.list_files(
+            storage=default_storage,
+            path=MEDIA_RESIZE_PATH,
+        ):
+            # INFO: r/<размер>/<исходный файл><расширение формата>.
+            source: str = os.path.splitext(name.split('/', 2)[2])[0]
+            if source in deleted or not default_storage.exists(source):
+                garbage.append(name)
+        size: int = 0
+        for name in garbage:
+            size += default_storage.size(name)
+            if not options['dry_run']:
+                default_storage.delete(name)
+        action: str = (
+            'Неиспользуемых файлов' if options['dry_run'] else 'Удалено файлов'
+        )
+        self.stdout.write(f'{action}: {len(garbage)} ({size} байт).')
+        return
+
+    def get_referenced_files(self) -> set[str]:
+        """Возвращает имена файлов, на которые ссылаются модели."""
+        referenced: set[str] = set()
+        for model in apps.get_models():
+            fields: list[str] = [
+                field.attname for field in model._meta.concrete_fields
+                if isinstance(field, FileField)
+            ]
+            if not fields:
+                continue
+            for row in model._default_manager.values_list(*fields):
+                referenced.update(name for name in row if name)
+        return referenced
+
+    def list_files(self, storage: Storage, path: str) -> list[str]:
+        """Возвращает имена всех файлов папки path (с вложенными)."""
+        if not storage.exists(path):
+            return []
+        directories, files = storage.listdir(path)
+        names: list[str] = [f'{path}{file}' for file in files]
+        for directory in directories:
+            names += self.list_files(
+                storage=storage,
+                path=f'{path}{directory}/',
+            )
+        return names
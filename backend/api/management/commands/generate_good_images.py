@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from goods.images import generate_good_images
+from goods.models import Good
+
+
+class Command(BaseCommand):
+    """
+    Формирует изображения L, M, S товаров из исходных изображений
+    в текущем процессе (например, после изменения GOOD_IMAGE_SIZES
+    или для товаров, созданных до появления исходных изображений).
+
+    С параметром --pending формирует изображения товаров, задачи
+    которых не выполнил фоновый поток воркера (например, из-за его
+    перезапуска): команду следует запускать периодически.
+    """
+
+    help = 'Формирует изображения L, M, S товаров из исходных изображений.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            'good_ids',
+            nargs='*',
+            type=int,
+            help='ID товаров (по умолчанию - все товары).',
+        )
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Только товары без сформированных изображений.',
+        )
+        parser.add_argument(
+            '--pending',
+            action='store_true',
+            help='Только товары, изображения которых ожидают формирования.',
+        )
+        return
+
+    def handle(self, *args, **options) -> None:
+        if options['pending']:
+            # INFO: в том числе товары с удаленным исходным изображением.
+            queryset = Good.objects.filter(image_pending=True)
+        else:
+            queryset = Good.objects.exclude(image='').exclude(
+                image__isnull=True,
+            )
+        if options['good_ids']:
+            queryset = queryset.filter(pk__in=options['good_ids'])
+        if options['missing']:
+            queryset = queryset.filter(image_small_size__isnull=True)
+        good_ids: list[int] = list(queryset.values_list('pk', flat=True))
+        for good_id in good_ids:
+            generate_good_images(good_id=good_id)
+        self.stdout.write(f'Обработано товаров: {len(good_ids)}.')
+        return
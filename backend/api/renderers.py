@@ -0,0 +1,46 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Рендерер JSON на основе orjson.
+
+    Формирует те же байты, что и JSONRenderer DRF (компактный вывод
+    без экранирования не-ASCII символов), но в несколько раз быстрее.
+    Если orjson не установлен, либо запрошен вывод с отступами или
+    с экранированием, используется стандартный JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(
+                data, accepted_media_type, renderer_context,
+            )
+        ret: bytes = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            # INFO: даты и время сериализуются кодировщиком DRF,
+            #       так как их формат отличается от формата orjson.
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # INFO: как и JSONRenderer, экранируем U+2028 и U+2029, чтобы
+        #       ответ оставался корректным подмножеством JavaScript.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(
+                b'\xe2\x80\xa8', b'\\u2028',
+            ).replace(
+                b'\xe2\x80\xa9', b'\\u2029',
+            )
+        return ret
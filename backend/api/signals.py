@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.authentication import invalidate_user_cache
+
+User = get_user_model()
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, **kwargs) -> None:
+    """
+    Удаляет пользователя из кеша аутентификации при его изменении
+    (в том числе деактивации) или удалении.
+
+    Кеш очищается сразу и повторно после фиксации транзакции,
+    чтобы в нем не осталась прочитанная до фиксации версия.
+    """
+    invalidate_user_cache(instance)
+    transaction.on_commit(lambda: invalidate_user_cache(instance))
+    return
@@ -0,0 +1,21 @@
+from django.urls import path
+
+from api.v1.async_views import (
+    AsyncCategoryView, AsyncGoodView, AsyncShoppingCartView,
+    AsyncSubcategoryView,
+)
+
+# INFO: асинхронные представления подключаются перед маршрутами DefaultRouter
+#       и обслуживают те же адреса (см. API_ASYNC_VIEWS).
+urlpatterns_async = [
+    path('categories/', AsyncCategoryView.as_view()),
+    path('categories/<int:pk>/', AsyncCategoryView.as_view(detail=True)),
+    path('goods/', AsyncGoodView.as_view()),
+    path('goods/<int:pk>/', AsyncGoodView.as_view(detail=True)),
+    path('shopping-cart/', AsyncShoppingCartView.as_view()),
+    path('subcategories/', AsyncSubcategoryView.as_view()),
+    path(
+        'subcategories/<int:pk>/',
+        AsyncSubcategoryView.as_view(detail=True),
+    ),
+]
@@ -0,0 +1,336 @@
+from abc import ABC, abstractmethod
+import asyncio
+from functools import cache as memoize
+from math import ceil
+import time
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.viewsets import ModelViewSet
+
+from api.authentication import CachedJWTAuthentication
+from api.renderers import ORJSONRenderer
+from api.v1.caches import (
+    get_catalog_cache_key, get_catalog_etag, get_request_hash,
+    is_not_modified, set_catalog_headers,
+)
+from api.v1.fast_serializers import (
+    CategoryFastSerializer, FastSerializer, GoodFastSerializer,
+    ShoppingCartFastSerializer, SubcategoryFastSerializer,
+)
+from api.v1.views import (
+    CategoryViewSet, GoodViewSet, ShoppingCartViewSet, SubcategoryViewSet,
+)
+from backend.routers import ause_catalog_replica
+from backend.settings import (
+    BROWSABLE_API, CATALOG_CACHE_LOCK_POLL_INTERVAL,
+    CATALOG_CACHE_LOCK_TIMEOUT, CATALOG_CACHE_TIMEOUT,
+    CATALOG_FAST_SERIALIZATION,
+)
+from goods.models import Category, Good, ShoppingCart, Subcategory
+from goods.signals import aget_catalog_version
+
+# INFO: соответствие методов HTTP действиям вью-сетов, как в DefaultRouter.
+VIEWSET_LIST_ACTIONS: dict[str, str] = {
+    'get': 'list',
+    'post': 'create',
+}
+VIEWSET_DETAIL_ACTIONS: dict[str, str] = {
+    'get': 'retrieve',
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+}
+
+
+@memoize
+def get_viewset_view(viewset: type[ModelViewSet], detail: bool) -> Callable:
+    """Возвращает синхронное представление вью-сета (как DefaultRouter)."""
+    return viewset.as_view(
+        VIEWSET_DETAIL_ACTIONS if detail else VIEWSET_LIST_ACTIONS,
+    )
+
+
+def render_response(
+    data: dict[str, any],
+    status_code: int = status.HTTP_200_OK,
+) -> HttpResponse:
+    """Возвращает JSON ответ с теми же байтами, что и ответ DRF."""
+    return HttpResponse(
+        content=ORJSONRenderer().render(data),
+        content_type=ORJSONRenderer.media_type,
+        status=status_code,
+    )
+
+
+class AsyncAPIView(ABC, View):
+    """
+    Базовое асинхронное представление Django для сервера ASGI.
+
+    GET запросы обрабатываются методом get() с помощью асинхронного
+    ORM без DRF. Остальные запросы, а также GET запросы, которые
+    представление не обрабатывает (get() вернул None), передаются
+    синхронному вью-сету viewset, поэтому ответы всегда совпадают
+    с ответами синхронного API.
+    """
+
+    viewset: type[ModelViewSet] | None = None
+    detail: bool = False
+    # INFO: GET запросы с другими параметрами передаются вью-сету.
+    allowed_query_params: tuple[str, ...] = ()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # INFO: как и представления DRF, не использует CSRF,
+        #       так как аутентификация выполняется по JWT.
+        #       Асинхронные представления не могут выполняться
+        #       в транзакции ATOMIC_REQUESTS: изменения корзины
+        #       выполняются в собственной транзакции (api.v1.locks).
+        return csrf_exempt(
+            transaction.non_atomic_requests(super().as_view(**initkwargs)),
+        )
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method == 'GET' and self.can_handle(request):
+            response: HttpResponse | None = await self.get(
+                request, *args, **kwargs,
+            )
+            if response is not None:
+                return response
+        return await sync_to_async(
+            get_viewset_view(viewset=self.viewset, detail=self.detail),
+        )(request, *args, **kwargs)
+
+    def can_handle(self, request) -> bool:
+        """Проверяет, может ли get() обработать запрос."""
+        if BROWSABLE_API and 'text/html' in request.headers.get('Accept', ''):
+            return False
+        return set(request.GET).issubset(self.allowed_query_params)
+
+    @abstractmethod
+    async def get(self, request, *args, **kwargs) -> HttpResponse | None:
+        """
+        Возвращает ответ на GET запрос или None, чтобы передать
+        запрос вью-сету.
+        """
+
+
+class AsyncCatalogView(AsyncAPIView):
+    """
+    Асинхронное представление списка и объекта каталога.
+
+    Использует те же кеш, ETag и Last-Modified, что и CatalogCacheMixin
+    (ключи кеша совпадают с ключами синхронных вью-сетов), данные
+    читаются из реплик (как CatalogReplicaMixin) и формируются
+    упрощенными сериализаторами fast_serializer_class.
+    """
+
+    basename: str = ''
+    model: type[Model] | None = None
+    fast_serializer_class: type[FastSerializer] | None = None
+
+    def can_handle(self, request) -> bool:
+        # INFO: запросы с заголовком Authorization передаются вью-сету,
+        #       так как неверный токен должен приводить к ответу 401.
+        return (
+            CATALOG_FAST_SERIALIZATION
+            and 'HTTP_AUTHORIZATION' not in request.META
+            and super().can_handle(request)
+        )
+
+    @property
+    def allowed_query_params(self) -> tuple[str, ...]:
+        return () if self.detail else ('page',)
+
+    async def get(self, request, pk: int | None = None):
+        version: float = await aget_catalog_version()
+        request_hash: str = get_request_hash(
+            basename=self.basename,
+            action='retrieve' if self.detail else 'list',
+            renderer_format=ORJSONRenderer.format,
+            request=request,
+        )
+        etag: str = get_catalog_etag(
+            version=version,
+            request_hash=request_hash,
+        )
+        if is_not_modified(request=request, etag=etag, version=version):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            async with ause_catalog_replica():
+                data: dict[str, any] | None = await self.get_cached_data(
+                    key=get_catalog_cache_key(
+                        version=version,
+                        request_hash=request_hash,
+                    ),
+                    request=request,
+                    pk=pk,
+                )
+            if data is None:
+                return None
+            response = render_response(data=data)
+        set_catalog_headers(response=response, etag=etag, version=version)
+        return response
+
+    async def get_cached_data(
+        self,
+        key: str,
+        request,
+        pk: int | None,
+    ) -> dict[str, any] | None:
+        """
+        Возвращает данные ответа из кеша по ключу key или вычисляет
+        и сохраняет их в кеш (аналог CatalogCacheMixin.get_data_response).
+        """
+        data: dict[str, any] | None = await cache.aget(key)
+        if data is not None:
+            return data
+        lock_key: str = f'{key}:lock'
+        if not await cache.aadd(lock_key, True, CATALOG_CACHE_LOCK_TIMEOUT):
+            deadline: float = time.monotonic() + CATALOG_CACHE_LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(CATALOG_CACHE_LOCK_POLL_INTERVAL)
+                data = await cache.aget(key)
+                if data is not None:
+                    return data
+            return await self.get_data(request=request, pk=pk)
+        try:
+            data = await self.get_data(request=request, pk=pk)
+            if data is not None:
+                await cache.aset(key, data, CATALOG_CACHE_TIMEOUT)
+        finally:
+            await cache.adelete(lock_key)
+        return data
+
+    async def get_data(
+        self,
+        request,
+        pk: int | None,
+    ) -> dict[str, any] | None:
+        """
+        Возвращает данные объекта pk или страницы списка.
+        Для несуществующих объекта или страницы возвращает None.
+        """
+        serializer: FastSerializer = self.fast_serializer_class(
+            context={'request': request},
+        )
+        queryset: QuerySet = self.model.objects.values(*serializer.values)
+        if pk is None:
+            return await self.get_page_data(
+                request=request,
+                queryset=queryset,
+                serializer=serializer,
+            )
+        try:
+            row: dict[str, any] = await queryset.aget(pk=pk)
+        except self.model.DoesNotExist:
+            return None
+        return serializer.to_representation(row)
+
+    async def get_page_data(
+        self,
+        request,
+        queryset: QuerySet,
+        serializer: FastSerializer,
+    ) -> dict[str, any] | None:
+        """Возвращает страницу списка в формате PageNumberPagination."""
+        page_size: int = api_settings.PAGE_SIZE
+        try:
+            page_number: int = int(request.GET.get('page', 1))
+        except ValueError:
+            return None
+        count: int = await queryset.acount()
+        num_pages: int = max(ceil(count / page_size), 1)
+        if not 1 <= page_number <= num_pages:
+            return None
+        offset: int = (page_number - 1) * page_size
+        rows: list[dict[str, any]] = [
+            row async for row in queryset[offset:offset + page_size]
+        ]
+        url: str = request.build_absolute_uri()
+        if page_number == 1:
+            previous_url: str | None = None
+        elif page_number == 2:
+            previous_url = remove_query_param(url, 'page')
+        else:
+            previous_url = replace_query_param(url, 'page', page_number - 1)
+        return {
+            'count': count,
+            'next': (
+                replace_query_param(url, 'page', page_number + 1)
+                if page_number < num_pages else None
+            ),
+            'previous': previous_url,
+            'results': serializer.get_data(rows),
+        }
+
+
+class AsyncCategoryView(AsyncCatalogView):
+    """Асинхронная версия CategoryViewSet (list, retrieve)."""
+
+    viewset = CategoryViewSet
+    basename = 'categories'
+    model = Category
+    fast_serializer_class = CategoryFastSerializer
+
+
+class AsyncGoodView(AsyncCatalogView):
+    """Асинхронная версия GoodViewSet (list, retrieve)."""
+
+    viewset = GoodViewSet
+    basename = 'goods'
+    model = Good
+    fast_serializer_class = GoodFastSerializer
+
+
+class AsyncSubcategoryView(AsyncCatalogView):
+    """Асинхронная версия SubcategoryViewSet (list, retrieve)."""
+
+    viewset = SubcategoryViewSet
+    basename = 'subcategories'
+    model = Subcategory
+    fast_serializer_class = SubcategoryFastSerializer
+
+
+class AsyncShoppingCartView(AsyncAPIView):
+    """
+    Асинхронная версия ShoppingCartViewSet (list).
+
+    Изменения корзины выполняются синхронным вью-сетом, так как
+    требуют транзакции с блокировкой (api.v1.locks).
+    """
+
+    viewset = ShoppingCartViewSet
+    allowed_query_params = ('summary',)
+
+    async def get(self, request):
+        # INFO: запросы без пользователя или с неверным токеном
+        #       передаются вью-сету, который вернет ответ 401.
+        try:
+            result = await CachedJWTAuthentication().aauthenticate(request)
+        except APIException:
+            return None
+        if result is None:
+            return None
+        user, _ = result
+        queryset: QuerySet = ShoppingCart.objects.filter(user_id=user.id)
+        serializer = ShoppingCartFastSerializer(context={'request': request})
+        data: dict[str, any] = await queryset.aaggregate(
+            **serializer.get_totals(),
+        )
+        if request.GET.get('summary') in ('1', 'true', 'True'):
+            return render_response(data=data)
+        data['goods'] = serializer.get_data(
+            [row async for row in queryset.values(*serializer.values)],
+        )
+        return render_response(data=data)
@@ -0,0 +1,183 @@
+from hashlib import md5
+import time
+from typing import Callable
+
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.http import (
+    http_date, parse_etags, parse_http_date_safe, quote_etag,
+)
+from rest_framework import status
+from rest_framework.response import Response
+
+from backend.settings import (
+    CATALOG_CACHE_LOCK_POLL_INTERVAL, CATALOG_CACHE_LOCK_TIMEOUT,
+    CATALOG_CACHE_TIMEOUT,
+)
+from goods.signals import get_catalog_version
+
+
+def get_request_hash(
+    basename: str,
+    action: str,
+    renderer_format: str,
+    request,
+) -> str:
+    """
+    Возвращает хеш запроса: вью-сет, действие, формат ответа, схема,
+    хост и полный путь запроса с параметрами.
+
+    Схема и хост входят в хеш, так как ответы содержат абсолютные
+    ссылки (пагинация, изображения).
+    """
+    return md5(
+        f'{basename}:{action}:{renderer_format}:{request.scheme}://'
+        f'{request.get_host()}{request.get_full_path()}'.encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+
+
+def get_catalog_etag(version: float, request_hash: str) -> str:
+    """Возвращает ETag ответа каталога."""
+    return quote_etag(f'{version:.6f}-{request_hash}')
+
+
+def get_catalog_cache_key(version: float, request_hash: str) -> str:
+    """Возвращает ключ кеша данных ответа каталога."""
+    return f'catalog:{version}:{request_hash}'
+
+
+def is_not_modified(request, etag: str, version: float) -> bool:
+    """
+    Проверяет заголовки условного запроса If-None-Match
+    и If-Modified-Since (последний учитывается только
+    при отсутствии первого).
+    """
+    if_none_match: str | None = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match is not None:
+        etags: list[str] = parse_etags(if_none_match)
+        return etag in etags or '*' in etags
+    if_modified_since: int | None = parse_http_date_safe(
+        request.META.get('HTTP_IF_MODIFIED_SINCE'),
+    )
+    return (
+        if_modified_since is not None
+        and int(version) <= if_modified_since
+    )
+
+
+def set_catalog_headers(response, etag: str, version: float) -> None:
+    """Добавляет к ответу каталога заголовки ETag и Last-Modified."""
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(version)
+    patch_vary_headers(response, ('Accept',))
+    return
+
+
+class CatalogCacheMixin:
+    """
+    Миксин вью-сета каталога, который кеширует данные ответов
+    list и retrieve в кеше Django.
+
+    Ключ кеша содержит версию каталога, поэтому любое изменение
+    Category, Subcategory или Good делает устаревшими все ответы.
+    Одновременные промахи по одному ключу схлопываются: ответ
+    вычисляет только запрос, захвативший блокировку, остальные
+    ожидают его появления в кеше.
+
+    Ответы содержат заголовки ETag и Last-Modified, построенные
+    по версии каталога: условный запрос с совпадающим If-None-Match
+    (или не устаревшим If-Modified-Since) получает 304 без обращения
+    к базе данных и сериализаторам.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, *args, **kwargs)
+
+    def get_request_hash(self) -> str:
+        """Возвращает хеш запроса к вью-сету."""
+        return get_request_hash(
+            basename=self.basename,
+            action=self.action,
+            renderer_format=self.request.accepted_renderer.format,
+            request=self.request,
+        )
+
+    def get_cached_response(
+        self,
+        method: Callable[..., Response],
+        *args,
+        **kwargs,
+    ) -> Response:
+        """
+        Возвращает 304 для неизмененных данных, иначе ответ с данными
+        из кеша или вычисляет его вызовом method и сохраняет в кеш.
+        """
+        version: float = get_catalog_version()
+        request_hash: str = self.get_request_hash()
+        etag: str = get_catalog_etag(
+            version=version,
+            request_hash=request_hash,
+        )
+        if is_not_modified(
+            request=self.request,
+            etag=etag,
+            version=version,
+        ):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = self.get_data_response(
+                get_catalog_cache_key(
+                    version=version,
+                    request_hash=request_hash,
+                ),
+                method,
+                *args,
+                **kwargs,
+            )
+        if response.status_code in (
+            status.HTTP_200_OK,
+            status.HTTP_304_NOT_MODIFIED,
+        ):
+            set_catalog_headers(
+                response=response,
+                etag=etag,
+                version=version,
+            )
+        return response
+
+    def get_data_response(
+        self,
+        key: str,
+        method: Callable[..., Response],
+        *args,
+        **kwargs,
+    ) -> Response:
+        """
+        Возвращает ответ с данными из кеша по ключу key или вычисляет
+        его вызовом method и сохраняет в кеш.
+        """
+        data = cache.get(key)
+        if data is not None:
+            return Response(data=data, status=status.HTTP_200_OK)
+        lock_key: str = f'{key}:lock'
+        if not cache.add(lock_key, True, CATALOG_CACHE_LOCK_TIMEOUT):
+            deadline: float = time.monotonic() + CATALOG_CACHE_LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(CATALOG_CACHE_LOCK_POLL_INTERVAL)
+                data = cache.get(key)
+                if data is not None:
+                    return Response(data=data, status=status.HTTP_200_OK)
+            # INFO: если вычисляющий запрос не уложился в срок,
+            #       ответ вычисляется без кеширования.
+            return method(self.request, *args, **kwargs)
+        try:
+            response: Response = method(self.request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, CATALOG_CACHE_TIMEOUT)
+        finally:
+            cache.delete(lock_key)
+        return response
@@ -0,0 +1,192 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from django.core.files.storage import default_storage
+from django.db.models import Count, F, QuerySet, Sum
+from django.db.models.functions import Coalesce
+from django.utils.encoding import filepath_to_uri
+from rest_framework import status
+from rest_framework.response import Response
+
+from backend.settings import CATALOG_FAST_SERIALIZATION
+
+
+class FastSerializer(ABC):
+    """
+    Базовый класс упрощенного сериализатора только для чтения.
+
+    Работает с результатом queryset.values(*values) и формирует
+    словари напрямую, минуя механизм полей DRF. Представление
+    объектов должно совпадать с представлением соответствующего
+    ModelSerializer.
+    """
+
+    values: tuple[str, ...] = ()
+
+    def __init__(self, context: dict[str, Any]) -> None:
+        request = context.get('request')
+        media_url: str = default_storage.base_url
+        self.media_url_prefix: str = (
+            request.build_absolute_uri(media_url) if request is not None
+            else media_url
+        )
+
+    def get_media_url(self, name: str | None) -> str | None:
+        """Возвращает URL файла так же, как ImageField DRF."""
+        if not name:
+            return None
+        return f'{self.media_url_prefix}{filepath_to_uri(name)}'
+
+    @abstractmethod
+    def to_representation(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Возвращает представление строки queryset.values()."""
+
+    def get_data(self, rows) -> list[dict[str, Any]]:
+        """Возвращает представление списка строк queryset.values()."""
+        return [self.to_representation(row) for row in rows]
+
+
+class CategoryFastSerializer(FastSerializer):
+    """Упрощенный аналог CategoryGetSerializer."""
+
+    values = (
+        'id',
+        'name',
+        'slug',
+        'image',
+    )
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'slug': row['slug'],
+            'image': self.get_media_url(row['image']),
+        }
+
+
+class SubcategoryFastSerializer(FastSerializer):
+    """Упрощенный аналог SubcategoryGetSerializer."""
+
+    values = (
+        'id',
+        'name',
+        'slug',
+        'image',
+        'category_id',
+        'category__name',
+        'category__slug',
+        'category__image',
+    )
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'slug': row['slug'],
+            'category': {
+                'id': row['category_id'],
+                'name': row['category__name'],
+                'slug': row['category__slug'],
+                'image': self.get_media_url(row['category__image']),
+            },
+            'image': self.get_media_url(row['image']),
+        }
+
+
+class GoodFastSerializer(FastSerializer):
+    """Упрощенный аналог GoodGetSerializer."""
+
+    values = (
+        'id',
+        'name',
+        'slug',
+        'price',
+        'subcategory_id',
+        'subcategory__name',
+        'subcategory__slug',
+        'subcategory__category__name',
+        'image_large',
+        'image_medium',
+        'image_small',
+    )
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'slug': row['slug'],
+            'price': row['price'],
+            'subcategory': {
+                'id': row['subcategory_id'],
+                'name': row['subcategory__name'],
+                'slug': row['subcategory__slug'],
+                'parent_category': row['subcategory__category__name'],
+            },
+            'image_large': self.get_media_url(row['image_large']),
+            'image_medium': self.get_media_url(row['image_medium']),
+            'image_small': self.get_media_url(row['image_small']),
+        }
+
+
+class ShoppingCartFastSerializer(FastSerializer):
+    """
+    Упрощенный аналог ShoppingCartGetSerializer, который также
+    описывает итоги корзины для queryset.aggregate().
+    """
+
+    values = (
+        'good__name',
+        'good__price',
+        'amount',
+    )
+
+    @staticmethod
+    def get_totals() -> dict[str, Any]:
+        """Возвращает выражения итогов корзины для aggregate()."""
+        return {
+            'total_goods': Count('id'),
+            'total_sum': Coalesce(Sum(F('good__price') * F('amount')), 0),
+        }
+
+    def to_representation(self, row):
+        return {
+            'good': row['good__name'],
+            'price': row['good__price'],
+            'amount': row['amount'],
+        }
+
+
+class FastListMixin:
+    """
+    Миксин вью-сета, который формирует ответ list с помощью
+    fast_serializer_class вместо serializer_class.
+
+    Отключается настройкой CATALOG_FAST_SERIALIZATION.
+    """
+
+    fast_serializer_class: type[FastSerializer] | None = None
+
+    def list(self, request, *args, **kwargs):
+        return self.get_list_response(
+            self.filter_queryset(self.get_queryset()),
+        )
+
+    def get_list_response(self, queryset: QuerySet) -> Response:
+        """
+        Возвращает ответ со списком объектов queryset
+        (с пагинацией, если она включена).
+        """
+        if CATALOG_FAST_SERIALIZATION and self.fast_serializer_class:
+            serializer = self.fast_serializer_class(
+                context=self.get_serializer_context(),
+            )
+            queryset = queryset.values(*serializer.values)
+            get_data = serializer.get_data
+        else:
+            def get_data(objects):
+                return self.get_serializer(objects, many=True).data
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(get_data(page))
+        return Response(data=get_data(queryset), status=status.HTTP_200_OK)
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator
+from weakref import WeakValueDictionary
+
+from django.contrib.auth.models import User
+from django.db import connections, router, transaction
+
+# INFO: блокировки корзин пользователей внутри процесса для СУБД
+#       без SELECT ... FOR UPDATE (SQLite). Блокировка удаляется
+#       из словаря, когда ее больше никто не использует.
+_shopping_cart_locks: WeakValueDictionary[int, Lock] = WeakValueDictionary()
+_shopping_cart_locks_lock: Lock = Lock()
+
+
+def get_shopping_cart_thread_lock(user_id: int) -> Lock:
+    """Возвращает блокировку корзины пользователя внутри процесса."""
+    with _shopping_cart_locks_lock:
+        lock: Lock | None = _shopping_cart_locks.get(user_id)
+        if lock is None:
+            lock = Lock()
+            _shopping_cart_locks[user_id] = lock
+    return lock
+
+
+@contextmanager
+def lock_shopping_cart(user_id: int) -> Iterator[None]:
+    """
+    Выполняет изменение корзины пользователя в транзакции
+    под блокировкой этой корзины.
+
+    Одновременные запросы на изменение одной корзины выполняются
+    последовательно, а не завершаются ошибкой IntegrityError
+    ограничения unique_user_good:
+        - СУБД с SELECT ... FOR UPDATE (PostgreSQL): блокируется
+          строка пользователя до завершения транзакции
+        - остальные СУБД (SQLite): блокировка внутри процесса,
+          которой достаточно для однопроцессного режима отладки
+    """
+    using: str = router.db_for_write(User)
+    if connections[using].features.has_select_for_update:
+        with transaction.atomic(using=using):
+            list(
+                User.objects.using(using).select_for_update().filter(
+                    id=user_id,
+                ).values_list('id', flat=True)
+            )
+            yield
+    else:
+        # INFO: блокировка освобождается после фиксации транзакции.
+        with (
+            get_shopping_cart_thread_lock(user_id),
+            transaction.atomic(using=using),
+        ):
+            yield
+    return
@@ -0,0 +1,436 @@
+from concurrent.futures import (
+    Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError,
+)
+from concurrent.futures.process import BrokenProcessPool
+from math import isqrt
+import multiprocessing
+from threading import BoundedSemaphore, Lock
+from typing import Iterator
+
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from backend.settings import (
+    NUMS_ROW_CACHE_ALIAS, NUMS_ROW_CACHE_MAX_BYTES, NUMS_ROW_CACHE_TIMEOUT,
+    NUMS_ROW_MAX_ELEMENTS, NUMS_ROW_MAX_NUMBER,
+    NUMS_ROW_POOL_THRESHOLD, NUMS_ROW_POOL_TIMEOUT, NUMS_ROW_POOL_WORKERS,
+    NUMS_ROW_STREAM_CHUNK_SIZE, NUMS_ROW_STREAM_WORKERS,
+)
+
+NUMS_ROW_FORMAT_RUNS: str = 'runs'
+NUMS_ROW_FORMAT_STRING: str = 'string'
+
+# INFO: пул процессов создается лениво при первом обращении, чтобы
+#       не порождать процессы в воркерах, которые его не используют.
+#       Процессы запускаются через forkserver: fork многопоточного
+#       воркера (gthread, пул потоков изображений) копирует блокировки,
+#       захваченные другими потоками, и может зависнуть.
+_pool: ProcessPoolExecutor | None = None
+_pool_lock: Lock = Lock()
+_pool_slots: BoundedSemaphore = BoundedSemaphore(NUMS_ROW_POOL_WORKERS)
+_stream_slots: BoundedSemaphore = BoundedSemaphore(NUMS_ROW_STREAM_WORKERS)
+
+
+class NumsRowTooLarge(APIException):
+    """Исключение превышения допустимого размера последовательности."""
+
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'Запрошенная последовательность слишком велика.'
+    default_code = 'nums_row_too_large'
+
+
+class NumsRowUnavailable(APIException):
+    """Исключение недоступности пула вычисления последовательности."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = (
+        'Сервер занят вычислением других последовательностей, '
+        'повторите запрос позже.'
+    )
+    default_code = 'nums_row_unavailable'
+
+
+def get_nums_row_total(number: int) -> int:
+    """
+    Возвращает количество элементов последовательности 122333444455555…
+    для чисел от 1 до number включительно (сумма арифметической прогрессии).
+    """
+    return number * (number + 1) // 2
+
+
+def get_nums_row_position(index: int) -> tuple[int, int]:
+    """
+    Возвращает число, стоящее на позиции index (с нуля) последовательности
+    122333444455555…, и количество его повторов до этой позиции.
+
+    Число находится как наименьшее value, для которого
+    value * (value + 1) / 2 > index, за O(log n).
+    """
+    value: int = (isqrt(8 * index + 1) + 1) // 2
+    return value, index - get_nums_row_total(number=value - 1)
+
+
+def get_nums_row_chars(index: int) -> int:
+    """
+    Возвращает количество символов в строковом представлении
+    первых index элементов последовательности 122333444455555….
+    """
+    value, position = get_nums_row_position(index=index)
+    chars: int = position * len(str(value))
+    digits: int = 1
+    low: int = 1
+    while low < value:
+        high: int = min(low * 10, value) - 1
+        chars += digits * get_nums_row_total(number=high)
+        chars -= digits * get_nums_row_total(number=low - 1)
+        digits += 1
+        low *= 10
+    return chars
+
+
+def get_nums_row_window_size(
+    number: int,
+    offset: int = 0,
+    length: int | None = None,
+) -> int:
+    """
+    Возвращает количество элементов в окне offset/length
+    последовательности для чисел от 1 до number включительно.
+    """
+    total: int = get_nums_row_total(number=number)
+    stop: int = total if length is None else min(offset + length, total)
+    return max(stop - offset, 0)
+
+
+def check_nums_row_limits(
+    number: int,
+    offset: int = 0,
+    length: int | None = None,
+    max_elements: int = NUMS_ROW_MAX_ELEMENTS,
+) -> None:
+    """
+    Проверяет, что запрошенная последовательность не превышает
+    NUMS_ROW_MAX_NUMBER и max_elements элементов.
+    """
+    if number > NUMS_ROW_MAX_NUMBER:
+        raise NumsRowTooLarge(
+            detail=(
+                "Значение поля 'number' не должно превышать "
+                f"{NUMS_ROW_MAX_NUMBER}."
+            ),
+        )
+    window_size: int = get_nums_row_window_size(
+        number=number,
+        offset=offset,
+        length=length,
+    )
+    if window_size > max_elements:
+        raise NumsRowTooLarge(
+            detail=(
+                'Количество элементов последовательности не должно '
+                f'превышать {max_elements}, используйте '
+                "параметры 'offset' и 'length'."
+            ),
+        )
+    return
+
+
+def generate_nums_row_runs(
+    number: int,
+    offset: int = 0,
+    length: int | None = None,
+) -> Iterator[list[int]]:
+    """
+    Генератор последовательности 122333444455555… в виде серий
+    [число, количество повторов] для чисел от 1 до number включительно.
+
+    Если переданы offset и length, генерируются только серии окна
+    из length элементов, начиная с позиции offset, без вычисления
+    предшествующих элементов: первая и последняя серии окна
+    могут быть неполными.
+    """
+    total: int = get_nums_row_total(number=number)
+    stop: int = total if length is None else min(offset + length, total)
+    if offset >= stop:
+        return
+    left: int = stop - offset
+    value, position = get_nums_row_position(index=offset)
+    repeats: int = value - position
+    while left:
+        count: int = min(repeats, left)
+        yield [value, count]
+        left -= count
+        value += 1
+        repeats = value
+
+
+def generate_nums_row_chunks(
+    number: int,
+    offset: int = 0,
+    length: int | None = None,
+    chunk_size: int = NUMS_ROW_STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Генератор частей последовательности 122333444455555…
+    для чисел от 1 до number включительно.
+
+    Окно offset/length задается так же, как в generate_nums_row_runs.
+
+    Каждая часть содержит не более chunk_size символов (если только
+    одно число не длиннее chunk_size), поэтому потребление памяти
+    не зависит от значения number.
+    """
+    chunk: str = ''
+    for value, remaining in generate_nums_row_runs(
+        number=number,
+        offset=offset,
+        length=length,
+    ):
+        digits: str = str(value)
+        while remaining:
+            free: int = (chunk_size - len(chunk)) // len(digits)
+            if free <= 0 and chunk:
+                yield chunk
+                chunk = ''
+                continue
+            taken: int = min(max(free, 1), remaining)
+            chunk += digits * taken
+            remaining -= taken
+    if chunk:
+        yield chunk
+
+
+class NumsRowStream:
+    """
+    Итератор частей последовательности для потоковой передачи,
+    который занимает один из NUMS_ROW_STREAM_WORKERS слотов до закрытия
+    ответа (StreamingHttpResponse вызывает close и при обрыве соединения).
+
+    Если все слоты заняты, возбуждает NumsRowUnavailable.
+    """
+
+    def __init__(
+        self,
+        number: int,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> None:
+        if not _stream_slots.acquire(blocking=False):
+            raise NumsRowUnavailable()
+        self._chunks: Iterator[str] = generate_nums_row_chunks(
+            number=number,
+            offset=offset,
+            length=length,
+        )
+        self._closed: bool = False
+
+    def __iter__(self) -> Iterator[str]:
+        return self._chunks
+
+    def close(self) -> None:
+        """Останавливает генерацию и освобождает слот."""
+        if self._closed:
+            return
+        self._closed = True
+        self._chunks.close()
+        _stream_slots.release()
+        return
+
+
+def create_nums_row_string(
+    number: int,
+    offset: int = 0,
+    length: int | None = None,
+) -> str:
+    """
+    Возвращает последовательность 122333444455555…
+    для чисел от 1 до number включительно (или ее окно
+    из length элементов, начиная с позиции offset) одной строкой.
+    """
+    return ''.join(
+        generate_nums_row_chunks(number=number, offset=offset, length=length)
+    )
+
+
+class NumsRowCache:
+    """
+    Кеш самой длинной вычисленной строки последовательности размером
+    не более max_bytes.
+
+    Последовательность для меньшего number является началом
+    последовательности для большего, поэтому любое окно любой
+    последовательности для number не больше закешированного вырезается
+    из одной строки, и хранить другие строки не требуется.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes: int = max_bytes
+        self.number: int | None = None
+        self._row: str = ''
+        self._lock: Lock = Lock()
+
+    @property
+    def size(self) -> int:
+        """Размер закешированной строки."""
+        return len(self._row)
+
+    def get(
+        self,
+        number: int,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> str | None:
+        """Возвращает окно последовательности или None, если его нет."""
+        with self._lock:
+            if self.number is None or self.number < number:
+                return None
+            row: str = self._row
+        stop: int = offset + get_nums_row_window_size(
+            number=number,
+            offset=offset,
+            length=length,
+        )
+        return row[
+            get_nums_row_chars(index=offset):get_nums_row_chars(index=stop)
+        ]
+
+    def set(self, number: int, row: str) -> None:
+        """
+        Сохраняет последовательность для number, если она длиннее
+        закешированной и не превышает max_bytes.
+        """
+        if len(row) > self.max_bytes:
+            return
+        with self._lock:
+            if self.number is not None and self.number >= number:
+                return
+            self.number = number
+            self._row = row
+        return
+
+    def clear(self) -> None:
+        """Очищает кеш."""
+        with self._lock:
+            self.number = None
+            self._row = ''
+        return
+
+
+nums_row_cache: NumsRowCache = NumsRowCache(
+    max_bytes=NUMS_ROW_CACHE_MAX_BYTES,
+)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Возвращает пул процессов, создавая его при первом обращении."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=NUMS_ROW_POOL_WORKERS,
+                mp_context=multiprocessing.get_context('forkserver'),
+            )
+        return _pool
+
+
+def _reset_pool() -> None:
+    """Сбрасывает сломанный пул процессов, чтобы он был пересоздан."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+    return
+
+
+def create_nums_row_string_bounded(
+    number: int,
+    offset: int = 0,
+    length: int | None = None,
+) -> str:
+    """
+    Возвращает последовательность так же, как create_nums_row_string,
+    но окна длиннее NUMS_ROW_POOL_THRESHOLD элементов вычисляет
+    в пуле процессов с ограничением по времени NUMS_ROW_POOL_TIMEOUT.
+
+    Если все процессы пула заняты или вычисление не уложилось в срок,
+    возбуждает NumsRowUnavailable.
+
+    Полные последовательности сохраняются в nums_row_cache
+    (и в кеш Django NUMS_ROW_CACHE_ALIAS, если он задан),
+    из которого затем вырезаются окна последующих запросов.
+    """
+    row: str | None = nums_row_cache.get(
+        number=number,
+        offset=offset,
+        length=length,
+    )
+    if row is not None:
+        return row
+    is_full_row: bool = offset == 0 and length is None
+    if is_full_row and NUMS_ROW_CACHE_ALIAS is not None:
+        row = caches[NUMS_ROW_CACHE_ALIAS].get(f'nums_row:{number}')
+        if row is not None:
+            nums_row_cache.set(number=number, row=row)
+            return row
+    row = _create_nums_row_string_in_pool(
+        number=number,
+        offset=offset,
+        length=length,
+    )
+    if is_full_row:
+        nums_row_cache.set(number=number, row=row)
+        if NUMS_ROW_CACHE_ALIAS is not None:
+            caches[NUMS_ROW_CACHE_ALIAS].set(
+                f'nums_row:{number}', row, NUMS_ROW_CACHE_TIMEOUT,
+            )
+    return row
+
+
+def _create_nums_row_string_in_pool(
+    number: int,
+    offset: int = 0,
+    length: int | None = None,
+) -> str:
+    """
+    Вычисляет последовательность в пуле процессов, если окно
+    не короче NUMS_ROW_POOL_THRESHOLD элементов, иначе в текущем процессе.
+
+    Строка результата возвращается из процесса пула целиком через pickle:
+    для длинных окон это копия размером с ответ, поэтому их выгоднее
+    запрашивать потоково (NumsRowStream).
+    """
+    window_size: int = get_nums_row_window_size(
+        number=number,
+        offset=offset,
+        length=length,
+    )
+    if window_size < NUMS_ROW_POOL_THRESHOLD:
+        return create_nums_row_string(
+            number=number,
+            offset=offset,
+            length=length,
+        )
+    if not _pool_slots.acquire(blocking=False):
+        raise NumsRowUnavailable()
+    try:
+        future: Future = _get_pool().submit(
+            create_nums_row_string, number, offset, length,
+        )
+    except (BrokenProcessPool, RuntimeError):
+        _pool_slots.release()
+        _reset_pool()
+        raise NumsRowUnavailable()
+    # INFO: слот пула освобождается только по завершении вычисления,
+    #       а не по истечении срока ожидания, так как уже запущенный
+    #       в процессе расчет прервать нельзя.
+    future.add_done_callback(lambda _: _pool_slots.release())
+    try:
+        return future.result(timeout=NUMS_ROW_POOL_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        raise NumsRowUnavailable()
+    except BrokenProcessPool:
+        _reset_pool()
+        raise NumsRowUnavailable()
@@ -0,0 +1,52 @@
+from rest_framework.pagination import CursorPagination
+
+PAGINATION_QUERY_PARAM: str = 'pagination'
+PAGINATION_CURSOR: str = 'cursor'
+
+
+class NameCursorPagination(CursorPagination):
+    """
+    Курсорная (keyset) пагинация, по умолчанию по наименованию объекта.
+
+    Не выполняет COUNT(*) и OFFSET: страница выбирается условием
+    name > <позиция курсора>, поэтому любая страница обходится так же
+    дешево, как первая. Наименования уникальны, а id добавлен
+    для однозначности порядка.
+
+    Порядок задается вью-сетом (CursorPaginationMixin.get_cursor_ordering).
+    """
+
+    ordering = ('name', 'id')
+
+
+class CursorPaginationMixin:
+    """
+    Миксин вью-сета, который включает NameCursorPagination
+    вместо пагинации по умолчанию при параметре запроса
+    ?pagination=cursor (или при переданном курсоре).
+    """
+
+    cursor_pagination_class = NameCursorPagination
+
+    def is_cursor_pagination(self) -> bool:
+        """Проверяет, запрошена ли курсорная пагинация."""
+        query_params = self.request.query_params
+        return (
+            query_params.get(PAGINATION_QUERY_PARAM) == PAGINATION_CURSOR
+            or self.cursor_pagination_class.cursor_query_param
+            in query_params
+        )
+
+    def get_cursor_ordering(self) -> tuple[str, ...]:
+        """
+        Возвращает порядок курсорной пагинации: он должен совпадать
+        с сортировкой queryset и завершаться уникальным полем.
+        """
+        return self.cursor_pagination_class.ordering
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator') and self.is_cursor_pagination():
+            self._paginator = self.cursor_pagination_class()
+            self._paginator.ordering = self.get_cursor_ordering()
+        return super().paginator
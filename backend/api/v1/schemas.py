@@ -1,14 +1,30 @@
-from drf_spectacular.utils import extend_schema, inline_serializer
+from drf_spectacular.utils import (
+    OpenApiParameter, extend_schema, inline_serializer,
+)
 from rest_framework import status, serializers
 from rest_framework_simplejwt.serializers import (
     TokenObtainPairSerializer, TokenRefreshSerializer,
 )
-from api.v1.serializers import ShoppingCartGetSerializer
+from api.v1.serializers import (
+    GoodFilterSerializer, GoodSearchSerializer, ShoppingCartGetSerializer,
+)
 
 DEFAULT_400_REQUIRED: str = 'Обязательное поле.'
 DEFAULT_401: str = 'Учетные данные не были предоставлены.'
 DEFAULT_404: str = 'Страница не найдена.'
 
+CURSOR_PAGINATION_PARAMETER = OpenApiParameter(
+    name='pagination',
+    description=(
+        'Значение "cursor" включает курсорную пагинацию: '
+        'без подсчета общего количества объектов (count), '
+        'переход по страницам по ссылкам next и previous.'
+    ),
+    required=False,
+    type=str,
+    enum=('cursor',),
+)
+
 
 class ShoppingCartListSerializer(serializers.Serializer):
 
@@ -37,14 +53,34 @@ CATEGORIES_VIEW_SCHEMA: dict[str, str] = {
         ),
         summary='Получить категорию товара.',
     ),
+    'tree': extend_schema(
+        description=(
+            'Возвращает все категории товаров с вложенными подкатегориями. '
+            'При параметре goods_count=1 для каждой подкатегории выводится '
+            'количество ее товаров.'
+        ),
+        summary='Получить дерево категорий и подкатегорий товаров.',
+        parameters=[
+            OpenApiParameter(
+                name='goods_count',
+                description='Выводить количество товаров в подкатегориях.',
+                required=False,
+                type=bool,
+            ),
+        ],
+    ),
 }
 
 GOODS_VIEW_SCHEMA: dict[str, str] = {
     'list': extend_schema(
         description=(
-            'Возвращает список товаров.'
+            'Возвращает список товаров. Список фильтруется по подкатегории '
+            '(subcategory), категории (category) и диапазону цен '
+            '(price_min, price_max) и сортируется параметром ordering '
+            '(в том числе при курсорной пагинации).'
         ),
         summary='Получить список товаров.',
+        parameters=[CURSOR_PAGINATION_PARAMETER, GoodFilterSerializer],
     ),
     'retrieve': extend_schema(
         description=(
@@ -52,12 +88,34 @@ GOODS_VIEW_SCHEMA: dict[str, str] = {
         ),
         summary='Получить товар.',
     ),
+    'search': extend_schema(
+        description=(
+            'Возвращает список товаров, найденных по наименованию '
+            '(параметр q), отсортированный по релевантности '
+            '(параметр ordering задает порядок товаров с равной '
+            'релевантностью). Поддерживает те же фильтры, что и список '
+            'товаров, кроме курсорной пагинации.'
+        ),
+        summary='Найти товары по наименованию.',
+        parameters=[GoodSearchSerializer, GoodFilterSerializer],
+    ),
 }
 
 SHOPPING_CART_SCHEMA = {
     'list': extend_schema(
-        description='Возвращает список товаров в корзине с покупками.',
+        description=(
+            'Возвращает список товаров в корзине с покупками. '
+            'При параметре summary=1 возвращаются только итоги корзины.'
+        ),
         summary='Получить список товаров в корзине с покупками.',
+        parameters=[
+            OpenApiParameter(
+                name='summary',
+                description='Возвращать только итоги корзины.',
+                required=False,
+                type=bool,
+            ),
+        ],
         responses={
             status.HTTP_200_OK: inline_serializer(
                 name='shopping_cart_get_200',
@@ -105,6 +163,94 @@ SHOPPING_CART_SCHEMA = {
             ),
         },
     ),
+    'update': extend_schema(
+        description=(
+            'Добавляет товар в корзину с покупками или изменяет '
+            'его количество. Идентификатор в URL - id товара.'
+        ),
+        summary='Добавить или изменить товар в корзине с покупками.',
+        request=inline_serializer(
+            name='shopping_cart_update',
+            fields={
+                'amount': serializers.IntegerField(),
+            },
+        ),
+        responses={
+            status.HTTP_200_OK: inline_serializer(
+                name='shopping_cart_get_200',
+                fields={
+                    'total_goods': serializers.IntegerField(),
+                    'total_sum': serializers.IntegerField(),
+                    'goods': ShoppingCartGetSerializer(),
+                },
+            ),
+            status.HTTP_401_UNAUTHORIZED: inline_serializer(
+                name='clear_shopping_cart_error_401',
+                fields={
+                    'detail': serializers.CharField(
+                        default=DEFAULT_401,
+                    ),
+                },
+            ),
+        },
+    ),
+    'destroy': extend_schema(
+        description=(
+            'Удаляет товар из корзины с покупками. '
+            'Идентификатор в URL - id товара.'
+        ),
+        summary='Удалить товар из корзины с покупками.',
+        request=None,
+        responses={
+            status.HTTP_204_NO_CONTENT: inline_serializer(
+                name='shopping_cart_destroy_204',
+                fields={},
+            ),
+            status.HTTP_401_UNAUTHORIZED: inline_serializer(
+                name='clear_shopping_cart_error_401',
+                fields={
+                    'detail': serializers.CharField(
+                        default=DEFAULT_401,
+                    ),
+                },
+            ),
+        },
+    ),
+    'update_shopping_cart': extend_schema(
+        description=(
+            'Изменяет список товаров в корзине с покупками без его '
+            'полной замены: товары из goods добавляются или изменяют '
+            'количество, товары из remove (id товаров) удаляются.'
+        ),
+        summary='Частично изменить список товаров в корзине с покупками.',
+        request=inline_serializer(
+            name='shopping_cart_update_shopping_cart',
+            fields={
+                'goods': ShoppingCartGetSerializer(many=True),
+                'remove': serializers.ListField(
+                    child=serializers.IntegerField(),
+                ),
+            },
+        ),
+        responses={
+            status.HTTP_200_OK: inline_serializer(
+                name='shopping_cart_get_200',
+                fields={
+                    'total_goods': serializers.IntegerField(),
+                    'total_sum': serializers.IntegerField(),
+                    'goods': ShoppingCartGetSerializer(),
+                },
+            ),
+            status.HTTP_401_UNAUTHORIZED: inline_serializer(
+                name='clear_shopping_cart_error_401',
+                fields={
+                    'detail': serializers.CharField(
+                        default=DEFAULT_401,
+                    ),
+                },
+            ),
+        },
+    ),
     'clear_shopping_cart': extend_schema(
         description=(
             'Очищает список товаров в корзине с покупками.'
@@ -134,6 +280,7 @@ SUBCATEGORIES_VIEW_SCHEMA: dict[str, str] = {
             'Возвращает список подкатегорий товаров.'
         ),
         summary='Получить список подкатегорий товаров.',
+        parameters=[CURSOR_PAGINATION_PARAMETER],
     ),
     'retrieve': extend_schema(
         description=(
@@ -185,3 +332,49 @@ TOKEN_JWT_REFRESH_SCHEMA: dict[str, str] = {
         ),
     },
 }
+
+DATABASE_POOL_SCHEMA: dict[str, str] = {
+    'description': (
+        'Возвращает метрики пулов соединений с базой данных процесса '
+        '(при DB_POOL=True): количество открытых, свободных и занятых '
+        'соединений, количество и время ожидания свободного соединения '
+        '(в секундах) и количество запросов, не получивших соединение '
+        '(exhausted). Доступно только администраторам.'
+    ),
+    'summary': 'Получить метрики пулов соединений с базой данных.',
+    'responses': {
+        status.HTTP_200_OK: inline_serializer(
+            name='database_pool_get_200',
+            fields={
+                'default': inline_serializer(
+                    name='database_pool_stats',
+                    fields={
+                        'min_size': serializers.IntegerField(),
+                        'max_size': serializers.IntegerField(),
+                        'size': serializers.IntegerField(),
+                        'idle': serializers.IntegerField(),
+                        'in_use': serializers.IntegerField(),
+                        'requests': serializers.IntegerField(),
+                        'created': serializers.IntegerField(),
+                        'closed': serializers.IntegerField(),
+                        'waits': serializers.IntegerField(),
+                        'wait_time_total': serializers.FloatField(),
+                        'wait_time_max': serializers.FloatField(),
+                        'exhausted': serializers.IntegerField(),
+                    },
+                ),
+            },
+        ),
+        status.HTTP_403_FORBIDDEN: inline_serializer(
+            name='database_pool_error_403',
+            fields={
+                'detail': serializers.CharField(
+                    default=(
+                        'У вас недостаточно прав для выполнения '
+                        'данного действия.'
+                    ),
+                ),
+            },
+        ),
+    },
+}
@@ -1,14 +1,37 @@
+from typing import Any
+
 from rest_framework.serializers import (
-    CharField, IntegerField, ModelSerializer, Serializer, ValidationError,
+    BooleanField, CharField, ChoiceField, IntegerField, ListField,
+    ModelSerializer, PrimaryKeyRelatedField, Serializer, ValidationError,
 )
 
+from api.v1.nums_row import (
+    NUMS_ROW_FORMAT_RUNS, NUMS_ROW_FORMAT_STRING, get_nums_row_total,
+)
+from backend.settings import GOOD_SEARCH_QUERY_MAX_LEN
 from goods.models import Category, Good, ShoppingCart, Subcategory
 
+# INFO: допустимые значения параметра сортировки списка товаров
+#       и соответствующие им поля сортировки queryset.
+GOOD_ORDERING: dict[str, tuple[str, ...]] = {
+    'name': ('name',),
+    'price': ('price', 'name'),
+    '-price': ('-price', 'name'),
+}
+GOOD_ORDERING_CHOICES: tuple[str, ...] = tuple(GOOD_ORDERING)
+
 
 class NumberSerializer(Serializer):
     """Сериализатор проверки валидности данных для create_noms_row."""
 
     number = IntegerField()
+    offset = IntegerField(default=0, min_value=0)
+    length = IntegerField(required=False, min_value=1)
+    stream = BooleanField(default=False)
+    format = ChoiceField(
+        choices=(NUMS_ROW_FORMAT_STRING, NUMS_ROW_FORMAT_RUNS),
+        default=NUMS_ROW_FORMAT_STRING,
+    )
 
     def validate_number(self, value):
         """
@@ -20,6 +43,63 @@ class NumberSerializer(Serializer):
             )
         return value
 
+    def validate(self, attrs):
+        if attrs['offset'] >= get_nums_row_total(number=attrs['number']):
+            raise ValidationError(
+                {
+                    "offset": [
+                        "Значение поля должно быть меньше длины "
+                        "последовательности."
+                    ]
+                }
+            )
+        if attrs['stream'] and attrs['format'] != NUMS_ROW_FORMAT_STRING:
+            raise ValidationError(
+                {
+                    "stream": [
+                        "Потоковая передача доступна только для формата "
+                        f"'{NUMS_ROW_FORMAT_STRING}'."
+                    ]
+                }
+            )
+        return super().validate(attrs)
+
+
+class GoodFilterSerializer(Serializer):
+    """Сериализатор проверки валидности параметров фильтрации GoodViewSet."""
+
+    subcategory = IntegerField(required=False, min_value=1)
+    category = IntegerField(required=False, min_value=1)
+    price_min = IntegerField(required=False, min_value=0)
+    price_max = IntegerField(required=False, min_value=0)
+    ordering = ChoiceField(
+        choices=GOOD_ORDERING_CHOICES,
+        required=False,
+    )
+
+    def validate(self, attrs):
+        price_min: int | None = attrs.get('price_min')
+        price_max: int | None = attrs.get('price_max')
+        if (
+            price_min is not None
+            and price_max is not None
+            and price_min > price_max
+        ):
+            raise ValidationError(
+                {
+                    "price_max": [
+                        "Значение поля должно быть не меньше 'price_min'."
+                    ]
+                }
+            )
+        return super().validate(attrs)
+
+
+class GoodSearchSerializer(Serializer):
+    """Сериализатор проверки валидности параметров поиска GoodViewSet."""
+
+    q = CharField(max_length=GOOD_SEARCH_QUERY_MAX_LEN)
+
 
 class CategoryGetSerializer(ModelSerializer):
     """Сериализатор представления объектов Category."""
@@ -34,6 +114,50 @@ class CategoryGetSerializer(ModelSerializer):
         )
 
 
+class SubcategoryTreeSerializer(ModelSerializer):
+    """
+    Сериализатор представления объектов Subcategory в дереве категорий.
+    Используется для отображения подкатегорий в CategoryTreeSerializer.
+
+    Поле 'goods_count' выводится, только если в контексте сериализатора
+    передан флаг 'goods_count' (queryset должен содержать аннотацию).
+    """
+
+    goods_count = IntegerField(read_only=True)
+
+    class Meta:
+        model = Subcategory
+        fields = (
+            'id',
+            'name',
+            'slug',
+            'image',
+            'goods_count',
+        )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get('goods_count'):
+            fields.pop('goods_count')
+        return fields
+
+
+class CategoryTreeSerializer(ModelSerializer):
+    """Сериализатор представления объектов Category с подкатегориями."""
+
+    subcategories = SubcategoryTreeSerializer(source='subcategory', many=True)
+
+    class Meta:
+        model = Category
+        fields = (
+            'id',
+            'name',
+            'slug',
+            'image',
+            'subcategories',
+        )
+
+
 class SubcategoryGetSerializer(ModelSerializer):
     """Сериализатор представления объектов Subcategory."""
 
@@ -123,6 +247,39 @@ class ShoppingCartGetSerializer(ModelSerializer):
         )
 
 
+def get_good_pk(data: Any) -> int | None:
+    """Возвращает id товара из значения data или None, если оно не число."""
+    if isinstance(data, bool):
+        return None
+    try:
+        return int(data)
+    except (TypeError, ValueError):
+        return None
+
+
+class GoodPrimaryKeyField(PrimaryKeyRelatedField):
+    """
+    Поле id товара, которое получает объекты Good из словаря
+    context['goods'] (id: Good), заполненного одним запросом для всего
+    списка в ShoppingCartPostListSerializer.to_internal_value.
+
+    Ошибки совпадают с ошибками PrimaryKeyRelatedField и возвращаются
+    вместе с ошибками остальных полей элемента списка.
+    """
+
+    def to_internal_value(self, data):
+        goods: dict[int, Good] | None = self.context.get('goods')
+        if goods is None:
+            return super().to_internal_value(data)
+        pk: int | None = get_good_pk(data)
+        if pk is None:
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        good: Good | None = goods.get(pk)
+        if good is None:
+            self.fail('does_not_exist', pk_value=data)
+        return good
+
+
 class ShoppingCartShortSerializer(ModelSerializer):
     """
     Сериализатор представления объектов ShoppingCart в усеченном виде.
@@ -130,6 +287,8 @@ class ShoppingCartShortSerializer(ModelSerializer):
     в ShoppingCartPostListSerializer.
     """
 
+    good = GoodPrimaryKeyField(queryset=Good.objects.all())
+
     class Meta:
         model = ShoppingCart
         fields = (
@@ -150,6 +309,23 @@ class ShoppingCartPostListSerializer(ModelSerializer):
             'goods',
         )
 
+    def to_internal_value(self, data):
+        """
+        Получает товары из 'goods' одним запросом перед проверкой
+        элементов списка (см. GoodPrimaryKeyField).
+        """
+        goods = data.get('goods') if hasattr(data, 'get') else None
+        goods_ids: set[int] = set()
+        if isinstance(goods, list):
+            for item in goods:
+                if not hasattr(item, 'get'):
+                    continue
+                pk: int | None = get_good_pk(item.get('good'))
+                if pk is not None:
+                    goods_ids.add(pk)
+        self.context['goods'] = Good.objects.in_bulk(goods_ids)
+        return super().to_internal_value(data)
+
     def validate(self, attrs):
         goods = attrs.get('goods')
         if not goods:
@@ -222,3 +398,75 @@ class ShoppingCartPostListSerializer(ModelSerializer):
             'goods': goods,
         }
         return data
+
+
+class ShoppingCartPatchListSerializer(ShoppingCartPostListSerializer):
+    """
+    Сериализатор изменения списка объектов ShoppingCart без замены
+    всей корзины: товары из 'goods' добавляются или изменяют
+    количество (upsert), товары из 'remove' удаляются из корзины.
+    """
+
+    goods = ShoppingCartShortSerializer(many=True, required=False)
+    remove = ListField(
+        child=IntegerField(min_value=1),
+        required=False,
+    )
+
+    class Meta:
+        model = ShoppingCart
+        fields = (
+            'user',
+            'goods',
+            'remove',
+        )
+
+    def validate(self, attrs):
+        goods: list[dict[str, any]] = attrs.get('goods') or []
+        remove: list[int] = attrs.get('remove') or []
+        if not goods and not remove:
+            raise ValidationError(
+                {
+                    "goods": [
+                        "Передайте товары для изменения (goods) "
+                        "или удаления (remove)."
+                    ]
+                }
+            )
+        if goods:
+            attrs = super().validate(attrs)
+        if set(item['good'].id for item in goods) & set(remove):
+            raise ValidationError(
+                {
+                    "remove": [
+                        "Товар не может быть одновременно изменен и удален."
+                    ]
+                }
+            )
+        return attrs
+
+    def create(self, validated_data):
+        user = validated_data['user']
+        shopping_items: list[ShoppingCart] = [
+            ShoppingCart(
+                user=user,
+                good=item['good'],
+                amount=item['amount'],
+            )
+            for item in validated_data.get('goods') or []
+        ]
+        if shopping_items:
+            ShoppingCart.objects.bulk_create(
+                shopping_items,
+                update_conflicts=True,
+                unique_fields=('user', 'good'),
+                update_fields=('amount',),
+            )
+        remove: list[int] = validated_data.get('remove') or []
+        if remove:
+            ShoppingCart.objects.filter(
+                user=user,
+                good_id__in=remove,
+            ).delete()
+        self.context['objects'] = shopping_items
+        return shopping_items
@@ -1,6 +1,8 @@
 import pytest
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.test import APIClient
@@ -32,6 +34,20 @@ def client_auth() -> APIClient:
     return client
 
 
+"""Запросы к базе данных."""
+
+
+def count_select_queries(context: CaptureQueriesContext) -> int:
+    """
+    Возвращает количество SELECT запросов к базе данных
+    (без служебных SAVEPOINT при ATOMIC_REQUESTS).
+    """
+    return sum(
+        1 for query in context.captured_queries
+        if query['sql'].startswith('SELECT')
+    )
+
+
 """Статусы запросов."""
 
 
@@ -52,12 +68,25 @@ URL_MISSED_STATUSES: list = [
 URL_STATUS_200 = status.HTTP_200_OK
 URL_STATUS_201 = status.HTTP_201_CREATED
 URL_STATUS_204 = status.HTTP_204_NO_CONTENT
+URL_STATUS_304 = status.HTTP_304_NOT_MODIFIED
 URL_STATUS_400 = status.HTTP_400_BAD_REQUEST
+URL_STATUS_401 = status.HTTP_401_UNAUTHORIZED
+URL_STATUS_403 = status.HTTP_403_FORBIDDEN
+URL_STATUS_404 = status.HTTP_404_NOT_FOUND
+URL_STATUS_413 = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+URL_STATUS_503 = status.HTTP_503_SERVICE_UNAVAILABLE
 
 
 """Фикстуры."""
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """Фикстура для очистки кеша перед каждым тестом."""
+    cache.clear()
+    return
+
+
 # Количество объектов моделей, должны создавать все фикстуры.
 TEST_FIXTURES_OBJ_AMOUNT: int = 3
 
@@ -120,14 +149,30 @@ URL_AUTH_CREATE: str = f'{URL_AUTH}create/'
 URL_AUTH_REFRESH: str = f'{URL_AUTH}refresh/'
 
 URL_CATEGORIES: str = f'{URL_API_V1}categories/'
+URL_CATEGORIES_TREE: str = f'{URL_CATEGORIES}tree/'
 
 URL_CREATE_NUMS_ROW: str = f'{URL_API_V1}create-nums-row/'
 
+URL_DATABASE_POOL: str = f'{URL_API_V1}database-pool/'
+
 URL_GOODS: str = f'{URL_API_V1}goods/'
+URL_GOODS_CURSOR: str = f'{URL_GOODS}?pagination=cursor'
+URL_GOODS_SEARCH: str = f'{URL_GOODS}search/'
 
 URL_SHOPPING_CART: str = f'{URL_API_V1}shopping-cart/'
 URL_SHOPPING_CART_CLEAR: str = f'{URL_SHOPPING_CART}clear_shopping_cart/'
+URL_SHOPPING_CART_UPDATE: str = (
+    f'{URL_SHOPPING_CART}update_shopping_cart/'
+)
 
 URL_SUBCATEGORIES: str = f'{URL_API_V1}subcategories/'
 
+URL_SCHEMA: str = f'{URL_API_V1}docs/?format=json'
+
 URL_SWAGGER: str = f'{URL_API_V1}docs/swagger/'
+
+
+"""Эндпоинты медиафайлов."""
+
+
+URL_MEDIA_RESIZE: str = '/media/r/'
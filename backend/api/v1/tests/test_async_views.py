@@ -0,0 +1,132 @@
+from django.core.cache import cache
+from django.test import override_settings
+import pytest
+from rest_framework.test import APIClient
+
+from api.v1 import async_views
+from goods.models import Category
+from api.v1.tests.conftest import (
+    URL_STATUS_200, URL_STATUS_201, URL_STATUS_304, URL_STATUS_401,
+    URL_STATUS_404,
+    URL_CATEGORIES, URL_GOODS, URL_SHOPPING_CART, URL_SUBCATEGORIES,
+    client_anon, client_auth,
+)
+
+URLCONF_ASYNC: str = 'api.v1.tests.urls_async'
+
+
+def forbid_viewset_view(viewset, detail):
+    """Заменяет get_viewset_view: запрос не должен передаваться вью-сету."""
+    raise AssertionError(
+        f'Запрос передан синхронному вью-сету {viewset.__name__}.'
+    )
+
+
+@pytest.mark.django_db
+class TestAsyncViews():
+    """
+    Производит тест асинхронных представлений каталога и корзины.
+    """
+
+    @pytest.mark.parametrize(
+        'url', (
+            URL_CATEGORIES,
+            f'{URL_CATEGORIES}2/',
+            URL_GOODS,
+            f'{URL_GOODS}?page=1',
+            f'{URL_GOODS}1/',
+            URL_SUBCATEGORIES,
+            f'{URL_SUBCATEGORIES}3/',
+        )
+    )
+    def test_async_catalog(self, create_staff, monkeypatch, url) -> None:
+        """
+        Тест GET запросов каталога: асинхронные представления
+        возвращают тот же ответ, что и синхронные вью-сеты.
+        """
+        client: APIClient = client_anon()
+        response = client.get(path=url)
+        assert response.status_code == URL_STATUS_200
+        cache.clear()
+        monkeypatch.setattr(
+            async_views, 'get_viewset_view', forbid_viewset_view,
+        )
+        with override_settings(ROOT_URLCONF=URLCONF_ASYNC):
+            response_async = client.get(path=url)
+            assert response_async.status_code == URL_STATUS_200
+            assert response_async.content == response.content, (
+                f'Убедитесь, что асинхронный ответ {url} совпадает '
+                'с синхронным.'
+            )
+            response_async = client.get(
+                path=url,
+                HTTP_IF_NONE_MATCH=response_async.headers['ETag'],
+            )
+            assert response_async.status_code == URL_STATUS_304
+        return
+
+    def test_async_catalog_pagination(self) -> None:
+        """Тест пагинации списка каталога асинхронным представлением."""
+        for num in range(1, 24):
+            Category.objects.create(
+                name=f'Категория {num:02}',
+                slug=f'category-{num}',
+            )
+        client: APIClient = client_anon()
+        urls: tuple[str, ...] = (
+            URL_CATEGORIES,
+            f'{URL_CATEGORIES}?page=2',
+            f'{URL_CATEGORIES}?page=3',
+        )
+        responses = [client.get(path=url).content for url in urls]
+        cache.clear()
+        with override_settings(ROOT_URLCONF=URLCONF_ASYNC):
+            assert [client.get(path=url).content for url in urls] == (
+                responses
+            ), ('Убедитесь, что пагинация асинхронного списка совпадает '
+                'с PageNumberPagination.')
+            response = client.get(path=f'{URL_CATEGORIES}?page=4')
+            assert response.status_code == URL_STATUS_404, (
+                'Убедитесь, что несуществующая страница передается вью-сету.'
+            )
+        return
+
+    def test_async_shopping_cart(self, create_staff, monkeypatch) -> None:
+        """
+        Тест корзины: GET обрабатывается асинхронно, изменения
+        и запросы без токена - синхронным вью-сетом.
+        """
+        client: APIClient = client_auth()
+        with override_settings(ROOT_URLCONF=URLCONF_ASYNC):
+            response = client.post(
+                path=URL_SHOPPING_CART,
+                data={
+                    'goods': [
+                        {'good': 1, 'amount': 10},
+                        {'good': 2, 'amount': 20},
+                    ],
+                },
+                format='json',
+            )
+            assert response.status_code == URL_STATUS_201
+            monkeypatch.setattr(
+                async_views, 'get_viewset_view', forbid_viewset_view,
+            )
+            response = client.get(path=URL_SHOPPING_CART)
+            assert response.status_code == URL_STATUS_200
+            assert response.json() == {
+                'total_goods': 2,
+                'total_sum': 50,
+                'goods': [
+                    {'good': 'Товар 1', 'price': 1, 'amount': 10},
+                    {'good': 'Товар 2', 'price': 2, 'amount': 20},
+                ],
+            }, ('Убедитесь, что асинхронная корзина совпадает с синхронной.')
+            response = client.get(path=f'{URL_SHOPPING_CART}?summary=1')
+            assert response.json() == {'total_goods': 2, 'total_sum': 50}
+            monkeypatch.undo()
+            # INFO: ответ 401 вью-сета отменяет транзакцию теста
+            #       (ATOMIC_REQUESTS), поэтому проверяется последним.
+            response = client_anon().get(path=URL_SHOPPING_CART)
+            assert response.status_code == URL_STATUS_401
+        return
@@ -0,0 +1,138 @@
+from io import StringIO
+import os
+import time
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import override_settings
+import pytest
+
+from api.management.commands import benchmark_api, bootstrap
+from api.v1.tests.conftest import create_staff_obj
+from backend.settings import MEDIA_GC_GRACE_PERIOD
+from goods.models import Category
+
+
+@pytest.mark.django_db
+class TestCommands():
+    """Производит тест команд manage.py."""
+
+    def test_bootstrap(self, monkeypatch, tmp_path) -> None:
+        """
+        Тест команды bootstrap: повторный запуск пропускает
+        уже выполненные шаги.
+        """
+        monkeypatch.setattr(bootstrap, 'STATIC_ROOT', str(tmp_path))
+        outputs: list[str] = []
+        with override_settings(STATIC_ROOT=str(tmp_path)):
+            for _ in range(2):
+                stdout = StringIO()
+                call_command('bootstrap', stdout=stdout)
+                outputs.append(stdout.getvalue())
+        assert 'Статика собрана.' in outputs[0]
+        assert (tmp_path / 'admin').is_dir(), (
+            'Убедитесь, что команда bootstrap собирает статику.'
+        )
+        assert outputs[1] == (
+            'Миграции уже применены.\n'
+            'Статика не изменилась.\n'
+            "Пользователь 'admin' уже существует\n"
+        ), ('Убедитесь, что повторный запуск bootstrap пропускает '
+            'выполненные шаги.')
+        assert User.objects.filter(
+            username='admin',
+            is_superuser=True,
+        ).exists()
+        return
+
+    def test_collect_media_garbage(self, tmp_path) -> None:
+        """
+        Тест команды collect_media_garbage: удаляются только файлы,
+        на которые не ссылаются модели, и их уменьшенные копии.
+        """
+        create_staff_obj(num=1)
+        with override_settings(MEDIA_ROOT=str(tmp_path)):
+            category: Category = Category.objects.get()
+            category.image.save(name='old.png', content=ContentFile(b'old'))
+            old_name: str = category.image.name
+            category.image.save(name='new.png', content=ContentFile(b'new'))
+            # INFO: файл, загруженный до хранения по хешу содержимого.
+            (tmp_path / 'categories').mkdir()
+            (tmp_path / 'categories' / 'legacy').write_bytes(b'legacy')
+            legacy_name: str = 'categories/legacy'
+            resized = tmp_path / 'r' / '200x200' / 'categories'
+            resized.mkdir(parents=True)
+            (resized / 'legacy.webp').write_bytes(b'resized')
+            stdout = StringIO()
+            call_command(
+                'collect_media_garbage', grace_period=0, stdout=stdout,
+            )
+            assert stdout.getvalue() == 'Удалено файлов: 3 (16 байт).\n'
+            assert not default_storage.exists(old_name)
+            assert not default_storage.exists(legacy_name)
+            assert not (resized / 'legacy.webp').exists(), (
+                'Убедитесь, что удаляются уменьшенные копии удаленных файлов.'
+            )
+            assert default_storage.exists(category.image.name), (
+                'Убедитесь, что используемые файлы не удаляются.'
+            )
+        return
+
+    def test_collect_media_garbage_reupload(self, tmp_path) -> None:
+        """
+        Тест повторной загрузки неиспользуемого файла: файл не удаляется,
+        пока транзакция, которая на него ссылается, не зафиксирована.
+        """
+        with override_settings(MEDIA_ROOT=str(tmp_path)):
+            name: str = default_storage.save(
+                'categories/image.png', ContentFile(b'image'),
+            )
+            expired: float = time.time() - 2 * MEDIA_GC_GRACE_PERIOD
+            os.utime(default_storage.path(name), (expired, expired))
+            # INFO: строка модели с этим файлом еще не сохранена.
+            assert default_storage.save(
+                'goods/image.png', ContentFile(b'image'),
+            ) == name
+            call_command('collect_media_garbage', stdout=StringIO())
+            assert default_storage.exists(name), (
+                'Убедитесь, что повторно загруженный файл не удаляется '
+                'в течение MEDIA_GC_GRACE_PERIOD.'
+            )
+        return
+
+    def test_benchmark_api_paths(self, monkeypatch) -> None:
+        """
+        Тест путей команды benchmark_api по умолчанию: с токеном доступа
+        запрашивается и корзина, токен передается только ей.
+        """
+        requests: list = []
+
+        def urlopen(request, timeout: float) -> StringIO:
+            requests.append(request)
+            return StringIO('{}')
+
+        monkeypatch.setattr(benchmark_api, 'urlopen', urlopen)
+        call_command(
+            'benchmark_api',
+            server=['wsgi=http://testserver/'],
+            requests=8,
+            concurrency=1,
+            token='token',
+            stdout=StringIO(),
+        )
+        authorization: dict[str, str | None] = {
+            request.full_url: request.get_header('Authorization')
+            for request in requests
+        }
+        assert authorization == {
+            'http://testserver/api/v1/categories/': None,
+            'http://testserver/api/v1/goods/': None,
+            'http://testserver/api/v1/subcategories/': None,
+            'http://testserver/api/v1/shopping-cart/': 'Bearer token',
+        }, (
+            'Убедитесь, что с токеном доступа команда запрашивает корзину '
+            'и передает токен только ей.'
+        )
+        return
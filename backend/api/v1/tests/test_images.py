@@ -0,0 +1,245 @@
+from io import BytesIO, StringIO
+from threading import BoundedSemaphore
+from time import perf_counter
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import override_settings
+from PIL import Image
+import pytest
+
+from api.v1.tests.conftest import (
+    URL_MEDIA_RESIZE, URL_STATUS_200, URL_STATUS_404, URL_STATUS_503,
+    client_anon, create_staff_obj,
+)
+from backend.settings import GUNICORN_THREADS
+from goods import images
+from goods.models import Category, Good
+
+
+def create_image_file(size: tuple[int, int], image_format: str) -> bytes:
+    """Возвращает содержимое файла изображения размера size."""
+    buffer = BytesIO()
+    Image.new('RGBA', size, (200, 100, 50, 128)).save(
+        buffer, format=image_format,
+    )
+    return buffer.getvalue()
+
+
+class FakeExecutor():
+    """Пул потоков, который запоминает задачи без их выполнения."""
+
+    def __init__(self) -> None:
+        self.submitted: list[int] = []
+
+    def submit(self, task, good_id: int) -> None:
+        self.submitted.append(good_id)
+        return
+
+
+class TestImages():
+    """Производит тест формирования изображений товаров."""
+
+    def test_resize_image_jpeg(self) -> None:
+        """Тест кодирования прогрессивного JPEG без прозрачности."""
+        content: bytes = create_image_file((800, 400), 'PNG')
+        with Image.open(BytesIO(content)) as image:
+            content, width, height = images.resize_image(
+                image=image,
+                size=(200, 200),
+                image_format='JPEG',
+            )
+        assert (width, height) == (200, 100)
+        with Image.open(BytesIO(content)) as result:
+            assert result.format == 'JPEG' and result.mode == 'RGB'
+            assert result.info.get('progressive'), (
+                'Убедитесь, что JPEG кодируется прогрессивно.'
+            )
+        return
+
+    @pytest.mark.django_db
+    def test_generate_good_images(
+        self,
+        django_capture_on_commit_callbacks,
+        monkeypatch,
+        tmp_path,
+    ) -> None:
+        """
+        Тест формирования изображений L, M, S из исходного изображения
+        после фиксации транзакции или командой generate_good_images.
+        """
+        create_staff_obj(num=1)
+        executor = FakeExecutor()
+        monkeypatch.setattr(images, '_get_executor', lambda: executor)
+        with override_settings(MEDIA_ROOT=str(tmp_path)):
+            good: Good = Good.objects.get()
+            good.image.save(
+                name='master.png',
+                content=ContentFile(create_image_file((1600, 800), 'PNG')),
+            )
+            with django_capture_on_commit_callbacks(execute=True):
+                images.schedule_good_images(good_id=good.pk)
+            assert executor.submitted == [good.pk], (
+                'Убедитесь, что изображения формируются в фоновом потоке.'
+            )
+            good.refresh_from_db()
+            assert good.image_pending
+            # INFO: задача фонового потока потеряна (FakeExecutor).
+            call_command(
+                'generate_good_images', pending=True, stdout=StringIO(),
+            )
+            good.refresh_from_db()
+            assert not good.image_pending, (
+                'Убедитесь, что команда generate_good_images --pending '
+                'формирует изображения потерянных задач.'
+            )
+            for field_name, expected in (
+                ('image_large', (1200, 600)),
+                ('image_medium', (600, 300)),
+                ('image_small', (200, 100)),
+            ):
+                field = getattr(good, field_name)
+                assert (
+                    getattr(good, f'{field_name}_width'),
+                    getattr(good, f'{field_name}_height'),
+                ) == expected
+                assert getattr(good, f'{field_name}_size') == field.size
+                with Image.open(field.path) as result:
+                    assert result.format == 'WEBP'
+                    assert result.size == expected
+        return
+
+    @pytest.mark.django_db
+    def test_hashed_storage(self, tmp_path) -> None:
+        """
+        Тест имен файлов по хешу содержимого: одинаковые изображения
+        разных моделей хранятся одним файлом.
+        """
+        create_staff_obj(num=1)
+        content: bytes = create_image_file((100, 100), 'PNG')
+        with override_settings(MEDIA_ROOT=str(tmp_path)):
+            category: Category = Category.objects.get()
+            good: Good = Good.objects.get()
+            category.image.save(
+                name='category.PNG',
+                content=ContentFile(content),
+            )
+            good.image.save(name='good.png', content=ContentFile(content))
+            assert category.image.name == good.image.name, (
+                'Убедитесь, что одинаковые файлы не дублируются.'
+            )
+            assert category.image.name.startswith('h/')
+            assert category.image.name.endswith('.png')
+            good.image.save(
+                name='good.png',
+                content=ContentFile(create_image_file((50, 50), 'PNG')),
+            )
+            assert good.image.name != category.image.name, (
+                'Убедитесь, что измененный файл получает новое имя.'
+            )
+        assert len(list(tmp_path.glob('h/*/*'))) == 2
+        return
+
+    def test_resize_media(self, monkeypatch, tmp_path) -> None:
+        """
+        Тест уменьшения изображений по запросу: допустимые размеры,
+        выбор формата по Accept, дисковый кеш и поврежденные изображения.
+        """
+        monkeypatch.setattr(
+            images, 'MEDIA_RESIZE_AVAILABLE_FORMATS', ('WEBP',),
+        )
+        with override_settings(MEDIA_ROOT=str(tmp_path)):
+            name: str = default_storage.save(
+                'image.png',
+                ContentFile(create_image_file((1000, 500), 'PNG')),
+            )
+            client = client_anon()
+            for url in (
+                f'{URL_MEDIA_RESIZE}300x300/{name}',
+                f'{URL_MEDIA_RESIZE}200x200/missing.png',
+                f'{URL_MEDIA_RESIZE}200x200/../{name}',
+            ):
+                assert client.get(url).status_code == URL_STATUS_404, (
+                    f'Убедитесь, что запрос {url} возвращает 404.'
+                )
+            url: str = f'{URL_MEDIA_RESIZE}200x200/{name}'
+            for accept, content_type, image_format in (
+                ('image/webp,image/*', 'image/webp', 'WEBP'),
+                ('image/*', 'image/jpeg', 'JPEG'),
+            ):
+                response = client.get(url, HTTP_ACCEPT=accept)
+                assert response.status_code == URL_STATUS_200
+                assert response['Content-Type'] == content_type
+                content: bytes = b''.join(response.streaming_content)
+                with Image.open(BytesIO(content)) as image:
+                    assert image.format == image_format
+                    assert image.size == (200, 100)
+            assert (tmp_path / 'r' / '200x200' / f'{name}.webp').is_file(), (
+                'Убедитесь, что уменьшенное изображение сохраняется на диск.'
+            )
+
+            broken: str = default_storage.save(
+                'broken.png',
+                ContentFile(create_image_file((1000, 500), 'PNG')[:100]),
+            )
+            # INFO: второе изображение превышает ограничение Pillow
+            #       на количество пикселей.
+            for broken_url, max_pixels in (
+                (f'{URL_MEDIA_RESIZE}200x200/{broken}', None),
+                (f'{URL_MEDIA_RESIZE}100x100/{name}', 100),
+            ):
+                with monkeypatch.context() as patch:
+                    patch.setattr(Image, 'MAX_IMAGE_PIXELS', max_pixels)
+                    response = client.get(broken_url)
+                assert response.status_code == URL_STATUS_404, (
+                    'Убедитесь, что поврежденные и слишком большие '
+                    'изображения возвращают 404.'
+                )
+            assert images._resize_slots.acquire(blocking=False), (
+                'Убедитесь, что слот освобождается при ошибке.'
+            )
+            images._resize_slots.release()
+        return
+
+    def test_resize_media_busy(self, monkeypatch, tmp_path) -> None:
+        """
+        Тест ограничения количества одновременно уменьшаемых изображений:
+        если все слоты заняты, запрос сразу получает 503.
+        """
+        assert images.MEDIA_RESIZE_WORKERS < GUNICORN_THREADS, (
+            'Убедитесь, что уменьшение изображений не занимает '
+            'все потоки воркера.'
+        )
+        monkeypatch.setattr(
+            images, 'MEDIA_RESIZE_AVAILABLE_FORMATS', ('WEBP',),
+        )
+        busy_slots = BoundedSemaphore(1)
+        monkeypatch.setattr(images, '_resize_slots', busy_slots)
+        with override_settings(MEDIA_ROOT=str(tmp_path)):
+            name: str = default_storage.save(
+                'image.png',
+                ContentFile(create_image_file((1000, 500), 'PNG')),
+            )
+            client = client_anon()
+            url: str = f'{URL_MEDIA_RESIZE}200x200/{name}'
+            assert client.get(url).status_code == URL_STATUS_200
+            busy_slots.acquire()
+            start: float = perf_counter()
+            response = client.get(f'{URL_MEDIA_RESIZE}100x100/{name}')
+            assert response.status_code == URL_STATUS_503, (
+                'Убедитесь, что при занятых слотах возвращается 503.'
+            )
+            assert response['Retry-After'] == '1'
+            assert perf_counter() - start < 0.5, (
+                'Убедитесь, что запрос не ожидает освобождения слота.'
+            )
+            response = client.get(url)
+            assert response.status_code == URL_STATUS_200, (
+                'Убедитесь, что сохраненные изображения отдаются '
+                'без ожидания очереди.'
+            )
+            busy_slots.release()
+            response = client.get(f'{URL_MEDIA_RESIZE}100x100/{name}')
+            assert response.status_code == URL_STATUS_200
+        return
@@ -0,0 +1,169 @@
+from threading import Event, Thread
+
+from django.contrib.auth.models import User
+import pytest
+from rest_framework.test import APIClient
+
+from api.v1.tests.conftest import (
+    URL_DATABASE_POOL, URL_STATUS_200, URL_STATUS_403,
+    client_auth,
+)
+from backend.postgresql_pool.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection():
+    """Соединение с базой данных для теста пула."""
+
+    def __init__(self) -> None:
+        self.closed: bool = False
+
+    def close(self) -> None:
+        self.closed = True
+        return
+
+
+def get_connection(pool: ConnectionPool) -> tuple[FakeConnection, bool]:
+    return pool.get(
+        connect=FakeConnection,
+        is_usable=lambda connection: not connection.closed,
+        close=FakeConnection.close,
+    )
+
+
+def put_connection(pool: ConnectionPool, connection: FakeConnection) -> None:
+    pool.put(
+        connection=connection,
+        reset=lambda connection: not connection.closed,
+        close=FakeConnection.close,
+    )
+    return
+
+
+class TestConnectionPool():
+    """Производит тест пула соединений backend.postgresql_pool."""
+
+    def test_pool_reuse(self) -> None:
+        """Тест повторного использования и проверки соединений."""
+        pool = ConnectionPool(min_size=1, max_size=2)
+        connection, created = get_connection(pool=pool)
+        assert created
+        put_connection(pool=pool, connection=connection)
+        reused, created = get_connection(pool=pool)
+        assert reused is connection and not created, (
+            'Убедитесь, что пул выдает возвращенное соединение.'
+        )
+        reused.close()
+        put_connection(pool=pool, connection=reused)
+        _, created = get_connection(pool=pool)
+        assert created, (
+            'Убедитесь, что пул не выдает закрытые соединения.'
+        )
+        stats: dict[str, int | float] = pool.get_stats()
+        assert stats['size'] == 1 and stats['in_use'] == 1
+        assert stats['requests'] == 3 and stats['created'] == 2
+        return
+
+    def test_pool_exhausted(self) -> None:
+        """Тест ожидания соединения и исчерпания пула."""
+        pool = ConnectionPool(min_size=0, max_size=1, timeout=0.05)
+        connection, _ = get_connection(pool=pool)
+        with pytest.raises(PoolTimeout):
+            get_connection(pool=pool)
+        stats: dict[str, int | float] = pool.get_stats()
+        assert stats['exhausted'] == 1 and stats['waits'] == 1
+        assert stats['wait_time_max'] >= 0.05
+
+        pool.timeout = 5
+        result: list[tuple[FakeConnection, bool]] = []
+        thread = Thread(target=lambda: result.append(get_connection(pool)))
+        thread.start()
+        put_connection(pool=pool, connection=connection)
+        thread.join()
+        assert result == [(connection, False)], (
+            'Убедитесь, что ожидающий запрос получает возвращенное '
+            'в пул соединение.'
+        )
+        assert pool.get_stats()['size'] == 1
+        return
+
+    def test_pool_max_idle(self) -> None:
+        """Тест закрытия простаивающих соединений сверх min_size."""
+        pool = ConnectionPool(min_size=1, max_size=3, max_idle=0)
+        connections: list[FakeConnection] = [
+            get_connection(pool=pool)[0] for _ in range(3)
+        ]
+        for connection in connections:
+            put_connection(pool=pool, connection=connection)
+        stats: dict[str, int | float] = pool.get_stats()
+        assert stats['size'] == stats['idle'] == 1
+        assert stats['closed'] == 2
+        assert [c.closed for c in connections] == [True, True, False]
+        return
+
+    def test_pool_fill(self) -> None:
+        """Тест открытия min_size соединений до запросов."""
+        pool = ConnectionPool(min_size=2, max_size=3)
+        pool.fill(connect=FakeConnection)
+        pool.fill(connect=FakeConnection)
+        stats: dict[str, int | float] = pool.get_stats()
+        assert stats['size'] == stats['idle'] == stats['created'] == 2
+        _, created = get_connection(pool=pool)
+        assert not created, (
+            'Убедитесь, что пул выдает заранее открытые соединения.'
+        )
+        return
+
+    def test_pool_is_usable_unlocked(self) -> None:
+        """
+        Тест проверки соединения без блокировки пула: другие потоки
+        получают соединения, пока проверка не завершена.
+        """
+        pool = ConnectionPool(min_size=0, max_size=2)
+        connection, _ = get_connection(pool=pool)
+        put_connection(pool=pool, connection=connection)
+        checking, release = Event(), Event()
+        released: list[bool] = []
+
+        def is_usable(connection: FakeConnection) -> bool:
+            checking.set()
+            released.append(release.wait(5))
+            return True
+
+        thread = Thread(
+            target=pool.get,
+            kwargs={
+                'connect': FakeConnection,
+                'is_usable': is_usable,
+                'close': FakeConnection.close,
+            },
+        )
+        thread.start()
+        checking.wait(5)
+        try:
+            other, created = get_connection(pool=pool)
+            assert created and other is not connection
+        finally:
+            release.set()
+            thread.join()
+        assert released == [True], (
+            'Убедитесь, что проверка соединения не блокирует пул.'
+        )
+        return
+
+
+@pytest.mark.django_db
+class TestDatabasePoolView():
+    """Производит тест эндпоинта метрик пулов соединений."""
+
+    def test_database_pool_permissions(self) -> None:
+        """Тест доступа к метрикам только для администраторов."""
+        response = client_auth().get(URL_DATABASE_POOL)
+        assert response.status_code == URL_STATUS_403
+        admin: User = User.objects.create_superuser(username='admin')
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        response = client.get(URL_DATABASE_POOL)
+        assert response.status_code == URL_STATUS_200
+        # INFO: тесты используют SQLite без пула соединений.
+        assert response.json() == {}
+        return
@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import ORJSONParser
+from api.renderers import ORJSONRenderer
+
+TEST_DATA: dict[str, any] = {
+    'id': 1,
+    'name': 'Товар "1"',
+    'price': Decimal('10.50'),
+    'created': datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+    'detail': ErrorDetail('Обязательное поле.', code='required'),
+    'separators': 'строка\u2028строка\u2029',
+    'goods': [{'good': 1, 'amount': 10}, None, True, 1.5],
+}
+
+
+class TestRenderers():
+    """Производит тест рендереров и парсеров API."""
+
+    def test_orjson_renderer(self) -> None:
+        """
+        Проверяет, что ORJSONRenderer формирует те же байты,
+        что и JSONRenderer DRF.
+        """
+        assert (
+            ORJSONRenderer().render(TEST_DATA)
+            == JSONRenderer().render(TEST_DATA)
+        ), 'Убедитесь, что ORJSONRenderer совместим с JSONRenderer.'
+        assert ORJSONRenderer().render(
+            TEST_DATA, accepted_media_type='application/json; indent=4',
+        ) == JSONRenderer().render(
+            TEST_DATA, accepted_media_type='application/json; indent=4',
+        )
+        return
+
+    def test_orjson_parser(self) -> None:
+        """
+        Проверяет, что ORJSONParser разбирает JSON так же,
+        как JSONParser DRF.
+        """
+        content: bytes = '{"goods": [{"good": 1, "amount": 1.5}], "name": "Товар"}'.encode()  # noqa (E501)
+        assert (
+            ORJSONParser().parse(BytesIO(content))
+            == JSONParser().parse(BytesIO(content))
+        ), 'Убедитесь, что ORJSONParser совместим с JSONParser.'
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(BytesIO(b'{"goods": '))
+        return
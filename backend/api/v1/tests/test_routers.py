@@ -0,0 +1,55 @@
+from itertools import cycle
+
+from django.core.cache import cache
+import pytest
+
+from api.v1.tests.conftest import (
+    URL_CATEGORIES, URL_STATUS_200,
+    client_anon, create_staff_obj,
+)
+from backend import routers
+from goods.models import Category
+
+
+class TestReplicaRouter():
+    """Производит тест маршрутизации чтения каталога в реплики."""
+
+    def test_replica_sequence(self) -> None:
+        """Тест порядка выбора реплик с весами."""
+        assert routers.get_replica_sequence(
+            {'replica_1': 2, 'replica_2': 1, 'replica_3': 0},
+        ) == ['replica_1', 'replica_2', 'replica_1']
+        return
+
+    @pytest.mark.django_db(databases=('default', 'replica'))
+    def test_catalog_read_from_replica(self, monkeypatch) -> None:
+        """
+        Тест чтения каталога из реплики и из основной базы данных
+        после изменения каталога.
+        """
+        monkeypatch.setattr(routers, 'replica_cycle', cycle(('replica',)))
+        create_staff_obj(num=1)
+        Category.objects.using('replica').create(
+            name='Категория реплики',
+            slug='replica-category',
+        )
+        # INFO: окно чтения из основной базы данных после создания
+        #       объектов каталога истекло.
+        cache.delete(routers.CATALOG_REPLICA_STICKY_CACHE_KEY)
+        response = client_anon().get(URL_CATEGORIES)
+        assert response.status_code == URL_STATUS_200
+        assert [obj['name'] for obj in response.json()['results']] == [
+            'Категория реплики',
+        ], 'Убедитесь, что каталог читается из реплики.'
+
+        Category.objects.create(name='Новая категория', slug='new-category')
+        response = client_anon().get(URL_CATEGORIES)
+        assert [obj['name'] for obj in response.json()['results']] == [
+            'Категория 1', 'Новая категория',
+        ], ('Убедитесь, что после изменения каталог временно читается '
+            'из основной базы данных.')
+        assert Category.objects.count() == 2, (
+            'Убедитесь, что вне представлений каталога чтение выполняется '
+            'из основной базы данных.'
+        )
+        return
@@ -4,8 +4,8 @@ from api.v1.tests.conftest import (
     URL_MISSED_STATUSES,
     URL_AUTH_CREATE, URL_AUTH_REFRESH, URL_CATEGORIES, URL_CREATE_NUMS_ROW,
     URL_GOODS, URL_SHOPPING_CART, URL_SHOPPING_CART_CLEAR, URL_SUBCATEGORIES,
-    URL_SWAGGER,
-    client_auth,
+    URL_SCHEMA, URL_STATUS_200, URL_SWAGGER,
+    client_anon, client_auth,
 )
 
 
@@ -54,3 +54,27 @@ class TestEndpointsAvailability():
             f'и доступен по адресу "{url}".'
         )
         return
+
+
+@pytest.mark.django_db
+class TestSchema():
+    """
+    Производит тест схемы OpenAPI.
+    """
+
+    def test_schema_jwt_auth(self) -> None:
+        """Производит тест схемы аутентификации по JWT."""
+        response = client_anon().get(URL_SCHEMA)
+        assert response.status_code == URL_STATUS_200, (
+            f'Убедитесь, что схема OpenAPI доступна по адресу "{URL_SCHEMA}".'
+        )
+        schema: dict = response.json()
+        assert 'jwtAuth' in schema['components']['securitySchemes'], (
+            'Убедитесь, что в схеме OpenAPI описана аутентификация по JWT.'
+        )
+        operation: dict = schema['paths'][URL_SHOPPING_CART]['get']
+        assert {'jwtAuth': []} in operation['security'], (
+            'Убедитесь, что эндпоинты корзины товаров требуют в схеме '
+            'OpenAPI аутентификацию по JWT.'
+        )
+        return
@@ -1,16 +1,37 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import BoundedSemaphore
 from typing import OrderedDict
 
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import pytest
 from rest_framework.test import APIClient
 
+from api.authentication import get_user_cache_key
+from api.v1 import fast_serializers, nums_row, views
+from goods.models import Category, Good, ShoppingCart, Subcategory
+from api.v1.paginations import NameCursorPagination
 from api.v1.tests.conftest import (
-    URL_STATUS_200, URL_STATUS_201, URL_STATUS_204,
-    URL_AUTH_CREATE, URL_AUTH_REFRESH, URL_CATEGORIES, URL_CREATE_NUMS_ROW,
-    URL_GOODS, URL_SHOPPING_CART, URL_SHOPPING_CART_CLEAR, URL_SUBCATEGORIES,
-    client_anon, client_auth,
+    URL_STATUS_200, URL_STATUS_201, URL_STATUS_204, URL_STATUS_400,
+    URL_STATUS_304, URL_STATUS_401, URL_STATUS_413, URL_STATUS_503,
+    URL_AUTH_CREATE, URL_AUTH_REFRESH, URL_CATEGORIES, URL_CATEGORIES_TREE,
+    URL_CREATE_NUMS_ROW,
+    URL_GOODS, URL_GOODS_CURSOR, URL_GOODS_SEARCH,
+    URL_SHOPPING_CART, URL_SHOPPING_CART_CLEAR, URL_SHOPPING_CART_UPDATE,
+    URL_SUBCATEGORIES,
+    client_anon, client_auth, count_select_queries,
 )
 
 
+class FakePool():
+    """Пул процессов, задачи которого никогда не завершаются."""
+
+    def submit(self, *args) -> Future:
+        return Future()
+
+
 @pytest.mark.django_db
 class TestEndpoints():
     """
@@ -42,6 +63,253 @@ class TestEndpoints():
         assert response.data == expected
         return
 
+    @pytest.mark.parametrize(
+        'data, status, expected', (
+            (
+                {'number': 5, 'offset': 3, 'length': 5},
+                URL_STATUS_200,
+                {'number_sequence': '33344'}
+            ),
+            (
+                {'number': 12, 'offset': 44, 'length': 3},
+                URL_STATUS_200,
+                {'number_sequence': '91010'}
+            ),
+            (
+                {'number': 5, 'offset': 13, 'length': 100},
+                URL_STATUS_200,
+                {'number_sequence': '55'}
+            ),
+            (
+                {'number': 5, 'offset': 15},
+                URL_STATUS_400,
+                None
+            ),
+        )
+    )
+    def test_create_nums_row_window(self, data, status, expected) -> None:
+        """
+        Тестирует POST запрос на получение окна числовой последовательности.
+        """
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data=data,
+            format='json',
+        )
+        assert response.status_code == status
+        if expected is not None:
+            assert response.data == expected
+        return
+
+    @pytest.mark.parametrize(
+        'data, status, expected', (
+            (
+                {'number': 4, 'format': 'runs'},
+                URL_STATUS_200,
+                {'number_runs': [[1, 1], [2, 2], [3, 3], [4, 4]]}
+            ),
+            (
+                {'number': 5, 'offset': 4, 'length': 4, 'format': 'runs'},
+                URL_STATUS_200,
+                {'number_runs': [[3, 2], [4, 2]]}
+            ),
+            (
+                {'number': 5, 'format': 'runs', 'stream': True},
+                URL_STATUS_400,
+                None
+            ),
+        )
+    )
+    def test_create_nums_row_runs(self, data, status, expected) -> None:
+        """
+        Тестирует POST запрос на получение числовой последовательности
+        в виде серий [число, количество повторов].
+        """
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data=data,
+            format='json',
+        )
+        assert response.status_code == status
+        if expected is not None:
+            assert response.data == expected
+        return
+
+    @pytest.mark.parametrize(
+        'data, status', (
+            ({'number': 1_000_001}, URL_STATUS_413),
+            ({'number': 1_000_000, 'stream': True}, URL_STATUS_413),
+            (
+                {'number': 1_000_000, 'offset': 10, 'length': 10},
+                URL_STATUS_200
+            ),
+        )
+    )
+    def test_create_nums_row_too_large(self, data, status) -> None:
+        """
+        Тестирует отклонение POST запроса на генерацию слишком большой
+        числовой последовательности.
+        """
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data=data,
+            format='json',
+        )
+        assert response.status_code == status
+        return
+
+    def test_create_nums_row_pool(self, monkeypatch) -> None:
+        """
+        Тестирует POST запрос на генерацию числовой последовательности
+        в пуле процессов.
+        """
+        monkeypatch.setattr(nums_row, 'NUMS_ROW_POOL_THRESHOLD', 0)
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 5},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_200
+        assert response.data == {'number_sequence': '122333444455555'}
+        return
+
+    def test_create_nums_row_pool_unavailable(self, monkeypatch) -> None:
+        """
+        Тестирует ответ 503, если все процессы пула заняты
+        или вычисление не уложилось в NUMS_ROW_POOL_TIMEOUT.
+        """
+        monkeypatch.setattr(nums_row, 'NUMS_ROW_POOL_THRESHOLD', 0)
+        monkeypatch.setattr(nums_row, 'NUMS_ROW_POOL_TIMEOUT', 0.01)
+        monkeypatch.setattr(
+            nums_row, 'nums_row_cache', nums_row.NumsRowCache(max_bytes=0),
+        )
+        monkeypatch.setattr(nums_row, '_pool', FakePool())
+        pool_slots = BoundedSemaphore(1)
+        monkeypatch.setattr(nums_row, '_pool_slots', pool_slots)
+        pool_slots.acquire()
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 5},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_503, (
+            'Убедитесь, что при занятом пуле процессов возвращается 503.'
+        )
+        pool_slots.release()
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 5},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_503, (
+            'Убедитесь, что при превышении NUMS_ROW_POOL_TIMEOUT '
+            'возвращается 503.'
+        )
+        assert pool_slots.acquire(blocking=False), (
+            'Убедитесь, что слот пула освобождается после отмены '
+            'вычисления.'
+        )
+        return
+
+    def test_create_nums_row_cache(self, monkeypatch) -> None:
+        """
+        Тестирует получение числовой последовательности и ее окон
+        из кеша ранее вычисленной более длинной последовательности.
+        """
+        cache = nums_row.NumsRowCache(max_bytes=200)
+        monkeypatch.setattr(nums_row, 'nums_row_cache', cache)
+        for number in (12, 3):
+            response = client_anon().post(
+                path=URL_CREATE_NUMS_ROW,
+                data={"number": number},
+                format='json',
+            )
+            assert response.status_code == URL_STATUS_200
+        assert response.data == {'number_sequence': '122333'}
+        assert cache.number == 12, (
+            'Убедитесь, что последовательность для меньшего числа '
+            'берется из кеша последовательности для большего числа.'
+        )
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 11, "offset": 44, "length": 3},
+            format='json',
+        )
+        assert response.data == {'number_sequence': '91010'}
+        for number in (14, 20):
+            response = client_anon().post(
+                path=URL_CREATE_NUMS_ROW,
+                data={"number": number},
+                format='json',
+            )
+            assert response.status_code == URL_STATUS_200
+        assert cache.number == 14 and cache.size == 165, (
+            'Убедитесь, что кеш хранит самую длинную последовательность, '
+            'не превышающую max_bytes.'
+        )
+        return
+
+    def test_create_nums_row_stream(self) -> None:
+        """
+        Тестирует POST запрос на потоковую генерацию числовой
+        последовательности.
+        """
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 12, "stream": True},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_200
+        assert response.streaming, (
+            f'Убедитесь, что эндпоинт {URL_CREATE_NUMS_ROW} поддерживает '
+            'потоковую передачу последовательности.'
+        )
+        assert b''.join(response.streaming_content).decode() == ''.join(
+            str(i) * i for i in range(1, 13)
+        )
+        return
+
+    def test_create_nums_row_stream_limits(self, monkeypatch) -> None:
+        """
+        Тестирует ограничения потоковой генерации числовой
+        последовательности: количество элементов и одновременных передач.
+        """
+        monkeypatch.setattr(
+            views, 'NUMS_ROW_STREAM_MAX_ELEMENTS', 10,
+        )
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 5, "stream": True},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_413
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 4, "stream": True},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_200
+        busy = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 4, "stream": True},
+            format='json',
+        )
+        assert busy.status_code == URL_STATUS_503, (
+            'Убедитесь, что число одновременных потоковых передач '
+            'ограничено.'
+        )
+        response.close()
+        response = client_anon().post(
+            path=URL_CREATE_NUMS_ROW,
+            data={"number": 4, "stream": True},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_200, (
+            'Убедитесь, что слот освобождается при закрытии ответа.'
+        )
+        response.close()
+        return
+
     def test_get_jwt_tokens(self, create_users) -> None:
         """
         Тест POST запроса на получение пары JWT-токенов доступа и обновления.
@@ -122,6 +390,109 @@ class TestEndpoints():
         )
         return
 
+    def test_get_categories_cache(self, create_staff) -> None:
+        """
+        Тест кеширования ответа GET запроса на получение списка
+        категорий товаров и его сброса при изменении категории.
+        """
+        client: APIClient = client_anon()
+        response = client.get(path=URL_CATEGORIES)
+        assert response.status_code == URL_STATUS_200
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(path=URL_CATEGORIES)
+        assert response.status_code == URL_STATUS_200
+        assert count_select_queries(context) == 0, (
+            f'Убедитесь, что ответ эндпоинта {URL_CATEGORIES} кешируется.'
+        )
+        with CaptureQueriesContext(connection) as context:
+            client.get(path=URL_CATEGORIES, secure=True)
+        assert count_select_queries(context) > 0, (
+            'Убедитесь, что ответы для разных схем и хостов '
+            'кешируются отдельно.'
+        )
+        category: Category = Category.objects.get(id=1)
+        category.name = 'Категория 0'
+        category.save()
+        response = client.get(path=URL_CATEGORIES)
+        assert response.data['results'][0]['name'] == 'Категория 0', (
+            f'Убедитесь, что кеш эндпоинта {URL_CATEGORIES} сбрасывается '
+            'при изменении категорий.'
+        )
+        return
+
+    def test_get_categories_not_modified(self, create_staff) -> None:
+        """
+        Тест условного GET запроса на получение списка категорий товаров.
+        """
+        client: APIClient = client_anon()
+        response = client.get(path=URL_CATEGORIES)
+        assert response.status_code == URL_STATUS_200
+        etag: str | None = response.headers.get('ETag')
+        assert etag is not None and 'Last-Modified' in response.headers, (
+            f'Убедитесь, что эндпоинт {URL_CATEGORIES} возвращает '
+            'заголовки ETag и Last-Modified.'
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(
+                path=URL_CATEGORIES,
+                HTTP_IF_NONE_MATCH=etag,
+            )
+        assert response.status_code == URL_STATUS_304
+        assert count_select_queries(context) == 0
+        response = client.get(
+            path=URL_CATEGORIES,
+            HTTP_IF_MODIFIED_SINCE=response.headers['Last-Modified'],
+        )
+        assert response.status_code == URL_STATUS_304
+        Category.objects.create(name='Категория 4', slug='category-4')
+        response = client.get(
+            path=URL_CATEGORIES,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == URL_STATUS_200, (
+            f'Убедитесь, что ETag эндпоинта {URL_CATEGORIES} меняется '
+            'при изменении категорий.'
+        )
+        return
+
+    def test_get_categories_tree(self, create_staff) -> None:
+        """
+        Тест GET запроса на получение дерева категорий и подкатегорий.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = client_anon().get(
+                path=f'{URL_CATEGORIES_TREE}?goods_count=1',
+            )
+        assert response.status_code == URL_STATUS_200
+        assert count_select_queries(context) == 2, (
+            f'Убедитесь, что эндпоинт {URL_CATEGORIES_TREE} выполняет '
+            'два запроса к базе данных.'
+        )
+        assert response.data[0] == {
+            'id': 1,
+            'name': 'Категория 1',
+            'slug': 'category-1',
+            'image': None,
+            'subcategories': [
+                {
+                    'id': 1,
+                    'name': 'Подкатегория 1',
+                    'slug': 'subcategory-1',
+                    'image': None,
+                    'goods_count': 1,
+                },
+            ],
+        }, (
+            f'Убедитесь, что эндпоинт {URL_CATEGORIES_TREE} '
+            'выводит категории с подкатегориями.'
+        )
+        assert len(response.data) == 3
+        response = client_anon().get(
+            path=URL_CATEGORIES_TREE,
+        )
+        assert 'goods_count' not in response.data[0]['subcategories'][0]
+        return
+
     def test_get_goods(self, create_staff) -> None:
         """
         Тест GET запроса на получение списка товаров.
@@ -206,6 +577,197 @@ class TestEndpoints():
         )
         return
 
+    @pytest.mark.parametrize(
+        'params, status, expected', (
+            ('?subcategory=2', URL_STATUS_200, ['Товар 2']),
+            ('?category=3', URL_STATUS_200, ['Товар 3']),
+            (
+                '?price_min=2&ordering=-price',
+                URL_STATUS_200,
+                ['Товар 3', 'Товар 2']
+            ),
+            ('?price_max=1', URL_STATUS_200, ['Товар 1']),
+            ('?price_min=3&price_max=1', URL_STATUS_400, None),
+            ('?ordering=slug', URL_STATUS_400, None),
+        )
+    )
+    def test_get_goods_filters(
+        self,
+        create_staff,
+        params,
+        status,
+        expected,
+    ) -> None:
+        """
+        Тест GET запроса на получение отфильтрованного
+        и отсортированного списка товаров.
+        """
+        response = client_anon().get(
+            path=f'{URL_GOODS}{params}',
+        )
+        assert response.status_code == status
+        if expected is not None:
+            assert [
+                good['name'] for good in response.data['results']
+            ] == expected, (
+                f'Убедитесь, что эндпоинт {URL_GOODS} поддерживает '
+                f'фильтрацию и сортировку товаров ({params}).'
+            )
+        return
+
+    @pytest.mark.parametrize(
+        'params, status, expected', (
+            ('?q=товар', URL_STATUS_200, ['Товар 1', 'Товар 2', 'Товар 3']),
+            (
+                '?q=товар&ordering=-price',
+                URL_STATUS_200,
+                ['Товар 3', 'Товар 2', 'Товар 1'],
+            ),
+            ('?q=ТОВ 2', URL_STATUS_200, ['Товар 2']),
+            ('?q=товар&price_min=3', URL_STATUS_200, ['Товар 3']),
+            ('?q=категория', URL_STATUS_200, []),
+            ('', URL_STATUS_400, None),
+        )
+    )
+    def test_search_goods(
+        self,
+        create_staff,
+        params,
+        status,
+        expected,
+    ) -> None:
+        """
+        Тест GET запроса на поиск товаров по наименованию.
+        """
+        response = client_anon().get(
+            path=f'{URL_GOODS_SEARCH}{params}',
+        )
+        assert response.status_code == status
+        if expected is not None:
+            assert [
+                good['name'] for good in response.data['results']
+            ] == expected, (
+                f'Убедитесь, что эндпоинт {URL_GOODS_SEARCH} выполняет '
+                f'поиск товаров по наименованию ({params}).'
+            )
+        return
+
+    def test_search_goods_fts_join(self, create_staff) -> None:
+        """
+        Тест поиска товаров в SQLite: индекс FTS5 присоединяется
+        к товарам, а не опрашивается подзапросом для каждого товара.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = client_anon().get(
+                path=f'{URL_GOODS_SEARCH}?q=товар',
+            )
+        assert response.status_code == URL_STATUS_200
+        queries: list[str] = [
+            query['sql'] for query in context.captured_queries
+            if 'goods_good_fts' in query['sql']
+        ]
+        assert queries and all(
+            query.count('MATCH') == 1 and 'SELECT rank' not in query
+            for query in queries
+        ), (
+            'Убедитесь, что запрос поиска выполняет MATCH один раз.'
+        )
+        return
+
+    def test_get_goods_cursor(self, create_staff, monkeypatch) -> None:
+        """
+        Тест GET запроса на получение списка товаров
+        с курсорной пагинацией.
+        """
+        monkeypatch.setattr(NameCursorPagination, 'page_size', 2)
+        response = client_anon().get(
+            path=URL_GOODS_CURSOR,
+        )
+        assert response.status_code == URL_STATUS_200
+        assert list(response.data.keys()) == ['next', 'previous', 'results'], (  # noqa (E501)
+            f'Убедитесь, что эндпоинт {URL_GOODS_CURSOR} содержит '
+            'курсорную пагинацию.'
+        )
+        assert [good['name'] for good in response.data['results']] == [
+            'Товар 1', 'Товар 2',
+        ]
+        response = client_anon().get(
+            path=response.data['next'],
+        )
+        assert response.status_code == URL_STATUS_200
+        assert [good['name'] for good in response.data['results']] == [
+            'Товар 3',
+        ]
+        assert response.data['next'] is None
+        return
+
+    def test_get_goods_cursor_ordering(
+        self,
+        create_staff,
+        monkeypatch,
+    ) -> None:
+        """
+        Тест курсорной пагинации списка товаров с параметром ordering
+        и ее запрета для поиска.
+        """
+        monkeypatch.setattr(NameCursorPagination, 'page_size', 2)
+        response = client_anon().get(
+            path=f'{URL_GOODS_CURSOR}&ordering=-price',
+        )
+        assert response.status_code == URL_STATUS_200
+        names: list[str] = [good['name'] for good in response.data['results']]
+        response = client_anon().get(
+            path=response.data['next'],
+        )
+        names += [good['name'] for good in response.data['results']]
+        assert names == ['Товар 3', 'Товар 2', 'Товар 1'], (
+            'Убедитесь, что курсорная пагинация сохраняет сортировку '
+            'параметра ordering.'
+        )
+        response = client_anon().get(
+            path=f'{URL_GOODS_SEARCH}?q=товар&pagination=cursor',
+        )
+        assert response.status_code == URL_STATUS_400, (
+            'Убедитесь, что курсорная пагинация поиска отклоняется.'
+        )
+        return
+
+    @pytest.mark.parametrize(
+        'url', (
+            URL_CATEGORIES,
+            URL_GOODS,
+            f'{URL_GOODS}?category=2&ordering=-price',
+            URL_GOODS_CURSOR,
+            f'{URL_GOODS_SEARCH}?q=товар',
+            URL_SUBCATEGORIES,
+        )
+    )
+    def test_fast_serialization(self, create_staff, monkeypatch, url) -> None:
+        """
+        Тест совпадения ответов списков каталога, сформированных
+        упрощенными сериализаторами и сериализаторами DRF.
+        """
+        Category.objects.filter(id=2).update(image='categories/категория 2')
+        Subcategory.objects.filter(id=2).update(image='subcategories/sub-2')
+        Good.objects.filter(id=2).update(
+            image_large='goods/товар 2_l',
+            image_medium='goods/good-2_m',
+        )
+        client: APIClient = client_anon()
+        response_fast = client.get(path=url)
+        assert response_fast.status_code == URL_STATUS_200
+        cache.clear()
+        monkeypatch.setattr(
+            fast_serializers, 'CATALOG_FAST_SERIALIZATION', False,
+        )
+        response = client.get(path=url)
+        assert response.status_code == URL_STATUS_200
+        assert response_fast.content == response.content, (
+            f'Убедитесь, что ответ эндпоинта {url} не зависит '
+            'от способа сериализации.'
+        )
+        return
+
     def test_shopping_cart(self, create_staff) -> None:
         """
         Тест GET запроса на получение списка подкатегорий товаров.
@@ -302,6 +864,204 @@ class TestEndpoints():
         )
         return
 
+    def test_shopping_cart_upsert(self, create_staff) -> None:
+        """
+        Тест PUT, PATCH и DELETE запросов на изменение отдельных товаров
+        в корзине без ее полной замены.
+        """
+        client: APIClient = client_auth()
+        response = client.put(
+            path=f'{URL_SHOPPING_CART}1/',
+            data={'amount': 10},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_200
+        assert response.data['goods'] == [
+            {'good': 'Товар 1', 'price': 1, 'amount': 10},
+        ], ('Убедитесь, что PUT запрос добавляет товар в корзину.')
+        response = client.put(
+            path=f'{URL_SHOPPING_CART}1/',
+            data={'amount': 5},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_200
+        assert response.data['goods'] == [
+            {'good': 'Товар 1', 'price': 1, 'amount': 5},
+        ], ('Убедитесь, что PUT запрос изменяет количество товара.')
+        assert ShoppingCart.objects.count() == 1
+        response = client.patch(
+            path=URL_SHOPPING_CART_UPDATE,
+            data={
+                'goods': [
+                    {'good': 2, 'amount': 20},
+                    {'good': 3, 'amount': 30},
+                ],
+                'remove': [1],
+            },
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_200
+        assert response.data == {
+            'total_goods': 2,
+            'total_sum': 130,
+            'goods': [
+                {'good': 'Товар 2', 'price': 2, 'amount': 20},
+                {'good': 'Товар 3', 'price': 3, 'amount': 30},
+            ],
+        }, ('Убедитесь, что PATCH запрос изменяет только переданные товары.')
+        response = client.patch(
+            path=URL_SHOPPING_CART_UPDATE,
+            data={'goods': [{'good': 2, 'amount': 1}], 'remove': [2]},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_400
+        response = client.patch(
+            path=URL_SHOPPING_CART_UPDATE,
+            data={},
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_400
+        response = client.delete(path=f'{URL_SHOPPING_CART}3/')
+        assert response.status_code == URL_STATUS_204
+        response = client.get(path=URL_SHOPPING_CART)
+        assert response.data['goods'] == [
+            {'good': 'Товар 2', 'price': 2, 'amount': 20},
+        ], ('Убедитесь, что DELETE запрос удаляет товар из корзины.')
+        return
+
+    def test_shopping_cart_queries(self, create_staff) -> None:
+        """
+        Тест постоянного количества запросов к базе данных при изменении
+        корзины независимо от количества товаров.
+        """
+        client: APIClient = client_auth()
+        # INFO: первый запрос сохраняет пользователя JWT в кеш.
+        client.get(path=URL_SHOPPING_CART)
+        queries: list[int] = []
+        for goods_ids in ((1,), (1, 2, 3)):
+            with CaptureQueriesContext(connection) as context:
+                response = client.post(
+                    path=URL_SHOPPING_CART,
+                    data={
+                        'goods': [
+                            {'good': good_id, 'amount': 1}
+                            for good_id in goods_ids
+                        ],
+                    },
+                    format='json',
+                )
+            assert response.status_code == URL_STATUS_201
+            queries.append(len(context.captured_queries))
+        assert queries[0] == queries[1], (
+            'Убедитесь, что количество запросов эндпоинта '
+            f'{URL_SHOPPING_CART} не зависит от количества товаров.'
+        )
+        response = client.post(
+            path=URL_SHOPPING_CART,
+            data={
+                'goods': [
+                    {'good': 1, 'amount': 1},
+                    {'good': 99, 'amount': 1},
+                ],
+            },
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_400
+        assert response.data == {
+            'goods': [
+                {},
+                {
+                    'good': [
+                        'Недопустимый первичный ключ "99" - '
+                        'объект не существует.'
+                    ],
+                },
+            ],
+        }, ('Убедитесь, что несуществующие товары приводят к ошибке.')
+        response = client.post(
+            path=URL_SHOPPING_CART,
+            data={
+                'goods': [
+                    {'good': 99, 'amount': 1},
+                    {'good': 1, 'amount': 'много'},
+                ],
+            },
+            format='json',
+        )
+        assert response.status_code == URL_STATUS_400
+        assert response.data == {
+            'goods': [
+                {
+                    'good': [
+                        'Недопустимый первичный ключ "99" - '
+                        'объект не существует.'
+                    ],
+                },
+                {'amount': ['Введите правильное число.']},
+            ],
+        }, ('Убедитесь, что ошибки несуществующих товаров возвращаются '
+            'вместе с ошибками остальных полей.')
+        return
+
+    def test_shopping_cart_summary(self, create_staff) -> None:
+        """
+        Тест GET запроса на получение итогов корзины без списка товаров.
+        """
+        client: APIClient = client_auth()
+        response = client.get(path=f'{URL_SHOPPING_CART}?summary=1')
+        assert response.status_code == URL_STATUS_200
+        assert response.data == {'total_goods': 0, 'total_sum': 0}
+        client.post(
+            path=URL_SHOPPING_CART,
+            data={
+                'goods': [
+                    {'good': 1, 'amount': 10},
+                    {'good': 3, 'amount': 5},
+                ],
+            },
+            format='json',
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(path=f'{URL_SHOPPING_CART}?summary=1')
+        assert response.status_code == URL_STATUS_200
+        assert response.data == {'total_goods': 2, 'total_sum': 25}, (
+            'Убедитесь, что итоги корзины вычисляются корректно.'
+        )
+        assert sum(
+            1 for query in context.captured_queries
+            if 'goods_shoppingcart' in query['sql']
+        ) == 1, (
+            'Убедитесь, что итоги корзины вычисляются одним запросом.'
+        )
+        return
+
+    def test_auth_user_cache(self) -> None:
+        """
+        Тест получения пользователя аутентификации JWT из кеша
+        и сброса кеша при деактивации пользователя.
+        """
+        client: APIClient = client_auth()
+        url: str = f'{URL_SHOPPING_CART}?summary=1'
+        response = client.get(path=url)
+        assert response.status_code == URL_STATUS_200
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(path=url)
+        assert response.status_code == URL_STATUS_200
+        assert not any(
+            'auth_user' in query['sql'] for query in context.captured_queries
+        ), ('Убедитесь, что пользователь JWT получается из кеша.')
+        user: User = User.objects.get(username='auth_user')
+        assert set(cache.get(get_user_cache_key(user.id))) == {
+            'id', 'is_active', 'is_staff', 'is_superuser', 'password_hash',
+        }, ('Убедитесь, что в кеше не хранится хеш пароля пользователя.')
+        user.is_active = False
+        user.save()
+        response = client.get(path=url)
+        assert response.status_code == URL_STATUS_401, (
+            'Убедитесь, что кеш пользователя сбрасывается при его изменении.'
+        )
+        return
+
     def test_get_subcategories(self, create_staff) -> None:
         """
         Тест GET запроса на получение списка подкатегорий товаров.
@@ -376,3 +1136,79 @@ class TestEndpoints():
             'выводит информацию о подкатегориях товаров.'
         )
         return
+
+
+@pytest.mark.django_db(transaction=True)
+class TestShoppingCartConcurrency():
+    """
+    Производит тест одновременного изменения одной корзины.
+    """
+
+    # INFO: количество потоков и запросов каждого потока.
+    THREADS: int = 8
+    REQUESTS: int = 5
+
+    def test_shopping_cart_concurrent_writes(
+        self,
+        create_staff,
+        monkeypatch,
+    ) -> None:
+        """
+        Тест одновременных POST, PATCH и DELETE запросов к одной корзине:
+        все запросы должны быть выполнены без ошибок.
+        """
+        # INFO: в основных настройках ATOMIC_REQUESTS не используется.
+        monkeypatch.setitem(connection.settings_dict, 'ATOMIC_REQUESTS', False)
+        client: APIClient = client_auth()
+
+        def write_shopping_cart(num: int) -> list[int]:
+            statuses: list[int] = []
+            try:
+                for i in range(self.REQUESTS):
+                    good_id: int = (num + i) % 3 + 1
+                    statuses.append(
+                        client.post(
+                            path=URL_SHOPPING_CART,
+                            data={
+                                'goods': [
+                                    {'good': good_id, 'amount': num + 1},
+                                    {'good': good_id % 3 + 1, 'amount': 1},
+                                ],
+                            },
+                            format='json',
+                        ).status_code
+                    )
+                    statuses.append(
+                        client.patch(
+                            path=URL_SHOPPING_CART_UPDATE,
+                            data={
+                                'goods': [{'good': good_id, 'amount': i + 1}],
+                            },
+                            format='json',
+                        ).status_code
+                    )
+                    statuses.append(
+                        client.delete(
+                            path=f'{URL_SHOPPING_CART}{good_id}/',
+                        ).status_code
+                    )
+            finally:
+                connection.close()
+            return statuses
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            statuses: list[int] = [
+                status
+                for statuses in executor.map(
+                    write_shopping_cart, range(self.THREADS),
+                )
+                for status in statuses
+            ]
+        assert set(statuses) == {
+            URL_STATUS_200, URL_STATUS_201, URL_STATUS_204,
+        }, (
+            'Убедитесь, что одновременные изменения одной корзины '
+            'выполняются последовательно и без ошибок.'
+        )
+        assert ShoppingCart.objects.count() <= 2
+        return
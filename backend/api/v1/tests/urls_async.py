@@ -0,0 +1,11 @@
+from django.urls import include, path
+
+from api.v1.async_urls import urlpatterns_async
+from backend.urls import urlpatterns as urlpatterns_backend
+
+# INFO: маршруты проекта с асинхронными представлениями
+#       (как при API_ASYNC_VIEWS=True).
+urlpatterns = [
+    path('api/v1/', include(urlpatterns_async)),
+    *urlpatterns_backend,
+]
@@ -5,11 +5,13 @@ from drf_spectacular.views import (
 from rest_framework.routers import DefaultRouter
 from rest_framework.viewsets import ModelViewSet
 
+from api.v1.async_urls import urlpatterns_async
 from api.v1.views import (
     CategoryViewSet, CustomTokenObtainPairView, CustomTokenRefreshView,
     GoodViewSet, ShoppingCartViewSet, SubcategoryViewSet,
-    create_nums_row,
+    create_nums_row, get_database_pool_stats,
 )
+from backend.settings import API_ASYNC_VIEWS
 
 router = DefaultRouter()
 
@@ -39,8 +41,10 @@ urlpatterns_token = [
 ]
 
 urlpatterns = [
+    *(urlpatterns_async if API_ASYNC_VIEWS else []),
     path('', include(router.urls)),
     path('create-nums-row/', create_nums_row),
+    path('database-pool/', get_database_pool_stats),
     path('docs/', include(urlpatterns_docs)),
     path('auth/token/', include(urlpatterns_token)),
 ]
@@ -1,25 +1,50 @@
+from django.db.models import Count, Prefetch
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status
-from rest_framework.decorators import action, api_view
+from rest_framework.decorators import (
+    action, api_view, permission_classes,
+)
+from rest_framework.exceptions import ValidationError
 from rest_framework.viewsets import ModelViewSet
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import (
     TokenObtainPairView, TokenRefreshView,
 )
 
+from api.v1.caches import CatalogCacheMixin
+from api.v1.fast_serializers import (
+    CategoryFastSerializer, FastListMixin, GoodFastSerializer,
+    ShoppingCartFastSerializer, SubcategoryFastSerializer,
+)
+from api.v1.locks import lock_shopping_cart
+from api.v1.nums_row import (
+    NUMS_ROW_FORMAT_RUNS,
+    NumsRowStream,
+    check_nums_row_limits, create_nums_row_string_bounded,
+    generate_nums_row_runs,
+)
+from api.v1.paginations import PAGINATION_QUERY_PARAM, CursorPaginationMixin
 from api.v1.schemas import (
-    CATEGORIES_VIEW_SCHEMA, GOODS_VIEW_SCHEMA,
+    CATEGORIES_VIEW_SCHEMA, DATABASE_POOL_SCHEMA, GOODS_VIEW_SCHEMA,
     SHOPPING_CART_SCHEMA, SUBCATEGORIES_VIEW_SCHEMA,
     TOKEN_JWT_OBTAIN_SCHEMA, TOKEN_JWT_REFRESH_SCHEMA,
 )
 from api.v1.serializers import (
-    CategoryGetSerializer, GoodGetSerializer,
+    GOOD_ORDERING,
+    CategoryGetSerializer, CategoryTreeSerializer,
+    GoodFilterSerializer, GoodGetSerializer, GoodSearchSerializer,
     NumberSerializer,
-    ShoppingCartGetSerializer, ShoppingCartPostListSerializer,
+    ShoppingCartGetSerializer, ShoppingCartPatchListSerializer,
+    ShoppingCartPostListSerializer,
     SubcategoryGetSerializer,
 )
+from backend.postgresql_pool.pool import get_pools
+from backend.settings import NUMS_ROW_STREAM_MAX_ELEMENTS
+from backend.routers import CatalogReplicaMixin
 from goods.models import Category, Good, ShoppingCart, Subcategory
+from goods.search import search_goods
 
 
 # INFO: выбран метод POST, так как он точно не будет закеширован
@@ -29,21 +54,80 @@ def create_nums_row(request):
     """
     Функция, которая выводит n первых элементов последовательности
     122333444455555… (число повторяется столько раз, чему оно равно).
+
+    Параметры 'offset' и 'length' позволяют получить окно
+    последовательности без вычисления предшествующих элементов.
+
+    При переданном параметре 'stream' последовательность отдается
+    частями в виде text/plain, не собираясь целиком в памяти.
+
+    При значении параметра 'format' равном 'runs' последовательность
+    возвращается в виде серий [число, количество повторов].
+
+    Слишком большие запросы отклоняются с кодом 413, а длинные
+    последовательности вычисляются в пуле процессов: если пул занят
+    или не уложился в срок, возвращается 503. Потоковая передача
+    ограничена NUMS_ROW_STREAM_MAX_ELEMENTS элементами и числом
+    одновременных передач (503).
     """
     serializer = NumberSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     number: int = serializer.validated_data['number']
-    arith_progress: int = sum(i for i in range(number+1))
-    nums: list[int] = [None] * arith_progress
-    point: int = 0
-    for i in range(number+1):
-        j: int = 0
-        for j in range(i):
-            nums[point] = i
-            point += 1
-            j += 1
+    offset: int = serializer.validated_data['offset']
+    length: int | None = serializer.validated_data.get('length')
+    if serializer.validated_data['stream']:
+        check_nums_row_limits(
+            number=number,
+            offset=offset,
+            length=length,
+            max_elements=NUMS_ROW_STREAM_MAX_ELEMENTS,
+        )
+        return StreamingHttpResponse(
+            streaming_content=NumsRowStream(
+                number=number,
+                offset=offset,
+                length=length,
+            ),
+            content_type='text/plain; charset=utf-8',
+            status=status.HTTP_200_OK,
+        )
+    check_nums_row_limits(number=number, offset=offset, length=length)
+    if serializer.validated_data['format'] == NUMS_ROW_FORMAT_RUNS:
+        return Response(
+            status=status.HTTP_200_OK,
+            data={
+                "number_runs": list(
+                    generate_nums_row_runs(
+                        number=number,
+                        offset=offset,
+                        length=length,
+                    )
+                )
+            },
+        )
     data: dict[str, str] = {
-        "number_sequence": ''.join(map(str, nums))
+        "number_sequence": create_nums_row_string_bounded(
+            number=number,
+            offset=offset,
+            length=length,
+        )
+    }
+    return Response(
+        status=status.HTTP_200_OK,
+        data=data,
+    )
+
+
+@extend_schema(**DATABASE_POOL_SCHEMA)
+@api_view(http_method_names=('GET',))
+@permission_classes((IsAdminUser,))
+def get_database_pool_stats(request):
+    """
+    Функция, которая возвращает метрики пулов соединений с базой
+    данных текущего процесса (воркера) по псевдонимам баз данных.
+    """
+    data: dict[str, dict[str, int | float]] = {
+        alias: pool.get_stats() for alias, pool in get_pools().items()
     }
     return Response(
         status=status.HTTP_200_OK,
@@ -64,42 +148,170 @@ class CustomTokenRefreshView(TokenRefreshView):
 
 
 @extend_schema_view(**CATEGORIES_VIEW_SCHEMA)
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(
+    CatalogReplicaMixin,
+    CatalogCacheMixin,
+    FastListMixin,
+    ModelViewSet,
+):
     """Вью-сет для взаимодействия с моделью Category."""
 
     http_method_names = ('get',)
     serializer_class = CategoryGetSerializer
+    fast_serializer_class = CategoryFastSerializer
     queryset = Category.objects.all()
 
+    @action(
+        methods=('get',),
+        detail=False,
+        url_name='tree',
+        pagination_class=None,
+    )
+    def tree(self, request):
+        """
+        Возвращает все категории с вложенными подкатегориями
+        (двумя запросами к базе данных вне зависимости от их количества).
+
+        При параметре ?goods_count=1 для каждой подкатегории
+        выводится количество ее товаров.
+        """
+        return self.get_cached_response(self.get_tree_response)
+
+    def get_tree_response(self, request):
+        """Формирует ответ с деревом категорий для tree."""
+        goods_count: bool = (
+            request.query_params.get('goods_count') in ('1', 'true', 'True')
+        )
+        subcategories = Subcategory.objects.all()
+        if goods_count:
+            subcategories = subcategories.annotate(goods_count=Count('good'))
+        queryset = self.get_queryset().prefetch_related(
+            Prefetch('subcategory', queryset=subcategories),
+        )
+        serializer = CategoryTreeSerializer(
+            queryset,
+            many=True,
+            context={
+                **self.get_serializer_context(),
+                'goods_count': goods_count,
+            },
+        )
+        return Response(
+            data=serializer.data,
+            status=status.HTTP_200_OK,
+        )
+
 
 @extend_schema_view(**GOODS_VIEW_SCHEMA)
-class GoodViewSet(ModelViewSet):
-    """Вью-сет для взаимодействия с моделью Good."""
+class GoodViewSet(
+    CatalogReplicaMixin,
+    CatalogCacheMixin,
+    FastListMixin,
+    CursorPaginationMixin,
+    ModelViewSet,
+):
+    """
+    Вью-сет для взаимодействия с моделью Good.
+
+    Список товаров фильтруется параметрами запроса 'subcategory',
+    'category', 'price_min' и 'price_max' и сортируется параметром
+    'ordering' (name, price, -price). Те же фильтры применяются
+    к результатам поиска.
+    """
 
     http_method_names = ('get',)
     serializer_class = GoodGetSerializer
+    fast_serializer_class = GoodFastSerializer
     queryset = Good.objects.all().select_related('subcategory')
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in ('list', 'search'):
+            return queryset
+        serializer = GoodFilterSerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters: dict[str, int] = serializer.validated_data
+        if 'subcategory' in filters:
+            queryset = queryset.filter(subcategory_id=filters['subcategory'])
+        if 'category' in filters:
+            # INFO: фильтрация по подзапросу к Subcategory вместо JOIN:
+            #       товары выбираются по индексу subcategory_id.
+            queryset = queryset.filter(
+                subcategory_id__in=Subcategory.objects.filter(
+                    category_id=filters['category'],
+                ).values('id'),
+            )
+        if 'price_min' in filters:
+            queryset = queryset.filter(price__gte=filters['price_min'])
+        if 'price_max' in filters:
+            queryset = queryset.filter(price__lte=filters['price_max'])
+        if 'ordering' in filters:
+            queryset = queryset.order_by(*GOOD_ORDERING[filters['ordering']])
+        return queryset
+
+    @action(
+        methods=('get',),
+        detail=False,
+        url_name='search',
+    )
+    def search(self, request):
+        """
+        Возвращает список товаров, найденных по наименованию
+        (параметр ?q=), отсортированный по релевантности, а затем
+        по параметру 'ordering'.
+        """
+        return self.get_cached_response(self.get_search_response)
+
+    def get_cursor_ordering(self) -> tuple[str, ...]:
+        """Курсорная пагинация сохраняет сортировку параметра 'ordering'."""
+        ordering: tuple[str, ...] = GOOD_ORDERING.get(
+            self.request.query_params.get('ordering'),
+            GOOD_ORDERING['name'],
+        )
+        return (*ordering, 'id')
+
+    def get_search_response(self, request):
+        """Формирует ответ с результатами поиска для search."""
+        # INFO: позиция курсора не может быть построена по релевантности.
+        if self.is_cursor_pagination():
+            raise ValidationError(
+                {
+                    PAGINATION_QUERY_PARAM: [
+                        'Курсорная пагинация недоступна для поиска.'
+                    ]
+                }
+            )
+        serializer = GoodSearchSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return self.get_list_response(
+            search_goods(
+                queryset=self.get_queryset(),
+                query=serializer.validated_data['q'],
+            ),
+        )
+
 
 @extend_schema_view(**SHOPPING_CART_SCHEMA)
 class ShoppingCartViewSet(ModelViewSet):
-    """Вью-сет для взаимодействия с моделью ShoppingCart."""
+    """
+    Вью-сет для взаимодействия с моделью ShoppingCart.
+
+    Идентификатором строки корзины (pk) в URL служит id товара.
+    """
 
-    http_method_names = ('get', 'post',)
+    http_method_names = ('get', 'post', 'put', 'patch', 'delete',)
     permission_classes = (IsAuthenticated,)
     pagination_class = None
+    lookup_value_regex = r'\d+'
 
     def get_queryset(self):
-        return ShoppingCart.objects.filter(
-            user=self.request.user,
-        ).select_related(
-            'user',
-            'good'
-        )
+        return ShoppingCart.objects.filter(user_id=self.request.user.id)
 
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return ShoppingCartGetSerializer
+        if self.request.method in ('PATCH', 'PUT'):
+            return ShoppingCartPatchListSerializer
         return ShoppingCartPostListSerializer
 
     @extend_schema(exclude=True,)
@@ -107,29 +319,34 @@ class ShoppingCartViewSet(ModelViewSet):
         return Response(status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
     def list(self, request, *args, **kwargs):
+        """
+        Возвращает итоги корзины, вычисленные одним агрегирующим
+        запросом, и список товаров (только необходимые столбцы).
+
+        При параметре ?summary=1 возвращаются только итоги.
+        """
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        data: dict[str, any] = serializer.data
-        total_goods: int = len(data)
-        total_sum: int = sum(
-            item.get('price', 0) * item.get('amount', 0) for item in data
+        serializer = ShoppingCartFastSerializer(
+            context=self.get_serializer_context(),
         )
-        return Response(
-            data={
-                'total_goods': total_goods,
-                'total_sum': total_sum,
-                'goods': data
-            },
-            status=status.HTTP_200_OK,
+        data: dict[str, any] = queryset.aggregate(**serializer.get_totals())
+        if request.query_params.get('summary') in ('1', 'true', 'True'):
+            return Response(data=data, status=status.HTTP_200_OK)
+        data['goods'] = serializer.get_data(
+            queryset.values(*serializer.values),
         )
+        return Response(data=data, status=status.HTTP_200_OK)
 
     def create(self, request, *args, **kwargs):
         data: dict[str, any] = request.data
         data['user'] = self.request.user.id
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        ShoppingCart.objects.filter(user=self.request.user).delete()
-        self.perform_create(serializer)
+        with lock_shopping_cart(user_id=self.request.user.id):
+            ShoppingCart.objects.filter(
+                user_id=self.request.user.id,
+            ).delete()
+            self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
         return Response(
             data=serializer.data,
@@ -137,6 +354,55 @@ class ShoppingCartViewSet(ModelViewSet):
             headers=headers,
         )
 
+    def update(self, request, *args, **kwargs):
+        """
+        Добавляет товар в корзину или изменяет его количество
+        одним запросом к базе данных.
+        """
+        serializer = self.get_serializer(
+            data={
+                'user': request.user.id,
+                'goods': [
+                    {
+                        'good': kwargs[self.lookup_field],
+                        'amount': request.data.get('amount'),
+                    },
+                ],
+            },
+        )
+        serializer.is_valid(raise_exception=True)
+        with lock_shopping_cart(user_id=request.user.id):
+            serializer.save()
+            return self.list(request)
+
+    def destroy(self, request, *args, **kwargs):
+        """Удаляет товар из корзины."""
+        with lock_shopping_cart(user_id=request.user.id):
+            ShoppingCart.objects.filter(
+                user_id=request.user.id,
+                good_id=kwargs[self.lookup_field],
+            ).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(
+        methods=('patch',),
+        detail=False,
+        url_name='update-shopping-cart',
+    )
+    def update_shopping_cart(self, request):
+        """
+        Изменяет корзину без ее полной замены: товары из 'goods'
+        добавляются или изменяют количество, товары из 'remove'
+        удаляются.
+        """
+        data: dict[str, any] = request.data
+        data['user'] = request.user.id
+        serializer = self.get_serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        with lock_shopping_cart(user_id=request.user.id):
+            serializer.save()
+            return self.list(request)
+
     @action(
         methods=('post',),
         detail=False,
@@ -144,14 +410,22 @@ class ShoppingCartViewSet(ModelViewSet):
     )
     def clear_shopping_cart(self, request):
         """Очищает пользовательскую корзину с покупками."""
-        ShoppingCart.objects.filter(user=request.user).delete()
+        with lock_shopping_cart(user_id=request.user.id):
+            ShoppingCart.objects.filter(user_id=request.user.id).delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 @extend_schema_view(**SUBCATEGORIES_VIEW_SCHEMA)
-class SubcategoryViewSet(ModelViewSet):
+class SubcategoryViewSet(
+    CatalogReplicaMixin,
+    CatalogCacheMixin,
+    FastListMixin,
+    CursorPaginationMixin,
+    ModelViewSet,
+):
     """Вью-сет для взаимодействия с моделью Subcategory."""
 
     http_method_names = ('get',)
     serializer_class = SubcategoryGetSerializer
+    fast_serializer_class = SubcategoryFastSerializer
     queryset = Subcategory.objects.all().select_related('category')
@@ -0,0 +1,115 @@
+"""
+Бэкенд PostgreSQL с пулом соединений внутри процесса.
+
+Соединение, открытое Django, берется из пула, а при закрытии
+(в конце запроса, так как CONN_MAX_AGE=0) возвращается в пул
+вместо разрыва. Настройки пула задаются в DATABASES['POOL'].
+"""
+
+from django.db.backends.postgresql.base import (
+    DatabaseWrapper as PostgreSQLDatabaseWrapper,
+)
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from backend.postgresql_pool.pool import ConnectionPool, PoolTimeout, get_pool
+
+
+class DatabaseWrapper(PostgreSQLDatabaseWrapper):
+
+    pool: ConnectionPool | None = None
+
+    def get_pool(self, conn_params: dict[str, any]) -> ConnectionPool:
+        """Возвращает пул соединений с параметрами conn_params."""
+        self.pool = get_pool(
+            alias=self.alias,
+            key=tuple(sorted((k, str(v)) for k, v in conn_params.items())),
+            **self.settings_dict.get('POOL', {}),
+        )
+        return self.pool
+
+    def fill_pool(self) -> None:
+        """Открывает min_size соединений пула (см. ConnectionPool.fill)."""
+        conn_params: dict[str, any] = self.get_connection_params()
+        with self.wrap_database_errors:
+            self.get_pool(conn_params=conn_params).fill(
+                connect=lambda: super(
+                    DatabaseWrapper, self,
+                ).get_new_connection(conn_params),
+            )
+        return
+
+    def get_new_connection(self, conn_params: dict[str, any]):
+        self.get_pool(conn_params=conn_params)
+        try:
+            connection, created = self.pool.get(
+                connect=lambda: super(
+                    DatabaseWrapper, self,
+                ).get_new_connection(conn_params),
+                is_usable=self.is_pooled_connection_usable,
+                close=self.close_pooled_connection,
+            )
+        except PoolTimeout as error:
+            raise self.Database.OperationalError(str(error)) from error
+        if not created:
+            # INFO: как и в родительском методе, уровень изоляции
+            #       должен быть задан до включения autocommit.
+            self.isolation_level = IsolationLevel(
+                self.settings_dict['OPTIONS'].get(
+                    'isolation_level', IsolationLevel.READ_COMMITTED,
+                ),
+            )
+        return connection
+
+    def _close(self) -> None:
+        if self.connection is None:
+            return
+        if self.pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            self.pool.put(
+                connection=self.connection,
+                reset=self.reset_pooled_connection,
+                close=self.close_pooled_connection,
+            )
+        return
+
+    def is_pooled_connection_usable(self, connection) -> bool:
+        """
+        Проверяет соединение перед выдачей из пула: при включенном
+        CONN_HEALTH_CHECKS выполняет запрос к базе данных.
+        """
+        if connection.closed:
+            return False
+        if not self.settings_dict['CONN_HEALTH_CHECKS']:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            # INFO: запрос мог начать транзакцию (autocommit выключен).
+            connection.rollback()
+        except self.Database.Error:
+            return False
+        return True
+
+    def reset_pooled_connection(self, connection) -> bool:
+        """
+        Готовит соединение к возврату в пул: откатывает незавершенную
+        транзакцию. Возвращает False, если соединение непригодно.
+        """
+        if connection.closed:
+            return False
+        try:
+            status: int = connection.info.transaction_status
+            if status == self.Database.extensions.TRANSACTION_STATUS_UNKNOWN:
+                return False
+            if status != self.Database.extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+        except self.Database.Error:
+            return False
+        return True
+
+    @staticmethod
+    def close_pooled_connection(connection) -> None:
+        """Закрывает соединение, удаленное из пула."""
+        connection.close()
+        return
@@ -0,0 +1,290 @@
+from collections import deque
+import os
+from threading import Condition, Lock
+import time
+from typing import Callable
+
+
+class PoolTimeout(Exception):
+    """Свободное соединение не получено за время ожидания."""
+
+
+class ConnectionPool:
+    """
+    Пул соединений с базой данных внутри процесса (потокобезопасный).
+
+    Открывает не более max_size соединений. Если все они заняты,
+    запрос соединения ожидает его возврата не дольше timeout секунд.
+    Возвращенные соединения сверх min_size закрываются, если они
+    не использовались дольше max_idle секунд. Пул не открывает
+    min_size соединений сам: их открывает вызов fill.
+
+    Пул не зависит от драйвера базы данных: открытие, проверка
+    и закрытие соединений передаются вызывающим кодом.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 2,
+        max_size: int = 10,
+        timeout: float = 5.0,
+        max_idle: float = 300.0,
+    ) -> None:
+        self.min_size: int = min_size
+        self.max_size: int = max(max_size, 1)
+        self.timeout: float = timeout
+        self.max_idle: float = max_idle
+        self._condition: Condition = Condition()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Сбрасывает состояние пула (в том числе после fork)."""
+        self.pid: int = os.getpid()
+        # INFO: свободные соединения и время их возврата в пул,
+        #       справа - последние возвращенные.
+        self._idle: deque[tuple[any, float]] = deque()
+        self._size: int = 0
+        self._stats: dict[str, int | float] = {
+            'requests': 0,
+            'created': 0,
+            'closed': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'exhausted': 0,
+        }
+        return
+
+    def _check_fork(self) -> None:
+        """
+        Забывает соединения родительского процесса: их нельзя
+        использовать и нельзя закрывать в дочернем процессе.
+        """
+        if self.pid != os.getpid():
+            self._condition = Condition()
+            self._reset()
+        return
+
+    def _record_wait(self, start: float) -> None:
+        wait_time: float = time.monotonic() - start
+        self._stats['waits'] += 1
+        self._stats['wait_time_total'] += wait_time
+        self._stats['wait_time_max'] = max(
+            self._stats['wait_time_max'], wait_time,
+        )
+        return
+
+    def _pop_expired(self) -> list[any]:
+        """Извлекает из пула соединения сверх min_size, простаивающие дольше max_idle."""  # noqa (E501)
+        expired: list[any] = []
+        deadline: float = time.monotonic() - self.max_idle
+        while (
+            self._idle
+            and self._size > self.min_size
+            and self._idle[0][1] <= deadline
+        ):
+            expired.append(self._idle.popleft()[0])
+            self._size -= 1
+        return expired
+
+    def _close(self, connections: list[any], close: Callable) -> None:
+        for connection in connections:
+            try:
+                close(connection)
+            except Exception:
+                pass
+            with self._condition:
+                self._stats['closed'] += 1
+        return
+
+    def get(
+        self,
+        connect: Callable[[], any],
+        is_usable: Callable[[any], bool],
+        close: Callable[[any], None],
+    ) -> tuple[any, bool]:
+        """
+        Возвращает соединение из пула и признак того, что оно
+        было открыто вызовом connect.
+
+        Если пул исчерпан дольше timeout секунд, вызывает PoolTimeout.
+        """
+        self._check_fork()
+        start: float = time.monotonic()
+        waited: bool = False
+        with self._condition:
+            self._stats['requests'] += 1
+        while True:
+            connection: any = None
+            with self._condition:
+                while not self._idle and self._size >= self.max_size:
+                    remaining: float = start + self.timeout - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['exhausted'] += 1
+                        self._record_wait(start)
+                        raise PoolTimeout(
+                            f'Все соединения пула ({self.max_size}) заняты '
+                            f'дольше {self.timeout} с.'
+                        )
+                    waited = True
+                    self._condition.wait(remaining)
+                if self._idle:
+                    connection = self._idle.pop()[0]
+                else:
+                    self._size += 1
+            if connection is None:
+                break
+            # INFO: проверка соединения (запрос к базе данных) выполняется
+            #       без блокировки пула, чтобы не задерживать другие потоки.
+            if is_usable(connection):
+                if waited:
+                    with self._condition:
+                        self._record_wait(start)
+                return connection, False
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            self._close(connections=[connection], close=close)
+        if waited:
+            with self._condition:
+                self._record_wait(start)
+        return self._connect(connect=connect), True
+
+    def _connect(self, connect: Callable[[], any]) -> any:
+        """
+        Открывает соединение на место, уже зарезервированное в _size.
+        При ошибке освобождает место.
+        """
+        try:
+            connection = connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._stats['created'] += 1
+        return connection
+
+    def fill(self, connect: Callable[[], any]) -> None:
+        """
+        Открывает свободные соединения, пока в пуле не станет min_size
+        соединений (например, в воркере до приема запросов).
+        """
+        self._check_fork()
+        while True:
+            with self._condition:
+                if self._size >= min(self.min_size, self.max_size):
+                    break
+                self._size += 1
+            connection = self._connect(connect=connect)
+            with self._condition:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+        return
+
+    def put(
+        self,
+        connection: any,
+        reset: Callable[[any], bool],
+        close: Callable[[any], None],
+    ) -> None:
+        """
+        Возвращает соединение в пул. Соединение, которое не удалось
+        подготовить к повторному использованию (reset вернул False),
+        закрывается.
+        """
+        if self.pid != os.getpid():
+            return
+        usable: bool = reset(connection)
+        with self._condition:
+            if usable:
+                self._idle.append((connection, time.monotonic()))
+                expired: list[any] = self._pop_expired()
+            else:
+                self._size -= 1
+                expired = [connection]
+            self._condition.notify()
+        self._close(connections=expired, close=close)
+        return
+
+    def close_idle(self, close: Callable[[any], None]) -> None:
+        """Закрывает все свободные соединения пула."""
+        self._check_fork()
+        with self._condition:
+            idle: list[any] = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        self._close(connections=idle, close=close)
+        return
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Возвращает метрики пула:
+            - size, idle, in_use: открытые, свободные и занятые соединения
+            - requests, created, closed: запросы и открытые/закрытые
+              соединения
+            - waits, wait_time_total, wait_time_max: запросы, ожидавшие
+              соединение, и время ожидания (в секундах)
+            - exhausted: запросы, не получившие соединение за timeout
+        """
+        self._check_fork()
+        with self._condition:
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                **self._stats,
+            }
+
+
+# INFO: пулы соединений процесса по псевдонимам баз данных.
+_pools: dict[str, tuple[tuple, ConnectionPool]] = {}
+_pools_lock: Lock = Lock()
+
+
+def get_pool(alias: str, key: tuple, **options) -> ConnectionPool:
+    """
+    Возвращает пул соединений базы данных alias. Если параметры
+    подключения key изменились (например, при создании тестовой
+    базы данных), пул создается заново.
+    """
+    with _pools_lock:
+        pool_key, pool = _pools.get(alias, (None, None))
+        if pool is None or pool_key != key:
+            pool = ConnectionPool(**options)
+            _pools[alias] = (key, pool)
+    return pool
+
+
+def get_pools() -> dict[str, ConnectionPool]:
+    """Возвращает пулы соединений процесса по псевдонимам баз данных."""
+    with _pools_lock:
+        return {alias: pool for alias, (_, pool) in _pools.items()}
+
+
+def fill_pools() -> None:
+    """
+    Открывает min_size соединений пулов всех баз данных с бэкендом
+    backend.postgresql_pool (например, в воркере gunicorn до приема
+    запросов: соединения пула доступны всем потокам воркера).
+    """
+    from django.db import connections
+    for alias in connections:
+        connection = connections[alias]
+        if hasattr(connection, 'fill_pool'):
+            connection.fill_pool()
+    return
+
+
+def close_pools() -> None:
+    """
+    Закрывает свободные соединения всех пулов процесса
+    (например, в главном процессе gunicorn перед созданием воркеров).
+    """
+    for pool in get_pools().values():
+        pool.close_idle(close=lambda connection: connection.close())
+    return
@@ -0,0 +1,135 @@
+"""
+Маршрутизация запросов к базам данных.
+
+Чтение моделей каталога (Category, Subcategory, Good) представлениями
+каталога выполняется из реплик DB_REPLICAS, все остальные запросы
+(в том числе корзина и любые изменения) - из основной базы данных.
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from itertools import cycle
+from typing import AsyncIterator, Iterator
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+from backend.settings import DB_REPLICA_STICKY_TIMEOUT, DB_REPLICAS
+
+# INFO: модели, которые представления каталога читают из реплик.
+CATALOG_REPLICA_MODELS: tuple[str, ...] = (
+    'goods.category',
+    'goods.good',
+    'goods.subcategory',
+)
+
+CATALOG_REPLICA_STICKY_CACHE_KEY: str = 'db:replica:sticky'
+
+# INFO: псевдоним реплики, выбранной для чтения каталога в текущем
+#       запросе (None - чтение из основной базы данных).
+catalog_replica: ContextVar[str | None] = ContextVar(
+    'catalog_replica', default=None,
+)
+
+
+def get_replica_sequence(weights: dict[str, int]) -> list[str]:
+    """
+    Возвращает цикл выбора реплик по алгоритму smooth weighted
+    round-robin: каждая реплика встречается в цикле столько раз,
+    каков ее вес, при этом реплики чередуются равномерно.
+    """
+    weights = {alias: weight for alias, weight in weights.items() if weight}
+    total: int = sum(weights.values())
+    current: dict[str, int] = dict.fromkeys(weights, 0)
+    sequence: list[str] = []
+    for _ in range(total):
+        for alias, weight in weights.items():
+            current[alias] += weight
+        alias = max(current, key=current.get)
+        current[alias] -= total
+        sequence.append(alias)
+    return sequence
+
+
+replica_cycle: Iterator[str] | None = (
+    cycle(get_replica_sequence(DB_REPLICAS)) if any(DB_REPLICAS.values())
+    else None
+)
+
+
+def pin_primary() -> None:
+    """
+    Направляет чтение каталога в основную базу данных на время
+    DB_REPLICA_STICKY_TIMEOUT (после изменения каталога).
+    """
+    if replica_cycle is not None:
+        cache.set(
+            CATALOG_REPLICA_STICKY_CACHE_KEY, True, DB_REPLICA_STICKY_TIMEOUT,
+        )
+    return
+
+
+def choose_replica(pinned: bool) -> str | None:
+    """Возвращает следующую реплику или None, если чтение из реплик невозможно."""  # noqa (E501)
+    if replica_cycle is None or pinned:
+        return None
+    return next(replica_cycle)
+
+
+@contextmanager
+def use_catalog_replica() -> Iterator[str | None]:
+    """Направляет чтение каталога внутри блока в одну из реплик."""
+    pinned: bool = (
+        replica_cycle is not None
+        and cache.get(CATALOG_REPLICA_STICKY_CACHE_KEY, False)
+    )
+    token = catalog_replica.set(choose_replica(pinned=pinned))
+    try:
+        yield catalog_replica.get()
+    finally:
+        catalog_replica.reset(token)
+
+
+@asynccontextmanager
+async def ause_catalog_replica() -> AsyncIterator[str | None]:
+    """Асинхронная версия use_catalog_replica."""
+    pinned: bool = (
+        replica_cycle is not None
+        and await cache.aget(CATALOG_REPLICA_STICKY_CACHE_KEY, False)
+    )
+    token = catalog_replica.set(choose_replica(pinned=pinned))
+    try:
+        yield catalog_replica.get()
+    finally:
+        catalog_replica.reset(token)
+
+
+class CatalogReplicaMixin:
+    """Миксин представления каталога, которое читает данные из реплик."""
+
+    def dispatch(self, request, *args, **kwargs):
+        with use_catalog_replica():
+            return super().dispatch(request, *args, **kwargs)
+
+
+class ReplicaRouter:
+    """
+    Роутер баз данных: чтение моделей каталога в блоке
+    use_catalog_replica выполняется из выбранной реплики,
+    запись - всегда в основную базу данных.
+    """
+
+    def db_for_read(self, model: type[Model], **hints) -> str | None:
+        if model._meta.label_lower in CATALOG_REPLICA_MODELS:
+            return catalog_replica.get()
+        return None
+
+    def db_for_write(self, model: type[Model], **hints) -> str:
+        # INFO: объекты, прочитанные из реплики, сохраняются
+        #       в основную базу данных.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints) -> bool:
+        # INFO: реплики содержат те же данные, что и основная база данных.
+        return True
@@ -21,6 +21,18 @@ if DEBUG == 'True':
 else:
     DEBUG = False
 
+# INFO: браузерная версия API (BrowsableAPIRenderer) доступна
+#       только в режиме отладки.
+BROWSABLE_API = DEBUG
+
+# INFO: асинхронные представления каталога и корзины (api.v1.async_views)
+#       для запуска на сервере ASGI (SERVER_WORKER=asgi).
+API_ASYNC_VIEWS = os.getenv('API_ASYNC_VIEWS')
+if API_ASYNC_VIEWS == 'True':
+    API_ASYNC_VIEWS = True
+else:
+    API_ASYNC_VIEWS = False
+
 DEBUG_DATABASE = os.getenv('DEBUG_DATABASE')
 if DEBUG_DATABASE == 'True':
     DEBUG_DATABASE = True
@@ -38,14 +50,49 @@ DB_NAME = os.getenv('POSTGRES_DB')
 DB_USER = os.getenv('POSTGRES_USER')
 DB_PASSWORD = os.getenv('POSTGRES_PASSWORD')
 
+# INFO: время жизни постоянного соединения воркера (в секундах),
+#       0 - соединение закрывается после каждого запроса.
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', 60))
+
+# INFO: проверка постоянного соединения перед первым запросом
+#       к базе данных в каждом HTTP запросе.
+DB_CONN_HEALTH_CHECKS = os.getenv('DB_CONN_HEALTH_CHECKS', 'True')
+if DB_CONN_HEALTH_CHECKS == 'True':
+    DB_CONN_HEALTH_CHECKS = True
+else:
+    DB_CONN_HEALTH_CHECKS = False
+
+# INFO: пул соединений воркера (backend.postgresql_pool), общий для его
+#       потоков. Рекомендуется для SERVER_WORKER=asgi, где постоянные
+#       соединения CONN_MAX_AGE привязаны к потокам и не переиспользуются.
+DB_POOL = os.getenv('DB_POOL')
+if DB_POOL == 'True':
+    DB_POOL = True
+else:
+    DB_POOL = False
+
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 2))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 5))
+DB_POOL_MAX_IDLE = float(os.getenv('DB_POOL_MAX_IDLE', 300))
+
 DATABASE_POSTGRESQL = {
     'default': {
-        'ENGINE': DB_ENGINE,
+        'ENGINE': 'backend.postgresql_pool' if DB_POOL else DB_ENGINE,
         'NAME': DB_NAME,
         'USER': DB_USER,
         'PASSWORD': DB_PASSWORD,
         'HOST': DB_HOST,
         'PORT': DB_PORT,
+        # INFO: с пулом соединение возвращается в пул после запроса.
+        'CONN_MAX_AGE': 0 if DB_POOL else DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+        'POOL': {
+            'min_size': DB_POOL_MIN_SIZE,
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': DB_POOL_TIMEOUT,
+            'max_idle': DB_POOL_MAX_IDLE,
+        },
     }
 }
 
@@ -58,6 +105,48 @@ DATABASE_SQLITE = {
 
 DATABASES = DATABASE_SQLITE if DEBUG_DATABASE else DATABASE_POSTGRESQL
 
+# INFO: реплики для чтения каталога (backend.routers): хосты PostgreSQL
+#       (при DEBUG_DATABASE - файлы SQLite в BASE_DIR) через запятую,
+#       вес реплики указывается после '*', например: replica_1*2,replica_2.
+#       Реплики получают псевдонимы replica_1, replica_2 и т.д.
+DB_REPLICAS: dict[str, int] = {}
+for num, replica in enumerate(
+    filter(None, os.getenv('DB_REPLICAS', '').replace(' ', '').split(',')),
+    start=1,
+):
+    replica_host, _, replica_weight = replica.partition('*')
+    DB_REPLICAS[f'replica_{num}'] = int(replica_weight or 1)
+    DATABASES[f'replica_{num}'] = {
+        **DATABASES['default'],
+        **(
+            {'NAME': BASE_DIR / replica_host} if DEBUG_DATABASE
+            else {'HOST': replica_host}
+        ),
+    }
+
+# INFO: время (в секундах), в течение которого каталог читается из основной
+#       базы данных после его изменения (реплики могут отставать).
+DB_REPLICA_STICKY_TIMEOUT = float(os.getenv('DB_REPLICA_STICKY_TIMEOUT', 5))
+
+DATABASE_ROUTERS = ['backend.routers.ReplicaRouter']
+
+# INFO: кеш каталога и его версия, окно чтения из основной базы данных
+#       после изменений (backend.routers) и кеш пользователей JWT должны
+#       быть общими для всех воркеров: при нескольких воркерах нужен Redis
+#       или Memcached. LocMemCache (только один воркер) - для разработки
+#       и тестов, gunicorn.conf.py не запускает с ним несколько воркеров.
+CACHE_BACKEND = os.getenv(
+    'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache',
+)
+CACHE_LOCATION = os.getenv('CACHE_LOCATION', 'saraphan')
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': CACHE_LOCATION,
+    }
+}
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 INSTALLED_APPS = [
@@ -68,6 +157,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third party
     'drf_spectacular',
     'rest_framework',
@@ -81,7 +171,19 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        *(
+            ['rest_framework.renderers.BrowsableAPIRenderer']
+            if BROWSABLE_API else []
+        ),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
@@ -100,6 +202,8 @@ ROOT_URLCONF = 'backend.urls'
 
 WSGI_APPLICATION = 'backend.wsgi.application'
 
+ASGI_APPLICATION = 'backend.asgi.application'
+
 
 """Models settings."""
 
@@ -111,6 +215,19 @@ CATEGORY_NAME_MAX_LEN: int = 30
 CATEGORY_SLUG_MAX_LEN: int = 30
 
 GOOD_IMAGE_PATH: str = 'goods/'
+# INFO: изображения Good (L, M, S) формируются из исходного изображения
+#       в фоновом потоке (goods.images) с уменьшением до размеров
+#       (ширина, высота) с сохранением пропорций.
+GOOD_IMAGE_SIZES: dict[str, tuple[int, int]] = {
+    'image_large': (1200, 1200),
+    'image_medium': (600, 600),
+    'image_small': (200, 200),
+}
+# INFO: WEBP или JPEG (прогрессивный).
+GOOD_IMAGE_FORMAT: str = 'WEBP'
+GOOD_IMAGE_QUALITY: int = 85
+GOOD_IMAGE_WORKERS: int = 1
+GOOD_SEARCH_QUERY_MAX_LEN: int = 100
 
 SHOPPING_CART_MIN_AMOUNT: int = 1
 
@@ -119,29 +236,119 @@ SUBCATEGORY_NAME_MAX_LEN: int = 30
 SUBCATEGORY_SLUG_MAX_LEN: int = 30
 
 
+# INFO: итоговое имя файла формирует хранилище по хешу его содержимого
+#       (backend.storages), из названия используется только расширение.
+
+
+def get_image_extension(filename: str) -> str:
+    """Возвращает расширение файла в нижнем регистре (с точкой)."""
+    return os.path.splitext(filename)[1].lower()
+
+
 def set_category_image_name(instance, filename) -> str:
     """Формирует название имени файла изображения для Category."""
-    return f'{CATEGORY_IMAGE_PATH}{instance.slug}'
+    return (
+        f'{CATEGORY_IMAGE_PATH}{instance.slug}'
+        f'{get_image_extension(filename)}'
+    )
+
+
+def set_good_image_name(instance, filename) -> str:
+    """Формирует название имени файла исходного изображения для Good."""
+    return f'{GOOD_IMAGE_PATH}{instance.slug}{get_image_extension(filename)}'
 
 
 def set_good_image_l_name(instance, filename) -> str:
     """Формирует название имени файла изображения (L) для Good."""
-    return f'{GOOD_IMAGE_PATH}{instance.slug}_l'
+    return (
+        f'{GOOD_IMAGE_PATH}{instance.slug}_l{get_image_extension(filename)}'
+    )
 
 
 def set_good_image_m_name(instance, filename) -> str:
     """Формирует название имени файла изображения (M) для Good."""
-    return f'{GOOD_IMAGE_PATH}{instance.slug}_m'
+    return (
+        f'{GOOD_IMAGE_PATH}{instance.slug}_m{get_image_extension(filename)}'
+    )
 
 
 def set_good_image_s_name(instance, filename) -> str:
     """Формирует название имени файла изображения (S) для Good."""
-    return f'{GOOD_IMAGE_PATH}{instance.slug}_s'
+    return (
+        f'{GOOD_IMAGE_PATH}{instance.slug}_s{get_image_extension(filename)}'
+    )
 
 
 def set_subcategory_image_name(instance, filename) -> str:
     """Формирует название имени файла изображения для Subcategory."""
-    return f'{SUBCATEGORY_IMAGE_PATH}{instance.slug}'
+    return (
+        f'{SUBCATEGORY_IMAGE_PATH}{instance.slug}'
+        f'{get_image_extension(filename)}'
+    )
+
+
+"""Catalog settings."""
+
+
+# INFO: списки каталога формируются упрощенными сериализаторами
+#       (api.v1.fast_serializers) напрямую из queryset.values().
+CATALOG_FAST_SERIALIZATION: bool = True
+
+
+# INFO: время хранения ответов эндпоинтов каталога в кеше (в секундах).
+#       Кеш сбрасывается при любом изменении Category, Subcategory и Good.
+CATALOG_CACHE_TIMEOUT: int = 60 * 60
+
+# INFO: время, в течение которого запросы ждут, пока один из них
+#       вычислит отсутствующий в кеше ответ (в секундах).
+CATALOG_CACHE_LOCK_TIMEOUT: float = 5.0
+CATALOG_CACHE_LOCK_POLL_INTERVAL: float = 0.05
+
+
+"""Nums row settings."""
+
+
+# INFO: максимальная длина (в символах) одной части последовательности
+#       при потоковой передаче ответа create_nums_row.
+NUMS_ROW_STREAM_CHUNK_SIZE: int = 64 * 1024
+
+# INFO: потоковая передача выполняется в потоке воркера (без пула
+#       процессов) и занимает его, пока клиент читает ответ, поэтому
+#       ограничена меньшим числом элементов и NUMS_ROW_STREAM_WORKERS
+#       одновременными передачами на процесс (иначе - 413 и 503).
+NUMS_ROW_STREAM_MAX_ELEMENTS: int = 10_000_000
+NUMS_ROW_STREAM_WORKERS: int = 1
+
+# INFO: ограничения на размер запроса к create_nums_row:
+#       при их превышении возвращается 413.
+NUMS_ROW_MAX_NUMBER: int = 1_000_000
+NUMS_ROW_MAX_ELEMENTS: int = 50_000_000
+
+# INFO: окна последовательности длиннее NUMS_ROW_POOL_THRESHOLD элементов
+#       вычисляются в отдельном пуле процессов, чтобы не блокировать
+#       воркер. Если пул занят или вычисление не уложилось
+#       в NUMS_ROW_POOL_TIMEOUT секунд, возвращается 503.
+#       Результат передается из пула в воркер целиком (pickle), что для
+#       окон близких к NUMS_ROW_MAX_ELEMENTS означает копирование сотен
+#       мегабайт: для таких окон следует использовать параметр 'stream'.
+#       Пул создается в каждом воркере gunicorn (GUNICORN_WORKERS),
+#       поэтому ядра делятся между воркерами (не менее одного процесса).
+NUMS_ROW_POOL_THRESHOLD: int = 1_000_000
+NUMS_ROW_POOL_TIMEOUT: float = 10.0
+NUMS_ROW_POOL_WORKERS: int = max(
+    1,
+    (os.cpu_count() or 1) // int(
+        os.getenv('GUNICORN_WORKERS', (os.cpu_count() or 1) * 2 + 1),
+    ),
+)
+
+# INFO: кеш внутри процесса хранит одну самую длинную последовательность
+#       create_nums_row размером не более NUMS_ROW_CACHE_MAX_BYTES.
+#       Если задан NUMS_ROW_CACHE_ALIAS, последовательности дополнительно
+#       сохраняются в одноименный кеш Django, общий для всех воркеров.
+NUMS_ROW_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+NUMS_ROW_CACHE_ALIAS: str | None = None
+NUMS_ROW_CACHE_TIMEOUT: int = 60 * 60
 
 
 """Static files settings."""
@@ -151,6 +358,55 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 MEDIA_URL = 'media/'
 
+# INFO: загруженные файлы хранятся в MEDIA_HASHED_PATH под именем из хеша
+#       содержимого: одинаковые файлы сохраняются один раз, а измененный
+#       файл получает новый URL, поэтому gateway отдает их с заголовком
+#       Cache-Control: immutable.
+MEDIA_HASHED_PATH: str = 'h/'
+MEDIA_HASH_LENGTH: int = 32
+
+# INFO: файлы, на которые не ссылаются модели, удаляет команда
+#       collect_media_garbage, если они не изменялись дольше
+#       MEDIA_GC_GRACE_PERIOD секунд (файл мог быть сохранен
+#       еще не зафиксированной транзакцией).
+MEDIA_GC_PATHS: tuple[str, ...] = (
+    MEDIA_HASHED_PATH,
+    CATEGORY_IMAGE_PATH,
+    GOOD_IMAGE_PATH,
+    SUBCATEGORY_IMAGE_PATH,
+)
+MEDIA_GC_GRACE_PERIOD: int = 60 * 60
+
+# INFO: уменьшенные копии изображений /media/r/<ширина>x<высота>/<файл>
+#       формируются по запросу только для размеров MEDIA_RESIZE_SIZES
+#       и сохраняются в MEDIA_RESIZE_PATH, откуда их затем отдает gateway.
+MEDIA_RESIZE_PATH: str = 'r/'
+MEDIA_RESIZE_SIZES: tuple[tuple[int, int], ...] = (
+    (100, 100),
+    (200, 200),
+    (400, 400),
+    (800, 800),
+)
+# INFO: форматы в порядке предпочтения: используется первый, указанный
+#       клиентом в Accept и поддерживаемый Pillow, иначе JPEG.
+MEDIA_RESIZE_FORMATS: tuple[str, ...] = ('AVIF', 'WEBP')
+MEDIA_RESIZE_QUALITY: int = 80
+# INFO: воркер формирует не более MEDIA_RESIZE_WORKERS изображений
+#       одновременно, остальные запросы сразу получают 503. Слотов
+#       меньше, чем потоков воркера gunicorn (GUNICORN_THREADS),
+#       чтобы уменьшение изображений не занимало все потоки.
+GUNICORN_THREADS: int = int(os.getenv('GUNICORN_THREADS', 2))
+MEDIA_RESIZE_WORKERS: int = max(1, GUNICORN_THREADS - 1)
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'backend.storages.HashedFileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 
 STATIC_URL = 'static/'
@@ -207,6 +463,10 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# INFO: время хранения пользователя в кеше api.authentication
+#       (ограничивает устаревание при изменениях в обход сигналов).
+AUTH_USER_CACHE_TIMEOUT: int = 60
+
 CORS_ALLOW_CREDENTIALS = True
 
 CORS_ALLOW_HEADERS = [
@@ -5,5 +5,10 @@ DATABASES = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',  # noqa (F405)
         'ATOMIC_REQUESTS': True,
-    }
+    },
+    # INFO: реплика для теста backend.routers.ReplicaRouter.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.replica.sqlite3',  # noqa (F405)
+    },
 }
@@ -0,0 +1,44 @@
+from hashlib import sha256
+import os
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+from backend.settings import MEDIA_HASH_LENGTH, MEDIA_HASHED_PATH
+
+
+class HashedFileSystemStorage(FileSystemStorage):
+    """
+    Файловое хранилище, которое сохраняет файлы под именем из хеша
+    содержимого (с расширением из исходного имени) в MEDIA_HASHED_PATH.
+
+    Одинаковые файлы (в том числе разных моделей) хранятся один раз,
+    а файл с тем же именем никогда не изменяется. Поэтому файлы нельзя
+    удалять при замене в модели: неиспользуемые файлы удаляет команда
+    collect_media_garbage.
+    """
+
+    def get_hashed_name(self, name: str, content: File) -> str:
+        """Возвращает имя файла по хешу содержимого content."""
+        content_hash = sha256()
+        for chunk in content.chunks():
+            content_hash.update(chunk)
+        digest: str = content_hash.hexdigest()[:MEDIA_HASH_LENGTH]
+        extension: str = os.path.splitext(name)[1].lower()
+        # INFO: вложенная папка по первым символам хеша ограничивает
+        #       количество файлов в одной папке.
+        return f'{MEDIA_HASHED_PATH}{digest[:2]}/{digest}{extension}'
+
+    def save(self, name: str | None, content, max_length: int | None = None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = self.get_hashed_name(name=name, content=content)
+        if self.exists(name):
+            # INFO: файл мог стать неиспользуемым раньше: время изменения
+            #       обновляется, чтобы collect_media_garbage не удалил его
+            #       до фиксации транзакции, которая снова на него ссылается.
+            os.utime(self.path(name))
+            return name
+        return super().save(name, content, max_length=max_length)
@@ -2,8 +2,14 @@ from django.contrib import admin
 from django.urls import include, path
 
 from api.urls import urlpatterns as urlpatterns_api
+from backend.settings import MEDIA_RESIZE_PATH, MEDIA_URL
+from goods.views import resize_media
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include(urlpatterns_api)),
+    path(
+        f'{MEDIA_URL}{MEDIA_RESIZE_PATH}<int:width>x<int:height>/<path:name>',
+        resize_media,
+    ),
 ]
@@ -1,7 +1,9 @@
 from django.contrib import admin
 
 from backend.settings import ADMIN_ITEMS_PER_PAGE
+from goods.images import GOOD_IMAGE_FIELDS, schedule_good_images
 from goods.models import Category, Good, ShoppingCart, Subcategory
+from goods.search import search_goods
 
 
 @admin.register(Category)
@@ -54,24 +56,27 @@ class GoodAdmin(admin.ModelAdmin):
             - URL (slug)
             - цена (price)
             - подкатегория (subcategory)
-            - изображение (L) (image_large)
-            - изображение (M) (image_medium)
+            - изображение (исходное) (image)
             - изображение (S) (image_small)
         - list_editable (tuple) - список полей для изменения в интерфейсе:
             - наименование (name)
             - URL (slug)
             - цена (price)
             - подкатегория (subcategory)
-            - изображение (L) (image_large)
-            - изображение (M) (image_medium)
-            - изображение (S) (image_small)
+            - изображение (исходное) (image)
+        - readonly_fields (tuple) - список полей только для просмотра:
+            - изображения (L, M, S) и их ширина, высота и размер
         - search_fields (tuple) - список полей для поиска объектов:
             - наименование (name)
-            - URL (slug)
-            - цена (price)
         - list_filter (tuple) - список фильтров:
             - подкатегория (subcategory)
         - list_per_page (int) - количество объектов на одной странице
+
+    Поиск выполняется по полнотекстовому индексу наименований товаров
+    (см. goods.search), как и в эндпоинте поиска товаров API.
+
+    Изображения L, M, S формируются из исходного изображения
+    в фоновом потоке после сохранения (см. goods.images).
     """
     list_display = (
         'id',
@@ -79,8 +84,7 @@ class GoodAdmin(admin.ModelAdmin):
         'slug',
         'price',
         'subcategory',
-        'image_large',
-        'image_medium',
+        'image',
         'image_small',
     )
     list_editable = (
@@ -88,20 +92,28 @@ class GoodAdmin(admin.ModelAdmin):
         'slug',
         'price',
         'subcategory',
-        'image_large',
-        'image_medium',
-        'image_small',
+        'image',
     )
+    readonly_fields = GOOD_IMAGE_FIELDS
     search_fields = (
         'name',
-        'slug',
-        'price',
     )
     list_filter = (
         'subcategory',
     )
     list_per_page = ADMIN_ITEMS_PER_PAGE
 
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return search_goods(queryset=queryset, query=search_term), False
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if 'image' in form.changed_data:
+            schedule_good_images(good_id=obj.pk)
+        return
+
 
 @admin.register(ShoppingCart)
 class ShoppingCartAdmin(admin.ModelAdmin):
@@ -0,0 +1,254 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import logging
+import os
+from tempfile import NamedTemporaryFile
+from threading import BoundedSemaphore, Lock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from backend.settings import (
+    GOOD_IMAGE_FORMAT, GOOD_IMAGE_QUALITY, GOOD_IMAGE_SIZES,
+    GOOD_IMAGE_WORKERS,
+    MEDIA_RESIZE_FORMATS, MEDIA_RESIZE_PATH, MEDIA_RESIZE_QUALITY,
+    MEDIA_RESIZE_WORKERS,
+)
+from goods.models import Good
+
+logger = logging.getLogger(__name__)
+
+# INFO: поля Good, которые формируются из исходного изображения.
+GOOD_IMAGE_FIELDS: tuple[str, ...] = tuple(
+    f'{field_name}{suffix}'
+    for field_name in GOOD_IMAGE_SIZES
+    for suffix in ('', '_width', '_height', '_size')
+)
+
+# INFO: пул потоков создается лениво при первом обращении (в воркере,
+#       а не в главном процессе gunicorn). При одном потоке изображения
+#       формируются в порядке сохранения товаров.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock: Lock = Lock()
+
+IMAGE_FORMATS: dict[str, tuple[str, str]] = {
+    'AVIF': ('image/avif', '.avif'),
+    'JPEG': ('image/jpeg', '.jpg'),
+    'WEBP': ('image/webp', '.webp'),
+}
+
+# INFO: форматы MEDIA_RESIZE_FORMATS, которые поддерживает
+#       установленная версия Pillow (AVIF - начиная с 11.3).
+Image.init()
+MEDIA_RESIZE_AVAILABLE_FORMATS: tuple[str, ...] = tuple(
+    image_format for image_format in MEDIA_RESIZE_FORMATS
+    if image_format in Image.SAVE
+)
+
+_resize_slots: BoundedSemaphore = BoundedSemaphore(MEDIA_RESIZE_WORKERS)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Возвращает пул потоков, создавая его при первом обращении."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=GOOD_IMAGE_WORKERS,
+                thread_name_prefix='good-images',
+            )
+        return _executor
+
+
+def resize_image(
+    image: Image.Image,
+    size: tuple[int, int],
+    image_format: str = GOOD_IMAGE_FORMAT,
+    quality: int = GOOD_IMAGE_QUALITY,
+) -> tuple[bytes, int, int]:
+    """
+    Уменьшает изображение до размера size (ширина, высота) с сохранением
+    пропорций (без увеличения) и кодирует его в формат image_format:
+    WEBP, AVIF или прогрессивный JPEG с оптимизацией таблиц Хаффмана.
+
+    Возвращает содержимое файла, ширину и высоту изображения.
+    """
+    image = image.copy()
+    image.thumbnail(size, Image.Resampling.LANCZOS)
+    has_alpha: bool = (
+        image.mode in ('RGBA', 'LA', 'PA')
+        or 'transparency' in image.info
+    )
+    if image_format == 'JPEG':
+        if has_alpha:
+            # INFO: JPEG не поддерживает прозрачность: прозрачные
+            #       области заполняются белым цветом.
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        options: dict[str, any] = {'optimize': True, 'progressive': True}
+    else:
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        options = {'method': 6} if image_format == 'WEBP' else {}
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, quality=quality, **options)
+    return buffer.getvalue(), image.width, image.height
+
+
+def generate_good_images(good_id: int) -> None:
+    """
+    Формирует изображения L, M, S товара из исходного изображения
+    и сохраняет их ширину, высоту и размер в байтах. Если исходного
+    изображения нет, изображения L, M, S удаляются из товара.
+    """
+    good: Good | None = Good.objects.filter(pk=good_id).first()
+    if good is None:
+        return
+    if good.image:
+        with good.image.open('rb') as file, Image.open(file) as master:
+            # INFO: фотографии с камер хранят поворот в EXIF.
+            master = ImageOps.exif_transpose(master)
+            for field_name, size in GOOD_IMAGE_SIZES.items():
+                content, width, height = resize_image(
+                    image=master,
+                    size=size,
+                )
+                getattr(good, field_name).save(
+                    name=f'{good.slug}.{GOOD_IMAGE_FORMAT.lower()}',
+                    content=ContentFile(content),
+                    save=False,
+                )
+                setattr(good, f'{field_name}_width', width)
+                setattr(good, f'{field_name}_height', height)
+                setattr(good, f'{field_name}_size', len(content))
+    else:
+        for field_name in GOOD_IMAGE_FIELDS:
+            setattr(good, field_name, None)
+    good.save(update_fields=GOOD_IMAGE_FIELDS)
+    # INFO: если исходное изображение заменили во время формирования,
+    #       флаг остается до выполнения задачи нового изображения.
+    Good.objects.filter(pk=good_id, image=good.image.name).update(
+        image_pending=False,
+    )
+    return
+
+
+def _generate_good_images_task(good_id: int) -> None:
+    """Формирует изображения товара в фоновом потоке."""
+    try:
+        generate_good_images(good_id=good_id)
+    except Exception:
+        logger.exception(
+            'Не удалось сформировать изображения товара %s.', good_id,
+        )
+    finally:
+        # INFO: соединения с базой данных принадлежат потоку пула.
+        connections.close_all()
+    return
+
+
+def schedule_good_images(good_id: int) -> None:
+    """
+    Ставит формирование изображений товара в очередь фонового потока
+    после фиксации транзакции, в которой было сохранено исходное
+    изображение (запрос не ожидает уменьшения изображений).
+
+    Товар отмечается флагом image_pending в той же транзакции: задачи
+    очереди теряются при перезапуске воркера (max_requests, деплой),
+    и их повторяет команда generate_good_images --pending.
+    """
+    Good.objects.filter(pk=good_id).update(image_pending=True)
+    transaction.on_commit(
+        lambda: _get_executor().submit(_generate_good_images_task, good_id),
+    )
+    return
+
+
+def get_resize_format(accept: str) -> str:
+    """
+    Возвращает формат уменьшенного изображения: первый из доступных
+    форматов MEDIA_RESIZE_FORMATS, указанный в заголовке Accept,
+    иначе JPEG.
+    """
+    for image_format in MEDIA_RESIZE_AVAILABLE_FORMATS:
+        if IMAGE_FORMATS[image_format][0] in accept:
+            return image_format
+    return 'JPEG'
+
+
+def get_resized_media_name(
+    name: str,
+    size: tuple[int, int],
+    image_format: str,
+) -> str:
+    """Возвращает имя уменьшенной копии файла name в MEDIA_RESIZE_PATH."""
+    return (
+        f'{MEDIA_RESIZE_PATH}{size[0]}x{size[1]}/{name}'
+        f'{IMAGE_FORMATS[image_format][1]}'
+    )
+
+
+def create_resized_media(
+    name: str,
+    size: tuple[int, int],
+    image_format: str,
+) -> bool:
+    """
+    Сохраняет уменьшенную копию изображения name, если ее еще нет.
+
+    Одновременно формируется не более MEDIA_RESIZE_WORKERS копий:
+    если свободного слота нет, сразу возвращает False (поток воркера
+    не ожидает очереди). Если изображение name не удалось прочитать,
+    возбуждает UnidentifiedImageError.
+    """
+    path: str = default_storage.path(
+        get_resized_media_name(
+            name=name,
+            size=size,
+            image_format=image_format,
+        ),
+    )
+    if os.path.exists(path):
+        return True
+    if not _resize_slots.acquire(blocking=False):
+        return False
+    try:
+        # INFO: копия могла быть сформирована другим запросом
+        #       после проверки выше.
+        if os.path.exists(path):
+            return True
+        try:
+            with default_storage.open(name, 'rb') as file, \
+                    Image.open(file) as image:
+                content, _, _ = resize_image(
+                    image=ImageOps.exif_transpose(image),
+                    size=size,
+                    image_format=image_format,
+                    quality=MEDIA_RESIZE_QUALITY,
+                )
+        # INFO: слишком большое (DecompressionBombError)
+        #       или поврежденное изображение.
+        except (Image.DecompressionBombError, OSError) as error:
+            raise UnidentifiedImageError(
+                f'Не удалось прочитать изображение {name}.',
+            ) from error
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # INFO: файл записывается целиком под временным именем, чтобы
+        #       gateway не отдал недописанный файл, и доступен на чтение
+        #       gateway (NamedTemporaryFile создает файл с правами 0600).
+        with NamedTemporaryFile(
+            dir=os.path.dirname(path),
+            delete=False,
+        ) as temp_file:
+            temp_file.write(content)
+        os.chmod(temp_file.name, 0o644)
+        os.replace(temp_file.name, path)
+    finally:
+        _resize_slots.release()
+    return True
@@ -0,0 +1,88 @@
+# Generated by Django 5.0 on 2026-10-18 08:53
+
+import backend.settings
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Наименование')),
+                ('slug', models.SlugField(max_length=30, unique=True, verbose_name='URL')),
+                ('image', models.ImageField(blank=True, null=True, upload_to=backend.settings.set_category_image_name, verbose_name='Изображение')),
+            ],
+            options={
+                'verbose_name': 'Категория товаров',
+                'verbose_name_plural': 'Категории товаров',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Good',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Наименование')),
+                ('slug', models.SlugField(max_length=30, unique=True, verbose_name='URL')),
+                ('price', models.PositiveIntegerField(verbose_name='Цена товара')),
+                ('image_large', models.ImageField(blank=True, null=True, upload_to=backend.settings.set_good_image_l_name, verbose_name='Изображение (L)')),
+                ('image_medium', models.ImageField(blank=True, null=True, upload_to=backend.settings.set_good_image_m_name, verbose_name='Изображение (M)')),
+                ('image_small', models.ImageField(blank=True, null=True, upload_to=backend.settings.set_good_image_s_name, verbose_name='Изображение (S)')),
+            ],
+            options={
+                'verbose_name': 'Товар',
+                'verbose_name_plural': 'Товары',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='ShoppingCart',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(limit_value=1, message='Ни одного товара не было добавлено в корзину!')], verbose_name='Количество')),
+                ('good', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shopping_cart', to='goods.good', verbose_name='Товар')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shopping_cart', to=settings.AUTH_USER_MODEL, verbose_name='Пользователь')),
+            ],
+            options={
+                'verbose_name': 'Товар в корзине',
+                'verbose_name_plural': 'Товары в корзинах',
+                'ordering': ('id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Subcategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Наименование')),
+                ('slug', models.SlugField(max_length=30, unique=True, verbose_name='URL')),
+                ('image', models.ImageField(blank=True, null=True, upload_to=backend.settings.set_subcategory_image_name, verbose_name='Изображение')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='subcategory', to='goods.category', verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'Подкатегория товаров',
+                'verbose_name_plural': 'Подкатегории товаров',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='subcategory',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='good', to='goods.subcategory', verbose_name='Подкатегория'),
+        ),
+        migrations.AddConstraint(
+            model_name='shoppingcart',
+            constraint=models.UniqueConstraint(fields=('user', 'good'), name='unique_user_good'),
+        ),
+    ]
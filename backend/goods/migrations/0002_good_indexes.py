@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goods', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='good',
+            index=models.Index(fields=['subcategory', 'name'], name='good_subcategory_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='good',
+            index=models.Index(fields=['subcategory', 'price'], name='good_subcategory_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='good',
+            index=models.Index(fields=['price', 'name'], name='good_price_name_idx'),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 5.0 on 2026-10-18 09:02
+
+import backend.settings
+from django.db import migrations, models
+
+
+def set_image_from_image_large(apps, schema_editor):
+    """
+    Делает загруженные ранее изображения (L) исходными изображениями
+    товаров, чтобы сформировать из них изображения L, M, S командой
+    generate_good_images.
+    """
+    Good = apps.get_model('goods', 'Good')
+    Good.objects.filter(image__isnull=True).exclude(
+        image_large__isnull=True,
+    ).exclude(image_large='').update(image=models.F('image_large'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goods', '0002_good_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='good',
+            name='image',
+            field=models.ImageField(blank=True, null=True, upload_to=backend.settings.set_good_image_name, verbose_name='Изображение (исходное)'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_large_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Высота изображения (L)'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_large_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Размер изображения (L), байт'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_large_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ширина изображения (L)'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_medium_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Высота изображения (M)'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_medium_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Размер изображения (M), байт'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_medium_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ширина изображения (M)'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_small_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Высота изображения (S)'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_small_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Размер изображения (S), байт'),
+        ),
+        migrations.AddField(
+            model_name='good',
+            name='image_small_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ширина изображения (S)'),
+        ),
+        migrations.AlterField(
+            model_name='good',
+            name='image_large',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to=backend.settings.set_good_image_l_name, verbose_name='Изображение (L)'),
+        ),
+        migrations.AlterField(
+            model_name='good',
+            name='image_medium',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to=backend.settings.set_good_image_m_name, verbose_name='Изображение (M)'),
+        ),
+        migrations.AlterField(
+            model_name='good',
+            name='image_small',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to=backend.settings.set_good_image_s_name, verbose_name='Изображение (S)'),
+        ),
+        migrations.RunPython(
+            set_image_from_image_large,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-18 09:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goods', '0003_good_image_master'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='good',
+            name='image_pending',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Изображения ожидают формирования'),
+        ),
+    ]
@@ -0,0 +1,90 @@
+from django.db import migrations
+
+# INFO: выражение индекса good_name_search_idx должно совпадать
+#       с SearchVector в goods.search (словарь SEARCH_CONFIG).
+SEARCH_INDEX_SQL: dict[str, tuple[str, ...]] = {
+    'postgresql': (
+        'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+        (
+            'CREATE INDEX IF NOT EXISTS good_name_search_idx ON goods_good '
+            "USING gin (to_tsvector('russian'::regconfig, "
+            "COALESCE(name, ''::text)))"
+        ),
+        (
+            'CREATE INDEX IF NOT EXISTS good_name_trgm_idx ON goods_good '
+            'USING gin (name gin_trgm_ops)'
+        ),
+    ),
+    'sqlite': (
+        (
+            'CREATE VIRTUAL TABLE IF NOT EXISTS goods_good_fts USING fts5('
+            "name, content='goods_good', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        ),
+        (
+            'CREATE TRIGGER IF NOT EXISTS goods_good_fts_insert '
+            'AFTER INSERT ON goods_good '
+            'BEGIN INSERT INTO goods_good_fts(rowid, name) '
+            'VALUES (new.id, new.name); END'
+        ),
+        (
+            'CREATE TRIGGER IF NOT EXISTS goods_good_fts_delete '
+            'AFTER DELETE ON goods_good '
+            'BEGIN INSERT INTO goods_good_fts(goods_good_fts, rowid, name) '
+            "VALUES ('delete', old.id, old.name); END"
+        ),
+        (
+            'CREATE TRIGGER IF NOT EXISTS goods_good_fts_update '
+            'AFTER UPDATE ON goods_good '
+            'BEGIN INSERT INTO goods_good_fts(goods_good_fts, rowid, name) '
+            "VALUES ('delete', old.id, old.name); "
+            'INSERT INTO goods_good_fts(rowid, name) '
+            'VALUES (new.id, new.name); END'
+        ),
+        "INSERT INTO goods_good_fts(goods_good_fts) VALUES ('rebuild')",
+    ),
+}
+
+DROP_SEARCH_INDEX_SQL: dict[str, tuple[str, ...]] = {
+    'postgresql': (
+        'DROP INDEX IF EXISTS good_name_trgm_idx',
+        'DROP INDEX IF EXISTS good_name_search_idx',
+    ),
+    'sqlite': (
+        'DROP TRIGGER IF EXISTS goods_good_fts_update',
+        'DROP TRIGGER IF EXISTS goods_good_fts_delete',
+        'DROP TRIGGER IF EXISTS goods_good_fts_insert',
+        'DROP TABLE IF EXISTS goods_good_fts',
+    ),
+}
+
+
+def run_vendor_sql(statements: dict[str, tuple[str, ...]]):
+    """
+    Возвращает функцию RunPython, которая выполняет SQL statements
+    для СУБД текущего соединения (для остальных СУБД - ничего).
+    """
+    def run(apps, schema_editor) -> None:
+        for statement in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(statement)
+        return
+    return run
+
+
+class Migration(migrations.Migration):
+    """
+    Полнотекстовый индекс наименований товаров:
+        - PostgreSQL: GIN индексы tsvector и триграмм (pg_trgm)
+        - SQLite: FTS5 таблица, синхронизируемая триггерами
+    """
+
+    dependencies = [
+        ('goods', '0004_good_image_pending'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql(SEARCH_INDEX_SQL),
+            run_vendor_sql(DROP_SEARCH_INDEX_SQL),
+        ),
+    ]
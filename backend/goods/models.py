@@ -6,7 +6,7 @@ from backend.settings import (
     CATEGORY_NAME_MAX_LEN, CATEGORY_SLUG_MAX_LEN,
     SHOPPING_CART_MIN_AMOUNT,
     SUBCATEGORY_NAME_MAX_LEN, SUBCATEGORY_SLUG_MAX_LEN,
-    set_category_image_name,
+    set_category_image_name, set_good_image_name,
     set_good_image_l_name, set_good_image_m_name, set_good_image_s_name,
     set_subcategory_image_name,
 )
@@ -100,29 +100,116 @@ class Good(models.Model):
         related_name='good',
         on_delete=models.PROTECT,
     )
+    image = models.ImageField(
+        verbose_name='Изображение (исходное)',
+        upload_to=set_good_image_name,
+        blank=True,
+        null=True,
+    )
+    # INFO: изображения L, M, S ожидают формирования из image; флаг
+    #       сохраняется в базе данных, чтобы задачи, потерянные при
+    #       перезапуске воркера, выполнила команда generate_good_images.
+    image_pending = models.BooleanField(
+        verbose_name='Изображения ожидают формирования',
+        default=False,
+        editable=False,
+    )
+    # INFO: изображения L, M, S и их размеры формируются из image
+    #       (см. goods.images).
     image_large = models.ImageField(
         verbose_name='Изображение (L)',
         upload_to=set_good_image_l_name,
-        # TODO: удалить blank и null при релизе.
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_large_width = models.PositiveIntegerField(
+        verbose_name='Ширина изображения (L)',
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_large_height = models.PositiveIntegerField(
+        verbose_name='Высота изображения (L)',
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_large_size = models.PositiveIntegerField(
+        verbose_name='Размер изображения (L), байт',
+        editable=False,
         blank=True,
         null=True,
     )
     image_medium = models.ImageField(
         verbose_name='Изображение (M)',
         upload_to=set_good_image_m_name,
-        # TODO: удалить blank и null при релизе.
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_medium_width = models.PositiveIntegerField(
+        verbose_name='Ширина изображения (M)',
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_medium_height = models.PositiveIntegerField(
+        verbose_name='Высота изображения (M)',
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_medium_size = models.PositiveIntegerField(
+        verbose_name='Размер изображения (M), байт',
+        editable=False,
         blank=True,
         null=True,
     )
     image_small = models.ImageField(
         verbose_name='Изображение (S)',
         upload_to=set_good_image_s_name,
-        # TODO: удалить blank и null при релизе.
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_small_width = models.PositiveIntegerField(
+        verbose_name='Ширина изображения (S)',
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_small_height = models.PositiveIntegerField(
+        verbose_name='Высота изображения (S)',
+        editable=False,
+        blank=True,
+        null=True,
+    )
+    image_small_size = models.PositiveIntegerField(
+        verbose_name='Размер изображения (S), байт',
+        editable=False,
         blank=True,
         null=True,
     )
 
     class Meta:
+        # INFO: индексы под фильтрацию и сортировку GoodViewSet:
+        #       по подкатегории (с сортировкой по наименованию или цене)
+        #       и по диапазону цен (с сортировкой по цене).
+        indexes = [
+            models.Index(
+                fields=('subcategory', 'name'),
+                name='good_subcategory_name_idx',
+            ),
+            models.Index(
+                fields=('subcategory', 'price'),
+                name='good_subcategory_price_idx',
+            ),
+            models.Index(
+                fields=('price', 'name'),
+                name='good_price_name_idx',
+            ),
+        ]
         ordering = ('name',)
         verbose_name = 'Товар'
         verbose_name_plural = 'Товары'
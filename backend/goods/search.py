@@ -0,0 +1,69 @@
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, TrigramSimilarity,
+)
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+# INFO: словарь PostgreSQL для полнотекстового поиска по наименованиям.
+#       Выражение SearchVector должно совпадать с выражением индекса
+#       good_name_search_idx (миграция 0005_good_name_search_index),
+#       иначе индекс не будет использован.
+SEARCH_CONFIG: str = 'russian'
+
+
+def get_fts_query(query: str) -> str:
+    """
+    Формирует запрос FTS5 из слов строки поиска: каждое слово
+    ищется по префиксу, все слова должны присутствовать.
+    """
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', query))
+
+
+def search_goods(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Фильтрует queryset товаров по строке поиска query с помощью
+    полнотекстового индекса и сортирует их по релевантности, а товары
+    с равной релевантностью - в порядке сортировки queryset
+    (по умолчанию по наименованию).
+
+    Для СУБД без поддерживаемого индекса используется icontains.
+    """
+    vendor: str = connections[queryset.db].vendor
+    ordering: tuple[str, ...] = queryset.query.order_by or ('name',)
+    if vendor == 'postgresql':
+        search_query = SearchQuery(
+            query,
+            config=SEARCH_CONFIG,
+            search_type='websearch',
+        )
+        return queryset.annotate(
+            search=SearchVector('name', config=SEARCH_CONFIG),
+            rank=(
+                SearchRank(
+                    SearchVector('name', config=SEARCH_CONFIG),
+                    search_query,
+                )
+                + TrigramSimilarity('name', query)
+            ),
+        ).filter(
+            Q(search=search_query) | Q(name__trigram_similar=query),
+        ).order_by('-rank', *ordering)
+    fts_query: str = get_fts_query(query=query)
+    if vendor == 'sqlite' and fts_query:
+        # INFO: таблица FTS5 присоединяется к товарам, чтобы MATCH
+        #       выполнялся один раз на запрос, а rank брался из той же
+        #       строки индекса (подзапрос в annotate выполнялся бы
+        #       для каждого товара). Выражение ORM для соединения
+        #       с виртуальной таблицей в Django отсутствует.
+        return queryset.extra(
+            tables=['goods_good_fts'],
+            where=[
+                'goods_good_fts.rowid = goods_good.id',
+                'goods_good_fts MATCH %s',
+            ],
+            params=[fts_query],
+            select={'rank': 'goods_good_fts.rank'},
+        ).order_by('rank', *ordering)
+    return queryset.filter(name__icontains=query)
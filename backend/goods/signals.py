@@ -0,0 +1,66 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.routers import pin_primary
+from goods.models import Category, Good, Subcategory
+
+CATALOG_VERSION_CACHE_KEY: str = 'catalog:version'
+
+
+def get_catalog_version() -> float:
+    """
+    Возвращает версию каталога: время (timestamp) последнего изменения
+    объектов Category, Subcategory или Good.
+
+    Если версии нет в кеше (например, после его очистки),
+    текущее время становится новой версией каталога.
+    """
+    version: float | None = cache.get(CATALOG_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_CACHE_KEY, time.time(), None)
+        version = cache.get(CATALOG_VERSION_CACHE_KEY, time.time())
+    return version
+
+
+async def aget_catalog_version() -> float:
+    """Асинхронная версия get_catalog_version."""
+    version: float | None = await cache.aget(CATALOG_VERSION_CACHE_KEY)
+    if version is None:
+        await cache.aadd(CATALOG_VERSION_CACHE_KEY, time.time(), None)
+        version = await cache.aget(CATALOG_VERSION_CACHE_KEY, time.time())
+    return version
+
+
+def bump_catalog_version() -> float:
+    """Обновляет версию каталога, делая устаревшими все его кеши."""
+    version: float = time.time()
+    cache.set(CATALOG_VERSION_CACHE_KEY, version, None)
+    return version
+
+
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Good)
+@receiver(post_delete, sender=Subcategory)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Good)
+@receiver(post_save, sender=Subcategory)
+def catalog_changed(sender, **kwargs) -> None:
+    """
+    Обновляет версию каталога при изменении его объектов.
+
+    Версия обновляется сразу и повторно после фиксации транзакции:
+    иначе ответ, вычисленный другим запросом по еще не измененным
+    данным, мог бы попасть в кеш под новой версией.
+
+    По той же причине каталог временно читается из основной базы
+    данных, а не из реплик, которые могут отставать.
+    """
+    pin_primary()
+    bump_catalog_version()
+    transaction.on_commit(pin_primary)
+    transaction.on_commit(bump_catalog_version)
+    return
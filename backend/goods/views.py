@@ -0,0 +1,66 @@
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse
+from django.views.decorators.http import require_safe
+from PIL import UnidentifiedImageError
+from rest_framework import status
+
+from backend.settings import MEDIA_RESIZE_PATH, MEDIA_RESIZE_SIZES
+from goods.images import (
+    IMAGE_FORMATS,
+    create_resized_media, get_resize_format, get_resized_media_name,
+)
+
+
+# INFO: представление не обращается к базе данных: соединение
+#       для транзакции ATOMIC_REQUESTS не открывается.
+@transaction.non_atomic_requests
+@require_safe
+def resize_media(request, width: int, height: int, name: str):
+    """
+    Функция, которая возвращает уменьшенную до размера width x height
+    копию изображения name из MEDIA_ROOT в формате, выбранном
+    по заголовку Accept (AVIF, WEBP или JPEG).
+
+    Копия сохраняется на диск при первом запросе, последующие
+    запросы gateway обслуживает сам, не обращаясь к серверу.
+    Если все слоты уменьшения изображений заняты, возвращается 503,
+    если изображение не удалось прочитать - 404.
+    """
+    size: tuple[int, int] = (width, height)
+    if size not in MEDIA_RESIZE_SIZES or name.startswith(MEDIA_RESIZE_PATH):
+        raise Http404
+    image_format: str = get_resize_format(
+        accept=request.headers.get('Accept', ''),
+    )
+    try:
+        if not default_storage.exists(name):
+            raise Http404
+        if not create_resized_media(
+            name=name,
+            size=size,
+            image_format=image_format,
+        ):
+            return HttpResponse(
+                content='Сервер занят, повторите запрос позже.',
+                content_type='text/plain; charset=utf-8',
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': '1'},
+            )
+    except (SuspiciousFileOperation, UnidentifiedImageError):
+        raise Http404
+    response = FileResponse(
+        default_storage.open(
+            get_resized_media_name(
+                name=name,
+                size=size,
+                image_format=image_format,
+            ),
+            'rb',
+        ),
+        content_type=IMAGE_FORMATS[image_format][0],
+    )
+    # INFO: заголовки Cache-Control и Vary задает gateway (nginx.conf)
+    #       одинаково для этого ответа и для сохраненных на диск копий.
+    return response
@@ -0,0 +1,130 @@
+"""
+Настройки gunicorn (загружаются автоматически из рабочей директории).
+
+Любую настройку можно переопределить переменными окружения
+GUNICORN_* или аргументами командной строки gunicorn.
+"""
+
+import os
+
+SERVER_WORKER: str = os.getenv('SERVER_WORKER', 'wsgi')
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+# INFO: бэкенды кеша Django, данные которых видны только одному процессу.
+PROCESS_LOCAL_CACHE_BACKENDS: tuple[str, ...] = (
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+
+
+def get_available_cpus() -> int:
+    """
+    Возвращает количество доступных процессу ядер с учетом
+    привязки к ядрам (cpuset) и квоты cgroup v2 контейнера.
+    """
+    try:
+        cpus: int = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as file:
+            quota, period = file.read().split()
+        if quota != 'max':
+            cpus = min(cpus, max(int(int(quota) / int(period)), 1))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+"""Server settings."""
+
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+
+if SERVER_WORKER == 'asgi':
+    wsgi_app = 'backend.asgi:application'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    wsgi_app = 'backend.wsgi:application'
+    # INFO: при threads > 1 gunicorn использует потоковые воркеры gthread.
+    worker_class = 'sync'
+
+# INFO: рекомендация gunicorn - (2 x ядра) + 1 воркеров.
+workers = int(os.getenv('GUNICORN_WORKERS', get_available_cpus() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 2))
+
+# INFO: приложение загружается до создания воркеров, которые разделяют
+#       его память (copy-on-write) и не импортируют Django повторно.
+preload_app = True
+
+# INFO: воркеры перезапускаются после max_requests запросов (со случайным
+#       разбросом, чтобы не перезапускаться одновременно).
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+accesslog = '-'
+errorlog = '-'
+
+
+"""Server hooks."""
+
+
+def on_starting(server) -> None:
+    """
+    Не запускает несколько воркеров с кешем внутри процесса
+    (LocMemCache): изменение каталога или пользователя сбросило бы
+    кеш только в обработавшем его воркере, а остальные отдавали бы
+    устаревшие данные (см. CACHE_BACKEND в settings.py).
+    """
+    from django.conf import settings
+    backend: str = settings.CACHES['default']['BACKEND']
+    if server.cfg.workers > 1 and backend in PROCESS_LOCAL_CACHE_BACKENDS:
+        raise RuntimeError(
+            f'Кеш {backend} не является общим для {server.cfg.workers} '
+            'воркеров: укажите CACHE_BACKEND (Redis или Memcached) '
+            'или GUNICORN_WORKERS=1.'
+        )
+    return
+
+
+def pre_fork(server, worker) -> None:
+    """
+    Закрывает соединения с базой данных главного процесса,
+    чтобы воркеры не использовали их совместно (соединения пулов
+    backend.postgresql_pool также закрываются).
+    """
+    from django.db import connections
+
+    from backend.postgresql_pool.pool import close_pools
+    connections.close_all()
+    close_pools()
+    return
+
+
+def post_fork(server, worker) -> None:
+    """
+    Прогревает воркер до приема запросов: импортирует URLconf
+    (представления и сериализаторы) и открывает DB_POOL_MIN_SIZE
+    соединений пула backend.postgresql_pool (при DB_POOL=True).
+
+    Соединения Django без пула не открываются: они привязаны к потоку,
+    а запросы обслуживают потоки gthread (или поток sync_to_async
+    uvicorn), а не главный поток воркера.
+    """
+    from django.db import DatabaseError
+    from django.urls import get_resolver
+
+    from backend.postgresql_pool.pool import fill_pools
+    get_resolver().url_patterns
+    import api.v1.serializers  # noqa (F401)
+    try:
+        fill_pools()
+    except DatabaseError as error:
+        server.log.warning(
+            'Воркер %s: база данных недоступна (%s).', worker.pid, error,
+        )
+    return